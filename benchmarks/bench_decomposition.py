@@ -0,0 +1,38 @@
+"""
+Measure how partition-and-merge solving scales with the number of worker processes.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_decomposition.py [n_cities] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from logic.decomposition import decomposition
+
+
+def main():
+    n_cities = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    points = np.random.default_rng(42).random((n_cities, 2)) * 1000
+
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        result = decomposition(points, workers=workers, seed=0)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or result.timings["solve"]
+        print(
+            f"n={n_cities} workers={workers:>2} clusters={result.n_clusters} total={elapsed:7.2f} s  "
+            f"solve={result.timings['solve']:7.2f} s  repair={result.timings.get('repair', 0.0):6.2f} s  "
+            f"solve speedup={baseline / result.timings['solve']:5.2f}x  length={result.length:.0f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
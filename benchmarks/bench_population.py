@@ -0,0 +1,53 @@
+"""
+Benchmark batched population scoring against looping calculate_total_distance.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/bench_population.py
+"""
+
+import time
+
+import numpy as np
+
+from logic.cities import calculate_total_distance
+from logic.distance_matrix import build_distance_matrix
+from logic.population import score_population
+
+
+def time_call(function, *args, **kwargs):
+    """Return (result, elapsed seconds) of a single call."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def loop_scores(cities, tours):
+    """Score every tour by building its closed city path and calling calculate_total_distance."""
+    scores = []
+    for tour in tours:
+        path = [cities[i] for i in tour]
+        path.append(path[0])
+        scores.append(calculate_total_distance(path))
+    return np.array(scores)
+
+
+def main():
+    rng = np.random.default_rng(42)
+    for n_cities, population in [(15, 10_000), (100, 10_000), (1000, 1_000)]:
+        cities = [tuple(point) for point in rng.integers(0, 1000, size=(n_cities, 2)).tolist()]
+        tours = np.argsort(rng.random((population, n_cities)), axis=1)
+        matrix = build_distance_matrix(cities)
+
+        looped, loop_time = time_call(loop_scores, cities, tours)
+        batched, batch_time = time_call(score_population, tours, matrix)
+        assert np.allclose(looped, batched)
+
+        print(
+            f"n={n_cities:>5} population={population:>6} "
+            f"loop={loop_time * 1000:9.1f} ms  batch={batch_time * 1000:8.1f} ms  "
+            f"speedup={loop_time / batch_time:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
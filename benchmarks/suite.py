@@ -0,0 +1,386 @@
+"""
+Benchmark the logic.cities primitives and every solver over a fixed instance matrix.
+
+Each run records wall time, peak traced memory, tour length, the gap to the
+known optimum and, for solvers that support a target, the time to get
+within TARGET_GAP of it, and writes the results as JSON. The compare command
+flags runs that got slower or worse than a stored baseline.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/suite.py run --scale small --output results.json
+    PYTHONPATH=src python benchmarks/suite.py compare baseline.json results.json
+
+Scales: small (bundled 5-15 city sets and 200-city sets), medium (adds 1k
+and 10k cities) and large (adds 100k cities). Pass --tsplib DIR to include
+TSPLIB files from DIR whose optimum is listed in KNOWN_OPTIMA.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from data.cities import cities_locations
+from data.instances import Instance, load_instance
+from logic.annealing import simulated_annealing
+from logic.ant_colony import ant_colony
+from logic.branch_and_bound import branch_and_bound
+from logic.cities import calculate_distance, calculate_total_distance
+from logic.construction import greedy_edge_tour, nearest_neighbor_tour, spatial_nearest_neighbor_tour
+from logic.decomposition import decomposition
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.genetic import genetic_algorithm
+from logic.held_karp import held_karp
+from logic.lin_kernighan import lin_kernighan
+from logic.local_search import local_search
+from logic.population import score_population
+
+SEED = 1234
+DENSE_LIMIT = 5000  # largest instance given a dense distance matrix
+TARGET_GAP = 0.02  # time-to-target is measured to within this gap of the optimum
+SCALES = {
+    "small": [200],
+    "medium": [200, 1_000, 10_000],
+    "large": [200, 1_000, 10_000, 100_000],
+}
+KNOWN_OPTIMA = {
+    "burma14": 3323,
+    "ulysses16": 6859,
+    "ulysses22": 7013,
+    "att48": 10628,
+    "eil51": 426,
+    "berlin52": 7542,
+    "st70": 675,
+    "eil76": 538,
+    "pr76": 108159,
+    "kroA100": 21282,
+    "eil101": 629,
+    "lin105": 14379,
+    "ch130": 6110,
+    "ch150": 6528,
+    "a280": 2579,
+    "pcb442": 50778,
+    "rat783": 8806,
+    "pr1002": 259045,
+}
+
+
+def uniform_instance(n_cities: int, rng: np.random.Generator) -> Instance:
+    """Cities drawn uniformly from a 1000 x 1000 square."""
+    return Instance(f"uniform-{n_cities}", coordinates=rng.random((n_cities, 2)) * 1000)
+
+
+def clustered_instance(n_cities: int, rng: np.random.Generator) -> Instance:
+    """Cities drawn from Gaussian clusters around random centres, one cluster per ~100 cities."""
+    n_clusters = max(2, n_cities // 100)
+    centres = rng.random((n_clusters, 2)) * 1000
+    members = rng.integers(0, n_clusters, size=n_cities)
+    points = centres[members] + rng.normal(scale=1000 / (4 * np.sqrt(n_clusters)), size=(n_cities, 2))
+    return Instance(f"clustered-{n_cities}", coordinates=points)
+
+
+def build_instances(scale: str, tsplib_dir: str = None) -> list[tuple[Instance, float]]:
+    """
+    Return the benchmark instances with their optimal lengths (None when unknown).
+
+    Bundled sets are solved exactly with Held-Karp; TSPLIB files use
+    KNOWN_OPTIMA; generated sets have no reference optimum.
+    """
+    instances = []
+    for n_cities in sorted(cities_locations):
+        instance = load_instance(f"bundled:{n_cities}")
+        instances.append((instance, held_karp(instance.distance_matrix())[1]))
+
+    if tsplib_dir is not None:
+        for path in sorted(Path(tsplib_dir).glob("*.tsp")):
+            if path.stem in KNOWN_OPTIMA:
+                instances.append((load_instance(path), KNOWN_OPTIMA[path.stem]))
+
+    rng = np.random.default_rng(SEED)
+    for n_cities in SCALES[scale]:
+        instances.append((uniform_instance(n_cities, rng), None))
+        instances.append((clustered_instance(n_cities, rng), None))
+    return instances
+
+
+class Context:
+    """Per-instance data shared by the solver runners, built lazily."""
+
+    def __init__(self, instance: Instance, optimum: float = None):
+        self.instance = instance
+        self.optimum = optimum
+        self.n = len(instance)
+        self.coordinates = np.asarray(instance.coordinates)
+        self._matrix = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            self._matrix = self.instance.distance_matrix()
+        return self._matrix
+
+    def tour_length(self, tour: np.ndarray) -> float:
+        """Closed tour length in the instance's own metric."""
+        if self.n <= DENSE_LIMIT or self.instance.edge_weight_type != "EUCLIDEAN":
+            return path_length(tour, self.matrix, closed=True)
+        points = self.coordinates[tour]
+        return float(np.hypot(*(points - np.roll(points, -1, axis=0)).T).sum())
+
+    def distances(self) -> dict:
+        """Keyword arguments giving a solver a matrix or, for large instances, coordinates."""
+        if self.n <= DENSE_LIMIT:
+            return {"distance_matrix": self.matrix}
+        return {"coordinates": self.coordinates}
+
+    @property
+    def target_length(self) -> float:
+        return None if self.optimum is None else self.optimum * (1 + TARGET_GAP)
+
+
+def _nearest_neighbor_local_search(context: Context) -> np.ndarray:
+    start = spatial_nearest_neighbor_tour(context.coordinates)
+    return local_search(start, **context.distances())[0]
+
+
+def _greedy_edge_local_search(context: Context) -> np.ndarray:
+    start = greedy_edge_tour(context.coordinates)
+    return local_search(start, **context.distances())[0]
+
+
+def _chained_lin_kernighan(context: Context):
+    start = greedy_edge_tour(context.coordinates)
+    return lin_kernighan(start, **context.distances(), kicks=min(context.n, 1000),
+                         target_length=context.target_length, seed=SEED)
+
+
+# name -> (largest instance the solver is run on, runner returning a closed tour or a result with .tour)
+SOLVERS = {
+    "held_karp": (15, lambda context: held_karp(context.matrix)[0]),
+    "branch_and_bound": (12, lambda context: branch_and_bound(context.matrix, time_limit=10.0).tour),
+    "nearest_neighbor": (DENSE_LIMIT, lambda context: nearest_neighbor_tour(context.matrix)),
+    "spatial_nearest_neighbor": (None, lambda context: spatial_nearest_neighbor_tour(context.coordinates)),
+    "greedy_edge": (None, lambda context: greedy_edge_tour(context.coordinates)),
+    "nearest_neighbor+local_search": (None, _nearest_neighbor_local_search),
+    "greedy_edge+local_search": (None, _greedy_edge_local_search),
+    "chained_lin_kernighan": (None, _chained_lin_kernighan),
+    "decomposition": (None, lambda context: decomposition(context.coordinates, seed=SEED)),
+    "genetic": (200, lambda context: genetic_algorithm(
+        context.matrix, population_size=60, generations=100, seed=SEED).tour),
+    "ant_colony": (1_000, lambda context: ant_colony(coordinates=context.coordinates, iterations=50, seed=SEED).tour),
+    "simulated_annealing": (1_000, lambda context: simulated_annealing(context.matrix, steps=5_000, seed=SEED).tour),
+}
+
+
+def _primitive_cases(context: Context) -> dict:
+    """Callables timing the logic.cities primitives and their array replacements on one instance."""
+    cities = context.instance.cities
+    path = cities + cities[:1]
+    rng = np.random.default_rng(SEED)
+    tours = np.argsort(rng.random((max(1, 100_000 // context.n), context.n)), axis=1)
+    cases = {
+        "calculate_distance": lambda: [calculate_distance(a, b) for a, b in zip(path, path[1:])],
+        "calculate_total_distance": lambda: calculate_total_distance(path),
+    }
+    if context.n <= DENSE_LIMIT:
+        cases["build_distance_matrix"] = lambda: build_distance_matrix(cities)
+        cases["score_population"] = lambda: score_population(tours, context.matrix)
+    return cases
+
+
+def measure(function, repeat: int, trace_memory: bool) -> tuple:
+    """
+    Return (result, best wall time in seconds, peak traced bytes or None).
+
+    Memory is traced in a separate call, so tracing overhead never shows up in the timings.
+    """
+    best = np.inf
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+
+def run_suite(scale: str = "small", solvers=None, repeat: int = 1, trace_memory: bool = True,
+              tsplib_dir: str = None, log=print) -> list[dict]:
+    """
+    Run every selected solver and primitive on every instance of a scale.
+
+    Parameters:
+    - scale (str): Key of SCALES (default is 'small').
+    - solvers (list[str]): Names from SOLVERS to run; all of them when None.
+    - repeat (int): Timed runs per case; the fastest is reported (default is 1).
+    - trace_memory (bool): Measure peak memory with tracemalloc in one extra run (default is True).
+    - tsplib_dir (str): Directory with TSPLIB files to include.
+    - log: Called with one line of text per finished case.
+
+    Returns:
+    list[dict]: One record per (instance, case).
+    """
+    selected = list(SOLVERS) if solvers is None else solvers
+    unknown = set(selected) - set(SOLVERS)
+    if unknown:
+        raise ValueError(f"Unknown solvers {sorted(unknown)}, expected some of {sorted(SOLVERS)}")
+
+    records = []
+    for instance, optimum in build_instances(scale, tsplib_dir):
+        context = Context(instance, optimum)
+        cases = [(name, function, False) for name, function in _primitive_cases(context).items()]
+        for name in selected:
+            limit, runner = SOLVERS[name]
+            if limit is None or context.n <= limit:
+                cases.append((name, lambda runner=runner: runner(context), True))
+
+        for name, function, is_solver in cases:
+            result, seconds, peak = measure(function, repeat, trace_memory)
+            record = {
+                "instance": instance.name,
+                "n": context.n,
+                "case": name,
+                "time": seconds,
+                "peak_memory": peak,
+                "length": None,
+                "optimum": optimum,
+                "gap": None,
+                "time_to_target": None,
+            }
+            if is_solver:
+                tour = np.asarray(getattr(result, "tour", result))
+                record["time_to_target"] = getattr(result, "time_to_target", None)
+                if np.sort(tour).tolist() != list(range(context.n)):
+                    raise AssertionError(f"{name} returned an invalid tour on {instance.name}")
+                record["length"] = context.tour_length(tour)
+                if optimum:
+                    record["gap"] = record["length"] / optimum - 1.0
+            records.append(record)
+            log(format_record(record))
+    return records
+
+
+def format_record(record: dict) -> str:
+    memory = "-" if record["peak_memory"] is None else f"{record['peak_memory'] / 2**20:8.1f} MiB"
+    length = "" if record["length"] is None else f"length={record['length']:.1f}"
+    gap = "" if record["gap"] is None else f"gap={record['gap'] * 100:.2f}%"
+    target = "" if record.get("time_to_target") is None else f"to-target={record['time_to_target'] * 1000:.1f} ms"
+    return (f"{record['instance']:>16} {record['case']:>30} "
+            f"{record['time'] * 1000:10.1f} ms {memory:>12}  {length} {gap} {target}")
+
+
+def environment() -> dict:
+    """Describe the machine and code a result file was produced with."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "commit": commit,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(baseline: list[dict], current: list[dict], time_tolerance: float = 0.25,
+            quality_tolerance: float = 0.001, min_time: float = 0.005) -> list[str]:
+    """
+    Return one message per case that regressed against the baseline.
+
+    Parameters:
+    - baseline (list[dict]): Records of the reference run.
+    - current (list[dict]): Records of the run being checked.
+    - time_tolerance (float): Allowed relative slowdown (default is 0.25).
+    - quality_tolerance (float): Allowed relative increase in tour length (default is 0.001).
+    - min_time (float): Cases faster than this in both runs are too noisy to compare (default is 5 ms).
+
+    Returns:
+    list[str]: Regression messages; empty when nothing regressed.
+    """
+    reference = {(record["instance"], record["case"]): record for record in baseline}
+    regressions = []
+    for record in current:
+        key = (record["instance"], record["case"])
+        if key not in reference:
+            continue
+        old = reference[key]
+        label = f"{key[1]} on {key[0]}"
+        if max(old["time"], record["time"]) >= min_time and record["time"] > old["time"] * (1 + time_tolerance):
+            regressions.append(
+                f"{label}: time {old['time'] * 1000:.1f} ms -> {record['time'] * 1000:.1f} ms "
+                f"({record['time'] / old['time'] - 1:+.0%})"
+            )
+        if old["length"] is not None and record["length"] is not None \
+                and record["length"] > old["length"] * (1 + quality_tolerance):
+            regressions.append(
+                f"{label}: length {old['length']:.1f} -> {record['length']:.1f} "
+                f"({record['length'] / old['length'] - 1:+.2%})"
+            )
+    return regressions
+
+
+def load_results(path) -> list[dict]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)["results"]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmark matrix")
+    run.add_argument("--scale", choices=sorted(SCALES), default="small")
+    run.add_argument("--solvers", help="Comma-separated subset of: " + ", ".join(SOLVERS))
+    run.add_argument("--repeat", type=int, default=1)
+    run.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run")
+    run.add_argument("--tsplib", help="Directory with TSPLIB .tsp files")
+    run.add_argument("--output", help="Write results as JSON to this file")
+    run.add_argument("--baseline", help="Compare against this result file when done")
+
+    check = commands.add_parser("compare", help="Flag regressions of a result file against a baseline")
+    check.add_argument("baseline")
+    check.add_argument("current")
+
+    for command in (run, check):
+        command.add_argument("--time-tolerance", type=float, default=0.25)
+        command.add_argument("--quality-tolerance", type=float, default=0.001)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        solvers = args.solvers.split(",") if args.solvers else None
+        results = run_suite(args.scale, solvers, args.repeat, not args.no_memory, args.tsplib)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as handle:
+                json.dump({"environment": environment(), "scale": args.scale, "results": results}, handle, indent=1)
+        if not args.baseline:
+            return 0
+        baseline, current = load_results(args.baseline), results
+    else:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+
+    regressions = compare(baseline, current, args.time_tolerance, args.quality_tolerance)
+    for message in regressions:
+        print("REGRESSION", message)
+    print(f"{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
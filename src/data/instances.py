@@ -0,0 +1,273 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from data.cities import cities_locations
+from data.tsplib import COORDINATE_TYPES, read_tsplib, tsplib_distance_matrix
+from logic.distance_matrix import build_distance_matrix
+from logic.model import CitySet
+
+EUCLIDEAN = "EUCLIDEAN"  # exact float distances, the calculate_distance semantics
+CACHE_ENV_VAR = "TSP_CACHE_DIR"
+DEFAULT_CHUNK_LINES = 1_000_000
+
+
+@dataclass
+class Instance:
+    """
+    A TSP instance, whatever source it was loaded from.
+
+    Attributes:
+    - name (str): Instance name.
+    - coordinates (np.ndarray): (n, 2) city coordinates, possibly a read-only memory map.
+    - edge_weight_type (str): EUCLIDEAN for exact distances or a TSPLIB type such as EUC_2D, GEO or EXPLICIT.
+    - matrix (np.ndarray): Explicit distance matrix when the source provides one.
+    - optimal_tour (np.ndarray): Known optimal tour as 0-based city indices, if any.
+    """
+
+    name: str
+    coordinates: np.ndarray = None
+    edge_weight_type: str = EUCLIDEAN
+    matrix: np.ndarray = None
+    optimal_tour: np.ndarray = None
+
+    def __len__(self) -> int:
+        if self.coordinates is not None:
+            return self.coordinates.shape[0]
+        return 0 if self.matrix is None else self.matrix.shape[0]
+
+    @property
+    def cities(self) -> list[tuple[float, float]]:
+        """The coordinates as the list of (x, y) tuples used by logic.cities and the pygame view."""
+        if self.coordinates is None:
+            raise ValueError(f"Instance {self.name!r} has no coordinates")
+        return [tuple(point) for point in self.coordinates.tolist()]
+
+    def city_set(self) -> CitySet:
+        """Return the coordinates as a logic.model.CitySet, sharing memory-mapped data without a copy."""
+        if self.coordinates is None:
+            raise ValueError(f"Instance {self.name!r} has no coordinates")
+        return CitySet(self.coordinates)
+
+    @property
+    def metric(self) -> str:
+        """
+        Name of the logic.metrics metric of the coordinates, or None when the distances come from the matrix.
+
+        Exact instances use 'euclidean' and TSPLIB coordinate instances the
+        metric registered under their edge weight type, which applies the
+        TSPLIB rounding rule, so solvers need no dense matrix for them.
+        """
+        if self.matrix is not None or self.coordinates is None:
+            return None
+        return "euclidean" if self.edge_weight_type == EUCLIDEAN else self.edge_weight_type
+
+    def distance_matrix(self, dtype="float64") -> np.ndarray:
+        """
+        Return the dense distance matrix this instance defines.
+        """
+        if self.matrix is not None:
+            return np.asarray(self.matrix, dtype=dtype)
+        if self.edge_weight_type == EUCLIDEAN:
+            return build_distance_matrix(self.coordinates, dtype=dtype)
+        return tsplib_distance_matrix(self.coordinates, self.edge_weight_type).astype(dtype, copy=False)
+
+
+def cache_directory() -> Path:
+    """
+    Return the directory of the binary instance cache, creating it if needed.
+
+    Defaults to ~/.cache/my_tsp_problem and can be moved with the TSP_CACHE_DIR
+    environment variable.
+    """
+    directory = Path(os.environ.get(CACHE_ENV_VAR, Path.home() / ".cache" / "my_tsp_problem"))
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _cache_key(path: Path, **options) -> str:
+    """
+    Fingerprint a source file by its resolved path, size, modification time and load options.
+    """
+    stat = path.stat()
+    fingerprint = json.dumps([str(path.resolve()), stat.st_size, stat.st_mtime_ns, options], sort_keys=True)
+    return f"{path.stem}-{hashlib.sha1(fingerprint.encode()).hexdigest()[:16]}"
+
+
+def _load_cached(key: str):
+    """
+    Return a cached instance as memory-mapped arrays, or None on a cache miss.
+    """
+    directory = cache_directory()
+    metadata_path = directory / f"{key}.json"
+    if not metadata_path.exists():
+        return None
+    metadata = json.loads(metadata_path.read_text())
+    arrays = {}
+    for field_name in ("coordinates", "matrix", "optimal_tour"):
+        if metadata.get(field_name):
+            arrays[field_name] = np.load(directory / f"{key}.{field_name}.npy", mmap_mode="r")
+    return Instance(metadata["name"], edge_weight_type=metadata["edge_weight_type"], **arrays)
+
+
+def _store_cached(key: str, instance: Instance) -> Instance:
+    """
+    Write an instance to the cache and return it reloaded as memory maps.
+    """
+    directory = cache_directory()
+    metadata = {"name": instance.name, "edge_weight_type": instance.edge_weight_type}
+    for field_name in ("coordinates", "matrix", "optimal_tour"):
+        value = getattr(instance, field_name)
+        metadata[field_name] = value is not None
+        if value is not None:
+            np.save(directory / f"{key}.{field_name}.npy", np.ascontiguousarray(value))
+    # Metadata is written last, so a partially written entry is never picked up.
+    (directory / f"{key}.json").write_text(json.dumps(metadata))
+    return _load_cached(key)
+
+
+def _cached(path: Path, loader, use_cache: bool, **options) -> Instance:
+    """
+    Load an instance through the binary cache.
+    """
+    if not use_cache:
+        return loader(path, **options)
+    key = _cache_key(path, **options)
+    instance = _load_cached(key)
+    if instance is None:
+        instance = _store_cached(key, loader(path, **options))
+    return instance
+
+
+def _read_tsplib_instance(path: Path) -> Instance:
+    problem = read_tsplib(path)
+    edge_weight_type = problem.edge_weight_type or "EUC_2D"
+    if edge_weight_type not in COORDINATE_TYPES + ("EXPLICIT",):
+        raise ValueError(f"Unsupported TSPLIB edge weight type {edge_weight_type!r} in {path}")
+    optimal_tour = None
+    tour_path = path.with_suffix(".opt.tour")
+    if tour_path.exists():
+        optimal_tour = read_tsplib(tour_path).tours[0]
+    return Instance(
+        problem.name or path.stem,
+        coordinates=problem.coordinates,
+        edge_weight_type=edge_weight_type,
+        matrix=problem.matrix if edge_weight_type == "EXPLICIT" else None,
+        optimal_tour=optimal_tour,
+    )
+
+
+def read_coordinates_csv(path, columns: tuple[int, int] = (0, 1), delimiter: str = ",",
+                         chunk_lines: int = DEFAULT_CHUNK_LINES) -> np.ndarray:
+    """
+    Stream (x, y) coordinates from a delimited text file in fixed-size chunks.
+
+    A header line is skipped if it does not parse as numbers. Each chunk is
+    converted with one NumPy call, so memory use is bounded by chunk_lines
+    rather than by Python objects per row.
+
+    Parameters:
+    - path: File to read.
+    - columns (tuple[int, int]): Indices of the x and y columns (default is (0, 1)).
+    - delimiter (str): Field separator (default is ',').
+    - chunk_lines (int): Lines parsed per chunk (default is 1,000,000).
+
+    Returns:
+    np.ndarray: (n, 2) float64 coordinates.
+    """
+    chunks = []
+    with open(path, encoding="utf-8") as handle:
+        first = True
+        while True:
+            lines = [line for _, line in zip(range(chunk_lines), handle)]
+            if not lines:
+                break
+            if first:
+                first = False
+                try:
+                    [float(value) for value in lines[0].split(delimiter)]
+                except ValueError:
+                    lines = lines[1:]
+            rows = [line for line in lines if line.strip()]
+            if not rows:
+                continue
+            n_columns = rows[0].count(delimiter) + 1
+            values = np.array(delimiter.join(row.strip() for row in rows).split(delimiter), dtype=np.float64)
+            chunks.append(values.reshape(-1, n_columns)[:, list(columns)])
+    if not chunks:
+        return np.empty((0, 2))
+    return np.ascontiguousarray(np.concatenate(chunks))
+
+
+def _read_csv_instance(path: Path, **options) -> Instance:
+    return Instance(path.stem, coordinates=read_coordinates_csv(path, **options))
+
+
+def _read_npy_instance(path: Path) -> Instance:
+    coordinates = np.load(path, mmap_mode="r")
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError(f"Expected an (n, 2) array in {path}, got shape {coordinates.shape}")
+    return Instance(path.stem, coordinates=coordinates)
+
+
+def _bundled_instance(key: str) -> Instance:
+    n_cities = int(key)
+    if n_cities not in cities_locations:
+        raise KeyError(f"No bundled instance with {n_cities} cities, available: {sorted(cities_locations)}")
+    return Instance(f"bundled-{n_cities}", coordinates=np.array(cities_locations[n_cities], dtype=np.float64))
+
+
+INSTANCE_SOURCES = {"bundled": _bundled_instance}
+FILE_LOADERS = {
+    ".tsp": _read_tsplib_instance,
+    ".atsp": _read_tsplib_instance,
+    ".csv": _read_csv_instance,
+    ".txt": _read_csv_instance,
+    ".npy": None,
+}
+
+
+def register_source(prefix: str, loader) -> None:
+    """
+    Register a named instance source so that load_instance("prefix:key") calls loader(key).
+    """
+    INSTANCE_SOURCES[prefix] = loader
+
+
+def load_instance(spec, use_cache: bool = True, **options) -> Instance:
+    """
+    Load an instance from a registered source or a file.
+
+    Specs of the form "source:key" go to a registered source, e.g.
+    "bundled:15" for the 15-city set of data.cities. Anything else is a file
+    path: TSPLIB .tsp/.atsp (with a sibling .opt.tour if present), CSV/TXT
+    coordinates or an .npy (n, 2) array. Parsed files are cached as .npy
+    files and reopened as read-only memory maps, so reloading a large
+    instance is almost free and its pages are shared between processes.
+
+    Parameters:
+    - spec (str | Path): Source spec or file path.
+    - use_cache (bool): Use the binary cache for parsed files (default is True).
+    - **options: Extra arguments for the CSV reader.
+
+    Returns:
+    Instance: The loaded instance.
+    """
+    spec_text = str(spec)
+    prefix, _, key = spec_text.partition(":")
+    if key and prefix in INSTANCE_SOURCES:
+        return INSTANCE_SOURCES[prefix](key)
+
+    path = Path(spec_text)
+    suffix = path.suffix.lower()
+    if suffix not in FILE_LOADERS:
+        raise ValueError(f"Don't know how to load {spec_text!r}; expected one of {sorted(FILE_LOADERS)} or a source prefix {sorted(INSTANCE_SOURCES)}")
+    if not path.exists():
+        raise FileNotFoundError(spec_text)
+    if suffix == ".npy":
+        return _read_npy_instance(path)
+    return _cached(path, FILE_LOADERS[suffix], use_cache, **options)
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from data.instances import cache_directory
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024  # disk space the solution cache may use
+DEFAULT_MIN_SIMILARITY = 0.9  # share of cities a cached instance must have to warm-start
+DEFAULT_TOLERANCE = 1e-6  # coordinate distance under which two cities count as the same
+SIZE_SLACK = 0.2  # cached instances may have this much fewer or more cities to warm-start
+
+
+@dataclass
+class CachedSolution:
+    """
+    A tour read from the solution cache.
+
+    Attributes:
+    - key (str): Fingerprint of the cached instance.
+    - tour (np.ndarray): Closed tour as city indices of the instance it was looked up for.
+    - length (float): Length of the cached tour on the cached instance.
+    - similarity (float): Share of cities shared with the cached instance, 1.0 for an exact hit.
+    """
+
+    key: str
+    tour: np.ndarray
+    length: float
+    similarity: float = 1.0
+
+
+def fingerprint(coordinates=None, distance_matrix=None, metric: str = "euclidean", **parameters) -> str:
+    """
+    Hash an instance and the solver parameters into a cache key.
+
+    Coordinates (or an explicit matrix) are hashed as contiguous float64
+    bytes, so the same city set hits whatever container it came in, while
+    the metric and the parameters (solver name, time limit, seed...) are
+    hashed as sorted JSON.
+    """
+    if coordinates is None and distance_matrix is None:
+        raise ValueError("Either coordinates or distance_matrix must be given")
+    digest = hashlib.sha1()
+    for array in (coordinates, distance_matrix):
+        if array is not None:
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        digest.update(b"|")
+    digest.update(json.dumps([metric, parameters], sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:24]
+
+
+def transfer_tour(tour: np.ndarray, cached_coordinates: np.ndarray, coordinates: np.ndarray) -> np.ndarray:
+    """
+    Map a tour of a cached city set onto a nearby city set.
+
+    Each city is matched to its nearest cached city and the cities are
+    visited in the order their matches appear in the cached tour; cities
+    sharing a match are ordered by where they lie along the edge leaving it.
+    Moved, added or removed cities therefore only disturb the tour locally,
+    which makes the result a good start for local search.
+    """
+    cached_coordinates = np.asarray(cached_coordinates, dtype=np.float64)
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    tour = np.asarray(tour, dtype=np.intp)
+    position = np.empty(tour.size, dtype=np.intp)
+    position[tour] = np.arange(tour.size)
+    match = cKDTree(cached_coordinates).query(coordinates)[1]
+
+    start = cached_coordinates[match]
+    end = cached_coordinates[tour[(position[match] + 1) % tour.size]]
+    edge = end - start
+    squared = np.einsum("ij,ij->i", edge, edge)
+    along = np.einsum("ij,ij->i", coordinates - start, edge) / np.where(squared > 0, squared, 1.0)
+    return np.lexsort((along, position[match]))
+
+
+class SolutionCache:
+    """
+    Best known tours on disk, keyed by fingerprint, with size-bounded LRU eviction.
+
+    Every entry is a <key>.json metadata file plus <key>.tour.npy and, for
+    warm starts, <key>.coordinates.npy. Files are written under a temporary
+    name and renamed, the metadata last, so concurrent batch workers never
+    read half an entry. A hit touches the metadata file, and when the cache
+    outgrows max_bytes the entries with the oldest modification times go first.
+
+    Parameters:
+    - directory (str | Path): Cache directory; defaults to "solutions" in data.instances.cache_directory().
+    - max_bytes (int): Disk space the entries may use (default is 256 MiB).
+    """
+
+    def __init__(self, directory=None, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.directory = Path(directory) if directory is not None else cache_directory() / "solutions"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _paths(self, key: str) -> list[Path]:
+        return [self.directory / f"{key}.json", self.directory / f"{key}.tour.npy",
+                self.directory / f"{key}.coordinates.npy"]
+
+    def _metadata(self, key: str):
+        try:
+            return json.loads((self.directory / f"{key}.json").read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write(self, path: Path, write) -> None:
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as handle:
+            write(handle)
+        os.replace(temporary, path)
+
+    def get(self, key: str):
+        """
+        Return the cached solution for a fingerprint, or None on a miss.
+        """
+        metadata = self._metadata(key)
+        if metadata is None:
+            return None
+        try:
+            tour = np.load(self.directory / f"{key}.tour.npy")
+            os.utime(self.directory / f"{key}.json")
+        except FileNotFoundError:
+            return None
+        return CachedSolution(key, tour, metadata["length"])
+
+    def put(self, key: str, tour, length: float, coordinates=None, metric: str = "euclidean") -> bool:
+        """
+        Store a tour unless the cache already holds one at least as short.
+
+        Coordinates are kept so that nearby instances can warm-start from it.
+        Returns True if the entry was written.
+        """
+        current = self._metadata(key)
+        if current is not None and current["length"] <= length:
+            return False
+        tour = np.ascontiguousarray(tour, dtype=np.int32)
+        self._write(self.directory / f"{key}.tour.npy", lambda handle: np.save(handle, tour))
+        metadata = {"length": float(length), "n": int(tour.size), "metric": metric, "coordinates": False}
+        if coordinates is not None:
+            points = np.ascontiguousarray(coordinates, dtype=np.float64)
+            self._write(self.directory / f"{key}.coordinates.npy", lambda handle: np.save(handle, points))
+            metadata.update(coordinates=True, low=points.min(axis=0).tolist(), high=points.max(axis=0).tolist())
+        self._write(self.directory / f"{key}.json", lambda handle: handle.write(json.dumps(metadata).encode()))
+        self.evict()
+        return True
+
+    def nbytes(self) -> int:
+        """Return the disk space used by the entries."""
+        return sum(path.stat().st_size for path in self.directory.glob("*.npy")) + sum(
+            path.stat().st_size for path in self.directory.glob("*.json"))
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes, returning how many were removed.
+        """
+        entries = []
+        for metadata_path in self.directory.glob("*.json"):
+            key = metadata_path.stem
+            try:
+                used = metadata_path.stat().st_mtime_ns
+                size = sum(path.stat().st_size for path in self._paths(key) if path.exists())
+            except FileNotFoundError:
+                continue
+            entries.append((used, size, key))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".npy", ".tmp"):
+                path.unlink(missing_ok=True)
+
+    def warm_start(self, coordinates, metric: str = "euclidean", min_similarity: float = DEFAULT_MIN_SIMILARITY,
+                   tolerance: float = DEFAULT_TOLERANCE):
+        """
+        Find the cached city set most like coordinates and transfer its tour.
+
+        Candidates have the same metric, a city count within SIZE_SLACK and
+        overlapping bounding boxes; the similarity of each is the share of
+        cities with a cached city within tolerance.
+
+        Parameters:
+        - coordinates: (n, 2) city coordinates of the new instance.
+        - metric (str): Metric the tours were measured with (default is 'euclidean').
+        - min_similarity (float): Smallest share of shared cities to accept (default is 0.9).
+        - tolerance (float): Distance under which two cities are the same (default is 1e-6).
+
+        Returns:
+        CachedSolution: The transferred tour and the similarity, or None when no entry is similar enough.
+        """
+        points = np.asarray(coordinates, dtype=np.float64)
+        n_cities = points.shape[0]
+        low, high = points.min(axis=0), points.max(axis=0)
+        best = None
+        for metadata_path in self.directory.glob("*.json"):
+            key = metadata_path.stem
+            metadata = self._metadata(key)
+            if (metadata is None or not metadata["coordinates"] or metadata["metric"] != metric
+                    or abs(metadata["n"] - n_cities) > SIZE_SLACK * n_cities
+                    or np.any(np.asarray(metadata["low"]) > high) or np.any(np.asarray(metadata["high"]) < low)):
+                continue
+            try:
+                cached = np.load(self.directory / f"{key}.coordinates.npy")
+                tour = np.load(self.directory / f"{key}.tour.npy")
+            except FileNotFoundError:
+                continue
+            distances = cKDTree(cached).query(points, distance_upper_bound=tolerance)[0]
+            similarity = float(np.isfinite(distances).mean())
+            if similarity >= min_similarity and (best is None or similarity > best[0]):
+                best = (similarity, key, tour, cached, metadata["length"])
+        if best is None:
+            return None
+        similarity, key, tour, cached, length = best
+        os.utime(self.directory / f"{key}.json")
+        return CachedSolution(key, transfer_tour(tour, cached, points), length, similarity)
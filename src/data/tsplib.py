@@ -0,0 +1,218 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+COORDINATE_TYPES = ("EUC_2D", "CEIL_2D", "MAN_2D", "MAX_2D", "GEO", "ATT")
+SECTIONS = ("NODE_COORD_SECTION", "EDGE_WEIGHT_SECTION", "TOUR_SECTION", "DISPLAY_DATA_SECTION",
+            "DEPOT_SECTION", "DEMAND_SECTION", "FIXED_EDGES_SECTION")
+
+
+@dataclass
+class TsplibProblem:
+    """
+    Contents of a TSPLIB file.
+
+    Attributes:
+    - name (str): Value of the NAME field.
+    - type (str): Value of the TYPE field, e.g. 'TSP', 'ATSP' or 'TOUR'.
+    - dimension (int): Number of nodes.
+    - edge_weight_type (str): How distances are defined, e.g. 'EUC_2D' or 'EXPLICIT'.
+    - coordinates (np.ndarray): (n, 2) node coordinates, if given.
+    - matrix (np.ndarray): Explicit (n, n) distance matrix, if given.
+    - tours (list[np.ndarray]): Tours from a TOUR_SECTION as 0-based city indices.
+    - header (dict): Every header field as read.
+    """
+
+    name: str = ""
+    type: str = "TSP"
+    dimension: int = 0
+    edge_weight_type: str = None
+    coordinates: np.ndarray = None
+    matrix: np.ndarray = None
+    tours: list = field(default_factory=list)
+    header: dict = field(default_factory=dict)
+
+
+def _nint(values: np.ndarray) -> np.ndarray:
+    """
+    Round to the nearest integer the way TSPLIB does, (int)(x + 0.5).
+    """
+    return np.floor(values + 0.5)
+
+
+def _geo_radians(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Convert TSPLIB DDD.MM latitude/longitude values to radians.
+    """
+    degrees = np.trunc(coordinates)
+    minutes = coordinates - degrees
+    return 3.141592 * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+
+def tsplib_distance_matrix(coordinates, edge_weight_type: str) -> np.ndarray:
+    """
+    Build the integer-valued distance matrix a TSPLIB edge weight type defines.
+
+    Parameters:
+    - coordinates: (n, 2) node coordinates.
+    - edge_weight_type (str): One of EUC_2D, CEIL_2D, MAN_2D, MAX_2D, GEO or ATT.
+
+    Returns:
+    np.ndarray: (n, n) float64 matrix holding the rounded TSPLIB distances.
+    """
+    points = np.asarray(coordinates, dtype=np.float64)
+    dx = points[:, None, 0] - points[None, :, 0]
+    dy = points[:, None, 1] - points[None, :, 1]
+
+    if edge_weight_type == "EUC_2D":
+        matrix = _nint(np.hypot(dx, dy))
+    elif edge_weight_type == "CEIL_2D":
+        matrix = np.ceil(np.hypot(dx, dy))
+    elif edge_weight_type == "MAN_2D":
+        matrix = _nint(np.abs(dx) + np.abs(dy))
+    elif edge_weight_type == "MAX_2D":
+        matrix = np.maximum(_nint(np.abs(dx)), _nint(np.abs(dy)))
+    elif edge_weight_type == "ATT":
+        pseudo = np.sqrt((dx * dx + dy * dy) / 10.0)
+        rounded = _nint(pseudo)
+        matrix = np.where(rounded < pseudo, rounded + 1, rounded)
+    elif edge_weight_type == "GEO":
+        radians = _geo_radians(points)
+        latitude, longitude = radians[:, 0], radians[:, 1]
+        q1 = np.cos(longitude[:, None] - longitude[None, :])
+        q2 = np.cos(latitude[:, None] - latitude[None, :])
+        q3 = np.cos(latitude[:, None] + latitude[None, :])
+        cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        matrix = np.trunc(6378.388 * np.arccos(cosine) + 1.0)
+    else:
+        raise ValueError(f"Unsupported TSPLIB edge weight type {edge_weight_type!r}")
+
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+def _explicit_matrix(values: np.ndarray, dimension: int, edge_weight_format: str) -> np.ndarray:
+    """
+    Expand the numbers of an EDGE_WEIGHT_SECTION into a square matrix.
+    """
+    if edge_weight_format == "FULL_MATRIX":
+        return values[: dimension * dimension].reshape(dimension, dimension).copy()
+
+    # Column-wise upper triangles list the same numbers as row-wise lower
+    # triangles (and vice versa), so each format reduces to one index layout.
+    layouts = {
+        "UPPER_ROW": lambda: np.triu_indices(dimension, 1),
+        "LOWER_COL": lambda: np.triu_indices(dimension, 1),
+        "LOWER_ROW": lambda: np.tril_indices(dimension, -1),
+        "UPPER_COL": lambda: np.tril_indices(dimension, -1),
+        "UPPER_DIAG_ROW": lambda: np.triu_indices(dimension, 0),
+        "LOWER_DIAG_COL": lambda: np.triu_indices(dimension, 0),
+        "LOWER_DIAG_ROW": lambda: np.tril_indices(dimension, 0),
+        "UPPER_DIAG_COL": lambda: np.tril_indices(dimension, 0),
+    }
+    if edge_weight_format not in layouts:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT {edge_weight_format!r}")
+    rows, cols = layouts[edge_weight_format]()
+    matrix = np.zeros((dimension, dimension))
+    matrix[rows, cols] = values[: rows.size]
+    matrix[cols, rows] = values[: rows.size]
+    return matrix
+
+
+def _parse_tours(values: np.ndarray) -> list:
+    """
+    Split a TOUR_SECTION into tours at each -1 and make them 0-based.
+    """
+    tours = []
+    current = []
+    for value in values.astype(np.int64).tolist():
+        if value == -1:
+            if current:
+                tours.append(np.array(current, dtype=np.intp) - 1)
+            current = []
+        else:
+            current.append(value)
+    if current:
+        tours.append(np.array(current, dtype=np.intp) - 1)
+    return tours
+
+
+def parse_tsplib(text: str) -> TsplibProblem:
+    """
+    Parse the text of a TSPLIB .tsp, .atsp or .tour file.
+
+    Section bodies are converted to NumPy in one call each, so large
+    NODE_COORD_SECTIONs parse at array speed rather than line by line.
+    """
+    problem = TsplibProblem()
+    section = None
+    section_lines = {}
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        keyword = stripped.split(":", 1)[0].strip().upper()
+        if keyword == "EOF":
+            break
+        if keyword in SECTIONS:
+            section = keyword
+            section_lines[section] = []
+            remainder = stripped[len(keyword):].lstrip(" :")
+            if remainder:
+                section_lines[section].append(remainder)
+        elif ":" in stripped and not stripped[0].isdigit() and not stripped[0] in "-+.":
+            key, value = stripped.split(":", 1)
+            problem.header[key.strip().upper()] = value.strip()
+            section = None
+        elif section is not None:
+            section_lines[section].append(stripped)
+        else:
+            raise ValueError(f"Unexpected line outside of a section: {stripped!r}")
+
+    header = problem.header
+    problem.name = header.get("NAME", "")
+    problem.type = header.get("TYPE", "TSP").split()[0].upper()
+    problem.dimension = int(header.get("DIMENSION", 0))
+    problem.edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "").upper() or None
+
+    def numbers(name):
+        return np.array(" ".join(section_lines[name]).split(), dtype=np.float64)
+
+    if "NODE_COORD_SECTION" in section_lines:
+        columns = numbers("NODE_COORD_SECTION").reshape(-1, 3)
+        order = np.argsort(columns[:, 0], kind="stable")
+        problem.coordinates = np.ascontiguousarray(columns[order, 1:])
+        problem.dimension = problem.dimension or problem.coordinates.shape[0]
+    elif "DISPLAY_DATA_SECTION" in section_lines:
+        columns = numbers("DISPLAY_DATA_SECTION").reshape(-1, 3)
+        order = np.argsort(columns[:, 0], kind="stable")
+        problem.coordinates = np.ascontiguousarray(columns[order, 1:])
+
+    if "EDGE_WEIGHT_SECTION" in section_lines:
+        edge_weight_format = header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+        problem.matrix = _explicit_matrix(numbers("EDGE_WEIGHT_SECTION"), problem.dimension, edge_weight_format)
+
+    if "TOUR_SECTION" in section_lines:
+        problem.tours = _parse_tours(numbers("TOUR_SECTION"))
+
+    return problem
+
+
+def read_tsplib(path) -> TsplibProblem:
+    """
+    Read and parse a TSPLIB file from disk.
+    """
+    with open(path, encoding="utf-8") as handle:
+        return parse_tsplib(handle.read())
+
+
+def problem_distance_matrix(problem: TsplibProblem) -> np.ndarray:
+    """
+    Return the distance matrix a parsed TSPLIB problem defines.
+    """
+    if problem.matrix is not None and problem.edge_weight_type in (None, "EXPLICIT"):
+        return problem.matrix
+    if problem.coordinates is None:
+        raise ValueError(f"Problem {problem.name!r} has neither coordinates nor an explicit matrix")
+    return tsplib_distance_matrix(problem.coordinates, problem.edge_weight_type or "EUC_2D")
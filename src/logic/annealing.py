@@ -0,0 +1,312 @@
+import math
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from logic.construction import as_square_matrix
+from logic.instrumentation import active
+from logic.local_search import neighbor_lists
+from logic.metrics import is_symmetric
+from logic.population import score_population
+from logic.progress import Progress, exhaust
+
+EPSILON = 1e-9
+
+
+@dataclass
+class AnnealingResult:
+    """
+    Outcome of a multi-chain simulated annealing run.
+
+    Attributes:
+    - tour (np.ndarray): Best closed tour seen by any chain, as city indices.
+    - length (float): Length of that tour.
+    - steps (int): Steps run; every step proposes one move per chain.
+    - acceptance (float): Share of proposed moves that were accepted.
+    - reheats (int): Number of times the temperature was raised again.
+    - history (list[float]): Best length after each report interval.
+    """
+
+    tour: np.ndarray
+    length: float
+    steps: int
+    acceptance: float
+    reheats: int = 0
+    history: list = field(default_factory=list)
+
+
+def geometric_schedule(t_start: float, t_end: float, fraction: float) -> float:
+    """Exponential decay from t_start to t_end."""
+    return t_start * (t_end / t_start) ** fraction
+
+
+def linear_schedule(t_start: float, t_end: float, fraction: float) -> float:
+    """Straight line from t_start to t_end."""
+    return t_start + (t_end - t_start) * fraction
+
+
+def logarithmic_schedule(t_start: float, t_end: float, fraction: float) -> float:
+    """Fast early cooling that flattens out, reaching t_end at the end."""
+    return t_start / (1 + (t_start / t_end - 1) * math.log1p(fraction * (math.e - 1)))
+
+
+SCHEDULES = {
+    "geometric": geometric_schedule,
+    "linear": linear_schedule,
+    "logarithmic": logarithmic_schedule,
+}
+
+
+def propose_two_opt(tours: np.ndarray, positions: np.ndarray, matrix: np.ndarray, rng: np.random.Generator,
+                    neighbors: np.ndarray = None):
+    """
+    Draw one 2-opt move per chain and return its positions and length change.
+
+    The move reverses tours[k, i:j + 1] with 1 <= i <= j < n. With
+    neighbor lists, a random city a and one of its neighbors c are picked
+    and the reversal is the one that makes (a, c) a tour edge, so most
+    proposals join nearby cities instead of random ones.
+    """
+    n_chains, n_cities = tours.shape
+    rows = np.arange(n_chains)
+    if neighbors is None:
+        ends = np.sort(rng.integers(1, n_cities, size=(n_chains, 2)), axis=1)
+        i, j = ends[:, 0], ends[:, 1]
+    else:
+        p = rng.integers(0, n_cities, size=n_chains)
+        c = neighbors[tours[rows, p], rng.integers(0, neighbors.shape[1], size=n_chains)]
+        q = positions[rows, c]
+        i, j = np.minimum(p, q) + 1, np.maximum(p, q)
+    a = tours[rows, i - 1]
+    b = tours[rows, i]
+    c = tours[rows, j]
+    d = tours[rows, (j + 1) % n_cities]
+    delta = matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d]
+    return i, j, delta
+
+
+def propose_swap(tours: np.ndarray, positions: np.ndarray, matrix: np.ndarray, rng: np.random.Generator,
+                 neighbors: np.ndarray = None):
+    """
+    Draw one swap of two non-adjacent cities per chain and return its positions and length change.
+
+    Swapping keeps every other edge in its direction, so the delta is exact on asymmetric matrices too.
+    """
+    n_chains, n_cities = tours.shape
+    i = rng.integers(0, n_cities, size=n_chains)
+    j = (i + rng.integers(2, n_cities - 1, size=n_chains)) % n_cities
+    rows = np.arange(n_chains)
+    x, y = tours[rows, i], tours[rows, j]
+    x_prev, x_next = tours[rows, i - 1], tours[rows, (i + 1) % n_cities]
+    y_prev, y_next = tours[rows, j - 1], tours[rows, (j + 1) % n_cities]
+    delta = (matrix[x_prev, y] + matrix[y, x_next] + matrix[y_prev, x] + matrix[x, y_next]
+             - matrix[x_prev, x] - matrix[x, x_next] - matrix[y_prev, y] - matrix[y, y_next])
+    return i, j, delta
+
+
+def apply_two_opt(tours: np.ndarray, positions: np.ndarray, rows: np.ndarray, i: np.ndarray, j: np.ndarray) -> None:
+    """
+    Reverse tours[row, i:j + 1] in place for every selected row and update positions.
+
+    When the slice is longer than half the tour its complement is reversed
+    instead, which gives the same cycle, so a step moves at most n / 2
+    cities per chain. All slices are gathered and scattered in one pass.
+    """
+    if rows.size == 0:
+        return
+    n_cities = tours.shape[1]
+    size = j - i + 1
+    complement = 2 * size > n_cities
+    first = np.where(complement, j + 1, i)
+    last = np.where(complement, i - 1 + n_cities, j)
+    size = np.where(complement, n_cities - size, size)
+
+    owners = np.repeat(np.arange(rows.size), size)
+    offset = np.arange(owners.size) - np.repeat(np.cumsum(size) - size, size)
+    base = np.repeat(rows * n_cities, size)
+    destination = base + (first[owners] + offset) % n_cities
+    source = base + (last[owners] - offset) % n_cities
+    flat_tours = tours.reshape(-1)
+    moved = flat_tours[source]
+    flat_tours[destination] = moved
+    positions.reshape(-1)[np.repeat(rows * n_cities, size) + moved] = destination - base
+
+
+def apply_swap(tours: np.ndarray, positions: np.ndarray, rows: np.ndarray, i: np.ndarray, j: np.ndarray) -> None:
+    """
+    Swap tours[row, i] and tours[row, j] in place for every selected row and update positions.
+    """
+    x, y = tours[rows, i], tours[rows, j]
+    tours[rows, i], tours[rows, j] = y, x
+    positions[rows, x], positions[rows, y] = j, i
+
+
+MOVES = {
+    "two_opt": (propose_two_opt, apply_two_opt),
+    "swap": (propose_swap, apply_swap),
+}
+
+
+def estimate_temperature(tours: np.ndarray, positions: np.ndarray, matrix: np.ndarray, rng: np.random.Generator,
+                         neighbors: np.ndarray = None, acceptance: float = 0.5, move: str = "two_opt") -> float:
+    """
+    Pick a starting temperature at which an average uphill move is accepted with the given probability.
+    """
+    propose = MOVES[move][0]
+    deltas = np.concatenate([propose(tours, positions, matrix, rng, neighbors)[2]
+                             for _ in range(max(1, 1000 // len(tours)))])
+    uphill = deltas[deltas > EPSILON]
+    if uphill.size == 0:
+        return 1.0
+    return float(uphill.mean() / -math.log(acceptance))
+
+
+def iter_simulated_annealing(
+    distance_matrix: np.ndarray,
+    chains: int = 256,
+    steps: int = 20_000,
+    schedule: str = "geometric",
+    initial_temperature: float = None,
+    final_temperature: float = None,
+    swap_rate: float = 0.1,
+    n_neighbors: int = 10,
+    reheat_after: int = None,
+    reheat_fraction: float = 0.3,
+    initial_tour=None,
+    time_limit: float = None,
+    report_interval: int = 1000,
+    seed: int = None,
+):
+    """
+    Solve the TSP with many independent simulated annealing chains advanced together, yielding progress.
+
+    The chains are the rows of one (chains, n) array, with a matching array
+    of city positions. Every step draws one move per chain, 2-opt
+    reversals joining a random city to one of its n_neighbors nearest
+    cities or, for a swap_rate share of the steps, swaps of two random
+    cities. All moves of a step are costed with a few fancy-indexed
+    gathers from the distance matrix and accepted with one vectorized
+    Metropolis test at the temperature of the schedule. Only accepted
+    moves touch the tours. On an asymmetric matrix only swaps are used,
+    since a reversal changes the length of the reversed path. When the
+    best length has not improved for reheat_after steps, the schedule
+    restarts from reheat_fraction of the initial temperature and the
+    worst half of the chains restart from the best tour. A Progress
+    snapshot (generation = steps) is yielded every report_interval steps.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix.
+    - chains (int): Number of chains (default is 256).
+    - steps (int): Number of steps (default is 20000).
+    - schedule (str): Key of SCHEDULES (default is "geometric").
+    - initial_temperature (float): Starting temperature; estimated from random moves when None.
+    - final_temperature (float): Temperature at the end of the schedule; 1e-4 of the start when None.
+    - swap_rate (float): Share of steps proposing swaps instead of 2-opt moves (default is 0.1).
+    - n_neighbors (int): Candidate neighbors for 2-opt proposals; uniform random reversals when None
+      (default is 10).
+    - reheat_after (int): Steps without a new best before reheating; never reheats when None.
+    - reheat_fraction (float): Reheat temperature as a share of the initial one (default is 0.3).
+    - initial_tour: Starting tour for every chain; random permutations when None.
+    - time_limit (float): Stop after this many seconds.
+    - report_interval (int): Steps between snapshots (default is 1000).
+    - seed (int): Seed for reproducible runs.
+
+    Returns:
+    AnnealingResult: The best tour, its length, step and reheat counts, acceptance and history.
+    """
+    start = time.perf_counter()
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule {schedule!r}, expected one of {sorted(SCHEDULES)}")
+    if chains < 1:
+        raise ValueError("chains must be at least 1")
+    matrix = np.ascontiguousarray(as_square_matrix(distance_matrix), dtype=np.float64)
+    n_cities = matrix.shape[0]
+    rng = np.random.default_rng(seed)
+
+    if initial_tour is None:
+        tours = np.argsort(rng.random((chains, n_cities)), axis=1).astype(np.int32)
+    else:
+        tours = np.tile(np.asarray(initial_tour, dtype=np.int32), (chains, 1))
+    positions = np.empty_like(tours)
+    positions[np.arange(chains)[:, None], tours] = np.arange(n_cities, dtype=np.int32)
+    lengths = score_population(tours, matrix)
+    best = int(np.argmin(lengths))
+    best_tour = tours[best].astype(np.intp)
+    best_length = float(lengths[best])
+    if n_cities < 5:
+        yield Progress(0, best_tour, best_length, time.perf_counter() - start)
+        return AnnealingResult(best_tour, best_length, 0, 0.0)
+
+    symmetric = is_symmetric(distance_matrix)
+    swap_rate = swap_rate if symmetric else 1.0
+    neighbors = None
+    if n_neighbors is not None and symmetric:
+        neighbors = neighbor_lists(n_neighbors, matrix).astype(np.int32)
+    cool = SCHEDULES[schedule]
+    t_initial = initial_temperature or estimate_temperature(tours, positions, matrix, rng, neighbors,
+                                                            move="two_opt" if symmetric else "swap")
+    t_final = final_temperature or t_initial * 1e-4
+    t_start = t_initial
+    cycle_start = 0
+    last_improvement = 0
+    reheats = 0
+    accepted_total = 0
+    history = []
+    rows = np.arange(chains)
+    stats = active()
+
+    step = 0
+    while step < steps:
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        temperature = cool(t_start, t_final, (step - cycle_start) / max(1, steps - cycle_start))
+        propose, apply = MOVES["swap" if rng.random() < swap_rate else "two_opt"]
+        i, j, delta = propose(tours, positions, matrix, rng, neighbors)
+
+        # Metropolis: downhill moves always pass, uphill ones with probability exp(-delta / T).
+        accept = (delta <= 0) | (rng.random(chains) < np.exp(-np.maximum(delta, 0) / temperature))
+        accepted = rows[accept]
+        accepted_total += accepted.size
+        lengths[accepted] += delta[accepted]
+        apply(tours, positions, accepted, i[accepted], j[accepted])
+        step += 1
+        if stats is not None:
+            stats.count("moves_tried", chains)
+            stats.count("moves_accepted", accepted.size)
+
+        leader = int(np.argmin(lengths))
+        if lengths[leader] < best_length - EPSILON:
+            best_length = float(lengths[leader])
+            best_tour = tours[leader].astype(np.intp)
+            last_improvement = step
+        elif reheat_after is not None and step - last_improvement >= reheat_after:
+            reheats += 1
+            if stats is not None:
+                stats.count("reheats")
+            t_start = max(reheat_fraction * t_initial, t_final)
+            cycle_start = last_improvement = step
+            worst = np.argsort(lengths)[chains // 2:]
+            tours[worst] = best_tour
+            positions[worst[:, None], tours[worst]] = np.arange(n_cities, dtype=np.int32)
+            lengths[worst] = best_length
+
+        if step % report_interval == 0:
+            # Re-score to drop the rounding drift of the summed deltas.
+            lengths[:] = score_population(tours, matrix)
+            history.append(best_length)
+            yield Progress(step, best_tour, best_length, time.perf_counter() - start)
+
+    acceptance = accepted_total / (step * chains) if step else 0.0
+    best_length = float(score_population(best_tour[None, :], matrix)[0])
+    yield Progress(step, best_tour, best_length, time.perf_counter() - start)
+    return AnnealingResult(best_tour, best_length, step, acceptance, reheats, history)
+
+
+def simulated_annealing(*args, **kwargs) -> AnnealingResult:
+    """
+    Solve the TSP with many simulated annealing chains advanced together as NumPy arrays.
+
+    Takes the same arguments as iter_simulated_annealing and returns its final AnnealingResult.
+    """
+    return exhaust(iter_simulated_annealing(*args, **kwargs))
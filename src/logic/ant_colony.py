@@ -0,0 +1,387 @@
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from logic.construction import as_square_matrix, greedy_edge_tour, nearest_neighbor_tour
+from logic.distance_matrix import as_coordinates
+from logic.distance_oracle import make_oracle
+from logic.genetic import SharedArray, _LocalArray
+from logic.instrumentation import active, phase
+from logic.local_search import local_search, neighbor_lists
+from logic.metrics import get_metric, is_symmetric
+from logic.population import score_population
+from logic.progress import Progress, exhaust
+
+GLOBAL_BEST_INTERVAL = 5  # every this many iterations the global best deposits instead of the iteration best
+
+
+@dataclass
+class AntColonyResult:
+    """
+    Outcome of a MAX-MIN Ant System run.
+
+    Attributes:
+    - tour (np.ndarray): Best closed tour found, as city indices.
+    - length (float): Length of that tour.
+    - iterations (int): Colony iterations run.
+    - restarts (int): Number of pheromone resets after stagnation.
+    - history (list[float]): Best length after each iteration.
+    """
+
+    tour: np.ndarray
+    length: float
+    iterations: int
+    restarts: int = 0
+    history: list = field(default_factory=list)
+
+
+def _nearest_unvisited(cities: np.ndarray, visited: np.ndarray, arrays: dict, metric, tree: cKDTree,
+                       k: int) -> np.ndarray:
+    """
+    Return the nearest unvisited city of each ant standing on cities.
+
+    A matrix row is read directly. On coordinates the KD-tree is asked for
+    the k nearest cities first, and four times as many for the ants whose
+    answer held no unvisited city, until every ant has one; the closest of
+    those under the metric is taken. The KD-tree measures straight-line (or,
+    for Manhattan metrics, rectilinear) distance, so the answer is exact for
+    the metrics that keep its order, such as the TSPLIB roundings.
+
+    Parameters:
+    - cities (np.ndarray): City of each stuck ant.
+    - visited (np.ndarray): (len(cities), n) visited flags of those ants.
+    - arrays (dict): "matrix" or "points" arrays.
+    - metric (Metric): Metric of the points.
+    - tree (cKDTree): KD-tree over the points.
+    - k (int): Cities asked for in the first query.
+
+    Returns:
+    np.ndarray: The chosen city of each ant.
+    """
+    if "matrix" in arrays:
+        distances = arrays["matrix"].array[cities].astype(np.float64)
+        distances[visited] = np.inf
+        return np.argmin(distances, axis=1)
+    points = arrays["points"].array
+    n_cities = points.shape[0]
+    p = 1 if "manhattan" in (metric.name, metric.proxy) else 2
+    chosen = np.empty(len(cities), dtype=np.intp)
+    pending = np.arange(len(cities))
+    while pending.size:
+        k = min(k, n_cities)
+        _, ids = tree.query(points[cities[pending]], k=k, p=p)
+        ids = ids.reshape(pending.size, k)
+        free = ~np.take_along_axis(visited[pending], ids, axis=1)
+        found = free.any(axis=1)
+        rows = pending[found]
+        candidates = ids[found]
+        origins = np.repeat(points[cities[rows]], k, axis=0)
+        distances = metric.elementwise(origins, points[candidates].reshape(-1, 2)).reshape(rows.size, k)
+        distances[~free[found]] = np.inf
+        chosen[rows] = candidates[np.arange(rows.size), np.argmin(distances, axis=1)]
+        pending = pending[~found]
+        k *= 4
+    return chosen
+
+
+def _tour_lengths(tours: np.ndarray, arrays: dict, metric="euclidean") -> np.ndarray:
+    """
+    Score a block of closed tours from the matrix or coordinates.
+    """
+    if "matrix" in arrays:
+        return score_population(tours, arrays["matrix"].array)
+    ordered = arrays["points"].array[tours]
+    following = np.roll(ordered, -1, axis=1)
+    steps = get_metric(metric).elementwise(ordered.reshape(-1, 2), following.reshape(-1, 2))
+    return steps.reshape(tours.shape).sum(axis=1)
+
+
+def construct_tours(n_ants: int, neighbors: np.ndarray, attractiveness: np.ndarray, arrays: dict,
+                    rng: np.random.Generator, metric="euclidean") -> np.ndarray:
+    """
+    Build the tours of a batch of ants in lockstep.
+
+    At each of the n - 1 steps every ant picks its next city among the
+    candidate neighbors of its current city with probability proportional
+    to their attractiveness (pheromone^alpha * heuristic^beta), using one
+    cumulative sum and one uniform draw for the whole batch. Ants whose
+    candidates are all visited go to their nearest unvisited city instead,
+    found with a KD-tree over the points that is built the first time an
+    ant gets stuck. That is O(n * k) per ant instead of O(n^2).
+
+    Parameters:
+    - n_ants (int): Ants in the batch.
+    - neighbors (np.ndarray): (n, k) candidate lists.
+    - attractiveness (np.ndarray): (n, k) selection weights of the candidate edges.
+    - arrays (dict): "matrix" or "points" arrays for the nearest-unvisited fallback.
+    - rng (np.random.Generator): Random source.
+    - metric (str | Metric): Metric of logic.metrics for the points (default is 'euclidean').
+
+    Returns:
+    np.ndarray: (n_ants, n) int32 array of tours.
+    """
+    n_cities, k = neighbors.shape
+    metric = get_metric(metric)
+    tree = None
+    rows = np.arange(n_ants)
+    tours = np.empty((n_ants, n_cities), dtype=np.int32)
+    visited = np.zeros((n_ants, n_cities), dtype=bool)
+    current = rng.integers(0, n_cities, size=n_ants)
+    tours[:, 0] = current
+    visited[rows, current] = True
+
+    for step in range(1, n_cities):
+        candidates = neighbors[current]
+        weights = np.where(visited[rows[:, None], candidates], 0.0, attractiveness[current])
+        cumulative = np.cumsum(weights, axis=1)
+        total = cumulative[:, -1]
+        threshold = rng.random(n_ants) * total
+        choice = np.minimum((cumulative <= threshold[:, None]).sum(axis=1), k - 1)
+        following = candidates[rows, choice]
+
+        stuck = rows[total <= 0]
+        if stuck.size:
+            if tree is None and "points" in arrays:
+                tree = cKDTree(arrays["points"].array)
+            following[stuck] = _nearest_unvisited(current[stuck], visited[stuck], arrays, metric, tree, 2 * k + 1)
+
+        current = following
+        tours[:, step] = current
+        visited[rows, current] = True
+    return tours
+
+
+_worker_arrays = {}
+_worker_metric = "euclidean"
+
+
+def _init_worker(descriptors: dict, metric="euclidean") -> None:
+    """
+    Attach a pool worker to the shared distances, candidate lists, attractiveness and tour block.
+    """
+    global _worker_metric
+    for key, descriptor in descriptors.items():
+        _worker_arrays[key] = SharedArray.attach(descriptor)
+    _worker_metric = metric
+
+
+def _build_batch(task: tuple, arrays: dict = None, metric=None) -> None:
+    """
+    Build the ants of rows start:stop of the shared tour block and score them in place.
+    """
+    start, stop, seed = task
+    arrays = _worker_arrays if arrays is None else arrays
+    metric = _worker_metric if metric is None else metric
+    rng = np.random.default_rng(seed)
+    tours = construct_tours(stop - start, arrays["neighbors"].array, arrays["attractiveness"].array, arrays, rng,
+                            metric)
+    arrays["tours"].array[start:stop] = tours
+    arrays["lengths"].array[start:stop] = _tour_lengths(tours, arrays, metric)
+
+
+def _deposit(pheromone: np.ndarray, neighbors: np.ndarray, tour: np.ndarray, amount: float, symmetric: bool) -> None:
+    """
+    Add pheromone to the candidate edges of a tour; tour edges outside the candidate lists get none.
+    """
+    origins = tour
+    destinations = np.roll(tour, -1)
+    if symmetric:
+        origins, destinations = np.concatenate((origins, destinations)), np.concatenate((destinations, origins))
+    slots = neighbors[origins] == destinations[:, None]
+    edge, slot = np.nonzero(slots)
+    pheromone[origins[edge], slot] += amount
+
+
+def _pheromone_bounds(best_length: float, rho: float, p_best: float, n_cities: int, k: int) -> tuple:
+    """
+    MAX-MIN Ant System trail limits for the current best length.
+    """
+    tau_max = 1.0 / (rho * best_length)
+    root = p_best ** (1.0 / n_cities)
+    average_choices = max(k / 2.0, 1.0)
+    tau_min = tau_max * (1 - root) / ((average_choices - 1) * root) if average_choices > 1 else tau_max / 2
+    return tau_max, min(tau_min, tau_max)
+
+
+def iter_ant_colony(
+    distance_matrix: np.ndarray = None,
+    coordinates=None,
+    ants: int = 25,
+    iterations: int = 200,
+    n_neighbors: int = 15,
+    alpha: float = 1.0,
+    beta: float = 2.0,
+    rho: float = 0.02,
+    p_best: float = 0.05,
+    improve: bool = True,
+    restart_after: int = None,
+    workers: int = None,
+    time_limit: float = None,
+    seed: int = None,
+    metric="euclidean",
+):
+    """
+    Solve the TSP with the MAX-MIN Ant System on candidate lists, yielding progress.
+
+    Pheromone lives only on each city's n_neighbors nearest-neighbor edges,
+    an (n, k) array instead of (n, n), and all ants of a batch build their
+    tours in lockstep (see construct_tours). After each iteration the trails
+    evaporate by rho and only the iteration best, or every
+    GLOBAL_BEST_INTERVAL iterations the global best, deposits 1 / length;
+    trails are clipped to the MAX-MIN limits derived from the best length.
+    With improve, the iteration best is first polished by
+    logic.local_search. With workers > 1 the ants are split into batches
+    built by a process pool, with the distances, candidate lists,
+    attractiveness and tours in shared memory. When the best has not
+    improved for restart_after iterations the trails are reset to the
+    maximum. A Progress snapshot (generation = iteration) is yielded after
+    every iteration, which is what the tsp.py fitness plot draws.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix, possibly asymmetric.
+    - coordinates: (n, 2) city coordinates measured with `metric`, used instead of a matrix for large instances.
+    - ants (int): Ants per iteration (default is 25).
+    - iterations (int): Colony iterations (default is 200).
+    - n_neighbors (int): Candidate edges per city that carry pheromone (default is 15).
+    - alpha (float): Pheromone exponent (default is 1.0).
+    - beta (float): Heuristic (1 / distance) exponent (default is 2.0).
+    - rho (float): Evaporation rate (default is 0.02).
+    - p_best (float): Probability of rebuilding the best tour at convergence, sets the trail limits (default is 0.05).
+    - improve (bool): Apply local search to the iteration best (default is True).
+    - restart_after (int): Iterations without improvement before resetting the trails; never when None.
+    - workers (int): Worker processes; builds ants in-process when None or 1.
+    - time_limit (float): Stop after this many seconds.
+    - seed (int): Seed for reproducible runs.
+    - metric (str | Metric): Metric of logic.metrics for coordinates, a registry name when workers > 1
+      (default is 'euclidean').
+
+    Returns:
+    AntColonyResult: The best tour, its length, iteration and restart counts and the best length per iteration.
+    """
+    start = time.perf_counter()
+    if distance_matrix is None and coordinates is None:
+        raise ValueError("Either distance_matrix or coordinates must be given")
+    if ants < 1:
+        raise ValueError("ants must be at least 1")
+    if distance_matrix is not None:
+        data = {"matrix": np.ascontiguousarray(as_square_matrix(distance_matrix), dtype=np.float64)}
+        symmetric = is_symmetric(distance_matrix)
+        oracle = make_oracle(data["matrix"])
+        initial = nearest_neighbor_tour(data["matrix"])
+    else:
+        data = {"points": np.ascontiguousarray(as_coordinates(coordinates), dtype=np.float64)}
+        symmetric = True
+        oracle = make_oracle(coordinates=data["points"], metric=metric)
+        initial = greedy_edge_tour(data["points"])
+    n_cities = next(iter(data.values())).shape[0]
+    seeds = np.random.SeedSequence(seed)
+
+    neighbors = neighbor_lists(n_neighbors, oracle).astype(np.intp)
+    k = neighbors.shape[1]
+    if "matrix" in data:
+        edge_lengths = np.take_along_axis(data["matrix"], neighbors, axis=1)
+    else:
+        origins = np.repeat(data["points"], k, axis=0)
+        edge_lengths = get_metric(metric).elementwise(origins, data["points"][neighbors].reshape(-1, 2))
+        edge_lengths = edge_lengths.reshape(n_cities, k)
+    heuristic = (1.0 / np.maximum(edge_lengths, 1e-12)) ** beta
+
+    best_tour = np.asarray(initial, dtype=np.intp)
+    local_data = {key: _LocalArray(value) for key, value in data.items()}
+    best_length = float(_tour_lengths(best_tour[None, :], local_data, metric)[0])
+    if n_cities < 5 or k == 0:
+        yield Progress(0, best_tour, best_length, time.perf_counter() - start)
+        return AntColonyResult(best_tour, best_length, 0)
+
+    tau_max, tau_min = _pheromone_bounds(best_length, rho, p_best, n_cities, k)
+    pheromone = np.full((n_cities, k), tau_max)
+
+    workers = 1 if workers is None else max(1, min(workers, ants))
+    shapes = {"neighbors": (neighbors.shape, np.intp), "attractiveness": ((n_cities, k), np.float64),
+              "tours": ((ants, n_cities), np.int32), "lengths": ((ants,), np.float64)}
+    shapes.update({key: (value.shape, value.dtype) for key, value in data.items()})
+    if workers == 1:
+        arrays = {key: _LocalArray(np.empty(shape, dtype=dtype)) for key, (shape, dtype) in shapes.items()}
+        pool = None
+    else:
+        arrays = {key: SharedArray.create(shape, dtype) for key, (shape, dtype) in shapes.items()}
+    arrays["neighbors"].array[:] = neighbors
+    for key, value in data.items():
+        arrays[key].array[:] = value
+    if workers > 1:
+        descriptors = {key: shared.descriptor() for key, shared in arrays.items()}
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(descriptors, metric))
+    boundaries = np.linspace(0, ants, workers + 1).astype(int)
+
+    try:
+        history = []
+        restarts = 0
+        last_improvement = 0
+        iteration = 0
+        stats = active()
+        while iteration < iterations:
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                break
+            with phase("construct"):
+                arrays["attractiveness"].array[:] = pheromone ** alpha * heuristic
+                batch_seeds = seeds.spawn(workers)
+                tasks = [(int(boundaries[index]), int(boundaries[index + 1]), batch_seeds[index])
+                         for index in range(workers) if boundaries[index + 1] > boundaries[index]]
+                if pool is None:
+                    for task in tasks:
+                        _build_batch(task, arrays, metric)
+                else:
+                    pool.map(_build_batch, tasks)
+            iteration += 1
+            if stats is not None:
+                stats.count("tours_constructed", ants)
+
+            lengths = arrays["lengths"].array
+            leader = int(np.argmin(lengths))
+            iteration_tour = arrays["tours"].array[leader].astype(np.intp)
+            iteration_length = float(lengths[leader])
+            if improve:
+                with phase("local_search"):
+                    iteration_tour, delta = local_search(iteration_tour, oracle, neighbors=neighbors)
+                iteration_length += delta
+            if iteration_length < best_length - 1e-9:
+                best_tour, best_length = iteration_tour, iteration_length
+                last_improvement = iteration
+                tau_max, tau_min = _pheromone_bounds(best_length, rho, p_best, n_cities, k)
+
+            with phase("pheromone"):
+                pheromone *= 1.0 - rho
+                if iteration % GLOBAL_BEST_INTERVAL == 0:
+                    _deposit(pheromone, neighbors, best_tour, 1.0 / best_length, symmetric)
+                else:
+                    _deposit(pheromone, neighbors, iteration_tour, 1.0 / iteration_length, symmetric)
+                np.clip(pheromone, tau_min, tau_max, out=pheromone)
+            if restart_after is not None and iteration - last_improvement >= restart_after:
+                pheromone.fill(tau_max)
+                restarts += 1
+                last_improvement = iteration
+                if stats is not None:
+                    stats.count("restarts")
+
+            history.append(best_length)
+            yield Progress(iteration, best_tour, best_length, time.perf_counter() - start)
+
+        return AntColonyResult(best_tour, best_length, iteration, restarts, history)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            for shared in arrays.values():
+                shared.close()
+
+
+def ant_colony(*args, **kwargs) -> AntColonyResult:
+    """
+    Solve the TSP with the MAX-MIN Ant System on candidate lists.
+
+    Takes the same arguments as iter_ant_colony and returns its final AntColonyResult.
+    """
+    return exhaust(iter_ant_colony(*args, **kwargs))
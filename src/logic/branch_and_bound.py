@@ -0,0 +1,169 @@
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from logic.construction import as_square_matrix, nearest_neighbor_tour
+from logic.distance_matrix import path_length
+from logic.progress import Progress, exhaust
+
+
+@dataclass
+class BranchAndBoundResult:
+    """
+    Outcome of a branch-and-bound search.
+
+    Attributes:
+    - tour (np.ndarray): Best closed tour found, as city indices starting at 0.
+    - length (float): Length of that tour.
+    - lower_bound (float): Proven lower bound on the optimal tour length.
+    - nodes (int): Number of search nodes expanded.
+    - optimal (bool): True when the search finished and the tour is proven optimal.
+    """
+
+    tour: np.ndarray
+    length: float
+    lower_bound: float
+    nodes: int
+    optimal: bool
+
+    @property
+    def gap(self) -> float:
+        """Relative optimality gap (length - lower_bound) / length."""
+        if self.length <= 0:
+            return 0.0
+        return max(0.0, (self.length - self.lower_bound) / self.length)
+
+
+def minimum_spanning_tree_weight(matrix: np.ndarray) -> float:
+    """
+    Calculate the weight of a minimum spanning tree of a dense symmetric matrix with Prim's algorithm.
+    """
+    n_nodes = matrix.shape[0]
+    if n_nodes < 2:
+        return 0.0
+    in_tree = np.zeros(n_nodes, dtype=bool)
+    in_tree[0] = True
+    keys = matrix[0].astype(np.float64)
+    keys[0] = np.inf
+    weight = 0.0
+    for _ in range(n_nodes - 1):
+        node = int(np.argmin(keys))
+        weight += keys[node]
+        in_tree[node] = True
+        keys = np.minimum(keys, matrix[node])
+        keys[in_tree] = np.inf
+    return weight
+
+
+def _completion_bound(symmetric: np.ndarray, first: int, last: int, unvisited: np.ndarray) -> float:
+    """
+    Lower bound on a path from last through every unvisited city back to first.
+
+    Such a path is a spanning tree of the unvisited cities plus both
+    endpoints, so it is at least as long as their minimum spanning tree.
+    """
+    endpoints = [first] if first == last else [first, last]
+    nodes = np.concatenate((unvisited, endpoints))
+    return minimum_spanning_tree_weight(symmetric[np.ix_(nodes, nodes)])
+
+
+def iter_branch_and_bound(
+    distance_matrix: np.ndarray,
+    node_limit: int = None,
+    time_limit: float = None,
+    initial_tour=None,
+    report_interval: int = 1000,
+):
+    """
+    Solve the TSP with a depth-first branch-and-bound search, yielding progress.
+
+    Tours are extended one city at a time from city 0. A node is pruned when
+    its cost so far plus a minimum-spanning-tree bound on the remaining cities
+    reaches the incumbent, which is seeded with a nearest-neighbor tour.
+    Asymmetric matrices are bounded through their element-wise min(d, d.T).
+    A Progress snapshot (generation = nodes expanded) is yielded whenever the
+    incumbent improves and every report_interval nodes.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix.
+    - node_limit (int): Maximum number of nodes to expand (default is unlimited).
+    - time_limit (float): Maximum wall time in seconds (default is unlimited).
+    - initial_tour: Optional starting incumbent; nearest neighbor is used when None.
+    - report_interval (int): Nodes between periodic snapshots (default is 1000).
+
+    Returns:
+    BranchAndBoundResult: The best tour found and the proven lower bound. When a
+    budget runs out, the bound is the smallest bound among unexplored nodes.
+    """
+    start = time.perf_counter()
+    matrix = as_square_matrix(distance_matrix).astype(np.float64, copy=False)
+    n_cities = matrix.shape[0]
+    if n_cities <= 2:
+        tour = np.arange(n_cities)
+        length = path_length(tour, matrix, closed=True)
+        yield Progress(0, tour, length, time.perf_counter() - start)
+        return BranchAndBoundResult(tour, length, length, 0, True)
+
+    symmetric = np.minimum(matrix, matrix.T)
+    if initial_tour is None:
+        initial_tour = nearest_neighbor_tour(matrix)
+    best_tour = np.roll(initial_tour, -int(np.argmin(initial_tour)))
+    best_length = path_length(best_tour, matrix, closed=True)
+    yield Progress(0, best_tour, best_length, time.perf_counter() - start)
+
+    deadline = None if time_limit is None else start + time_limit
+    all_cities = np.arange(n_cities)
+    root_bound = _completion_bound(symmetric, 0, 0, all_cities[1:])
+    stack = [(root_bound, 0.0, (0,))]
+    nodes = 0
+
+    while stack:
+        if node_limit is not None and nodes >= node_limit:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+        parent_bound, cost, path = stack.pop()
+        if parent_bound >= best_length:
+            continue
+        nodes += 1
+        if nodes % report_interval == 0:
+            yield Progress(nodes, best_tour, best_length, time.perf_counter() - start)
+
+        visited = np.zeros(n_cities, dtype=bool)
+        visited[list(path)] = True
+        unvisited = all_cities[~visited]
+        last = path[-1]
+
+        if unvisited.size == 1:
+            city = int(unvisited[0])
+            length = cost + matrix[last, city] + matrix[city, 0]
+            if length < best_length:
+                best_length = length
+                best_tour = np.array(path + (city,), dtype=np.intp)
+                yield Progress(nodes, best_tour, best_length, time.perf_counter() - start)
+            continue
+
+        bound = cost + _completion_bound(symmetric, 0, last, unvisited)
+        if bound >= best_length:
+            continue
+
+        step_costs = matrix[last, unvisited]
+        for index in np.argsort(-step_costs, kind="stable"):
+            city = int(unvisited[index])
+            stack.append((bound, cost + step_costs[index], path + (city,)))
+
+    lower_bound = min([best_length] + [entry[0] for entry in stack])
+    optimal = lower_bound >= best_length
+    yield Progress(nodes, best_tour, float(best_length), time.perf_counter() - start)
+    return BranchAndBoundResult(best_tour, float(best_length), float(lower_bound), nodes, optimal)
+
+
+def branch_and_bound(*args, **kwargs) -> BranchAndBoundResult:
+    """
+    Solve the TSP with a depth-first branch-and-bound search.
+
+    Takes the same arguments as iter_branch_and_bound and returns its final BranchAndBoundResult.
+    """
+    return exhaust(iter_branch_and_bound(*args, **kwargs))
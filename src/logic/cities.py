@@ -1,16 +1,30 @@
 import math
 from itertools import permutations, combinations
 
+from logic.distance_matrix import path_length
+from logic.model import CitySet, Tour
+
 def calculate_distance(city1: tuple[int, int], city2: tuple[int, int]) -> float:
     """
     Calculate the Euclidean distance between two cities.
     """
     return math.sqrt((city1[0] - city2[0])**2 + (city1[1] - city2[1])**2)
 
-def calculate_total_distance(path: list[tuple[int, int]]) -> float:
+def calculate_total_distance(path: list[tuple[int, int]], distance_matrix=None) -> float:
     """
     Calculate the total distance of a path.
+
+    When a distance matrix (square or condensed, see logic.distance_matrix) is
+    given, the path is a sequence of city indices into it and is scored with a
+    single vectorized gather instead of per-edge calls. A logic.model.Tour or
+    CitySet is scored as the open path through its cities in one NumPy pass.
     """
+    if isinstance(path, CitySet):
+        path = Tour.identity(path)
+    if isinstance(path, Tour):
+        return path.length(distance_matrix, closed=False)
+    if distance_matrix is not None:
+        return path_length(path, distance_matrix)
     total_distance = 0
     for i in range(len(path) - 1):
         total_distance += calculate_distance(path[i], path[i + 1])
@@ -19,6 +33,9 @@ def calculate_total_distance(path: list[tuple[int, int]]) -> float:
 def routes_to_cities(path: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """
     Determine the order of cities in a path.
+
+    Enumerating every permutation is only feasible for a handful of cities and
+    is kept as a reference oracle; use logic.held_karp.held_karp for exact tours.
     """
     routes = {"permutation" : permutations(path), 
               "combination" : combinations(path, 2)}
@@ -0,0 +1,154 @@
+import numpy as np
+from scipy.spatial.distance import squareform
+
+from logic.distance_matrix import as_coordinates
+from logic.spatial_index import SpatialIndex
+
+
+def as_square_matrix(distance_matrix: np.ndarray) -> np.ndarray:
+    """
+    Return a square view of a square or condensed distance matrix.
+    """
+    matrix = np.asarray(distance_matrix)
+    if matrix.ndim == 1:
+        return squareform(matrix)
+    return matrix
+
+
+def nearest_neighbor_tour(distance_matrix: np.ndarray, start: int = 0) -> np.ndarray:
+    """
+    Build a tour by repeatedly moving to the closest unvisited city.
+
+    Each step is one vectorized scan of a matrix row, so construction is
+    O(n^2) over the whole tour.
+    """
+    matrix = as_square_matrix(distance_matrix)
+    n_cities = matrix.shape[0]
+    tour = np.empty(n_cities, dtype=np.intp)
+    if n_cities == 0:
+        return tour
+
+    visited = np.zeros(n_cities, dtype=bool)
+    current = start
+    for position in range(n_cities):
+        tour[position] = current
+        visited[current] = True
+        if position == n_cities - 1:
+            break
+        row = np.where(visited, np.inf, matrix[current])
+        current = int(np.argmin(row))
+    return tour
+
+
+def spatial_nearest_neighbor_tour(coordinates, start: int = 0) -> np.ndarray:
+    """
+    Build a nearest-neighbor tour from coordinates without a distance matrix.
+
+    Visited cities are deleted from a logic.spatial_index.SpatialIndex, so
+    each "closest unvisited city" query costs O(log n) amortized and the
+    whole tour O(n log n).
+    """
+    index = SpatialIndex(coordinates)
+    n_cities = len(index)
+    tour = np.empty(n_cities, dtype=np.intp)
+    if n_cities == 0:
+        return tour
+
+    current = start
+    for position in range(n_cities):
+        tour[position] = current
+        index.remove(current)
+        if position == n_cities - 1:
+            break
+        _, nearest = index.nearest(index.points[current])
+        current = int(nearest[0])
+    return tour
+
+
+def _find(parents: np.ndarray, node: int) -> int:
+    """
+    Return the fragment representative of node, compressing the path on the way.
+    """
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+    return root
+
+
+def greedy_edge_tour(coordinates, n_neighbors: int = 10) -> np.ndarray:
+    """
+    Build a tour by adding the shortest candidate edges that keep it a set of paths.
+
+    Candidate edges come from k-nearest-neighbor lists instead of all n^2
+    pairs. The resulting path fragments are then joined end to end by
+    repeatedly jumping to the closest free fragment endpoint, found through
+    a spatial index over the endpoints.
+    """
+    points = as_coordinates(coordinates)
+    n_cities = points.shape[0]
+    if n_cities < 3:
+        return np.arange(n_cities)
+
+    neighbors = SpatialIndex(points).k_nearest_lists(min(n_neighbors, n_cities - 1))
+    origins = np.repeat(np.arange(n_cities), neighbors.shape[1])
+    targets = neighbors.ravel()
+    pairs = np.unique(np.sort(np.column_stack((origins, targets)), axis=1), axis=0)
+    lengths = np.hypot(*(points[pairs[:, 0]] - points[pairs[:, 1]]).T)
+
+    degree = np.zeros(n_cities, dtype=np.int8)
+    parents = np.arange(n_cities)
+    adjacency = [[] for _ in range(n_cities)]
+    for edge in np.argsort(lengths, kind="stable"):
+        a, b = (int(city) for city in pairs[edge])
+        if degree[a] >= 2 or degree[b] >= 2:
+            continue
+        root_a, root_b = _find(parents, a), _find(parents, b)
+        if root_a == root_b:
+            continue
+        parents[root_a] = root_b
+        degree[a] += 1
+        degree[b] += 1
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+
+    fragments = []
+    other_end = {}
+    for city in np.flatnonzero(degree < 2).tolist():
+        if city in other_end:
+            continue
+        path = [city]
+        previous, current = -1, city
+        while True:
+            following = [other for other in adjacency[current] if other != previous]
+            if not following:
+                break
+            previous, current = current, following[0]
+            path.append(current)
+        other_end[path[0]] = path[-1]
+        other_end[path[-1]] = path[0]
+        fragments.append(path)
+
+    fragment_of = {}
+    for fragment in fragments:
+        fragment_of[fragment[0]] = fragment
+        fragment_of[fragment[-1]] = fragment
+    endpoints = np.array(sorted(fragment_of), dtype=np.intp)
+    endpoint_index = SpatialIndex(points[endpoints])
+    slot = {int(city): position for position, city in enumerate(endpoints)}
+
+    def take(fragment):
+        for end in {fragment[0], fragment[-1]}:
+            endpoint_index.remove(slot[end])
+
+    current = fragments[0]
+    take(current)
+    tour = list(current)
+    while len(endpoint_index):
+        _, nearest = endpoint_index.nearest(points[tour[-1]])
+        city = int(endpoints[nearest[0]])
+        fragment = fragment_of[city]
+        take(fragment)
+        tour.extend(fragment if fragment[0] == city else reversed(fragment))
+    return np.array(tour, dtype=np.intp)
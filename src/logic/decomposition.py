@@ -0,0 +1,292 @@
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from logic.construction import greedy_edge_tour
+from logic.distance_matrix import as_coordinates
+from logic.genetic import SharedArray, _LocalArray
+from logic.lin_kernighan import lin_kernighan
+from logic.local_search import local_search, neighbor_lists
+from logic.progress import Progress, exhaust
+
+DEFAULT_CLUSTER_SIZE = 2000
+
+
+@dataclass
+class DecompositionResult:
+    """
+    Outcome of a partition-and-merge run.
+
+    Attributes:
+    - tour (np.ndarray): Closed tour over all cities, as city indices.
+    - length (float): Euclidean length of that tour.
+    - n_clusters (int): Number of clusters solved.
+    - timings (dict): Seconds spent in the partition, solve, merge and repair phases.
+    """
+
+    tour: np.ndarray
+    length: float
+    n_clusters: int
+    timings: dict = field(default_factory=dict)
+
+
+def tour_length(tour: np.ndarray, points: np.ndarray) -> float:
+    """
+    Euclidean length of a closed tour over coordinates, the calculate_distance metric summed.
+    """
+    ordered = points[tour]
+    return float(np.hypot(*(ordered - np.roll(ordered, -1, axis=0)).T).sum())
+
+
+def grid_partition(points: np.ndarray, cluster_size: int) -> np.ndarray:
+    """
+    Label each city with the square grid cell it falls in, about cluster_size cities per cell.
+
+    Labels are renumbered to be consecutive, so empty cells are dropped.
+    """
+    n_cities = points.shape[0]
+    cells = max(1, int(np.ceil(np.sqrt(n_cities / cluster_size))))
+    low = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - low, np.finfo(np.float64).tiny)
+    column, row = (np.minimum((points - low) / span * cells, cells - 1).astype(np.int64)).T
+    return np.unique(row * cells + column, return_inverse=True)[1]
+
+
+def kmeans_partition(points: np.ndarray, cluster_size: int, iterations: int = 10, seed: int = None) -> np.ndarray:
+    """
+    Label each city with its k-means cluster, k = n / cluster_size.
+
+    Each Lloyd iteration assigns cities through a KD-tree over the centres,
+    so it costs O(n log k) rather than O(n k).
+    """
+    n_cities = points.shape[0]
+    n_clusters = max(1, int(round(n_cities / cluster_size)))
+    rng = np.random.default_rng(seed)
+    centres = points[rng.choice(n_cities, size=n_clusters, replace=False)]
+    labels = np.zeros(n_cities, dtype=np.intp)
+    for _ in range(iterations):
+        labels = cKDTree(centres).query(points)[1]
+        counts = np.bincount(labels, minlength=len(centres))
+        sums = np.column_stack([np.bincount(labels, weights=points[:, axis], minlength=len(centres))
+                                for axis in range(2)])
+        occupied = counts > 0
+        moved = sums[occupied] / counts[occupied, None]
+        if len(moved) == len(centres) and np.allclose(moved, centres):
+            break
+        centres = moved
+    return np.unique(labels, return_inverse=True)[1]
+
+
+PARTITIONS = {
+    "grid": lambda points, cluster_size, seed: grid_partition(points, cluster_size),
+    "kmeans": lambda points, cluster_size, seed: kmeans_partition(points, cluster_size, seed=seed),
+}
+
+
+def _solve_greedy(points: np.ndarray, seed) -> np.ndarray:
+    return greedy_edge_tour(points)
+
+
+def _solve_local_search(points: np.ndarray, seed) -> np.ndarray:
+    return local_search(greedy_edge_tour(points), coordinates=points)[0]
+
+
+def _solve_lin_kernighan(points: np.ndarray, seed) -> np.ndarray:
+    return lin_kernighan(greedy_edge_tour(points), coordinates=points, kicks=points.shape[0] // 10, seed=seed).tour
+
+
+CLUSTER_SOLVERS = {
+    "greedy": _solve_greedy,
+    "local_search": _solve_local_search,
+    "lin_kernighan": _solve_lin_kernighan,
+}
+
+_worker_arrays = {}
+
+
+def _init_worker(descriptors: dict) -> None:
+    """
+    Attach a pool worker to the shared coordinates and cluster members.
+    """
+    for key, descriptor in descriptors.items():
+        _worker_arrays[key] = SharedArray.attach(descriptor)
+
+
+def _solve_cluster(task: tuple, arrays: dict = None) -> tuple[int, np.ndarray]:
+    """
+    Solve one cluster, given as a slice of the members array, and return its tour as city indices.
+    """
+    cluster, start, stop, solver, seed = task
+    arrays = _worker_arrays if arrays is None else arrays
+    members = arrays["members"].array[start:stop]
+    points = arrays["points"].array[members]
+    if members.size < 4:
+        return cluster, members.copy()
+    return cluster, members[CLUSTER_SOLVERS[solver](points, seed)]
+
+
+def _cluster_order(centres: np.ndarray) -> np.ndarray:
+    """
+    Order the clusters along a short closed tour through their centres.
+    """
+    if len(centres) < 4:
+        return np.arange(len(centres))
+    return local_search(greedy_edge_tour(centres), coordinates=centres)[0]
+
+
+def _open_cluster_tour(tour: np.ndarray, points: np.ndarray, entry_from: np.ndarray, exit_to: np.ndarray) -> np.ndarray:
+    """
+    Cut a closed cluster tour into a path, choosing the removed edge and direction.
+
+    The edge (a, b) dropped is the one minimizing the cost of entering from
+    entry_from and leaving towards exit_to, minus the length of (a, b).
+    """
+    if tour.size < 2:
+        return tour
+    following = np.roll(tour, -1)
+    a, b = points[tour], points[following]
+    removed = np.hypot(*(a - b).T)
+    enter_b = np.hypot(*(b - entry_from).T) + np.hypot(*(a - exit_to).T) - removed
+    enter_a = np.hypot(*(a - entry_from).T) + np.hypot(*(b - exit_to).T) - removed
+    if enter_b.min() <= enter_a.min():
+        cut = int(np.argmin(enter_b))
+        return np.roll(tour, -(cut + 1))
+    cut = int(np.argmin(enter_a))
+    return np.roll(tour, -(cut + 1))[::-1]
+
+
+def merge_cluster_tours(tours: list, points: np.ndarray, order: np.ndarray, centres: np.ndarray) -> np.ndarray:
+    """
+    Join closed cluster tours into one tour, visiting the clusters in the given order.
+
+    Each cluster tour is opened at the edge that best connects the exit of
+    the previous cluster to the centre of the next one.
+    """
+    if len(order) == 1:
+        return tours[order[0]]
+    pieces = []
+    previous_exit = centres[order[-1]]
+    for position, cluster in enumerate(order):
+        path = _open_cluster_tour(tours[cluster], points, previous_exit, centres[order[(position + 1) % len(order)]])
+        pieces.append(path)
+        previous_exit = points[path[-1]]
+    return np.concatenate(pieces)
+
+
+def iter_decomposition(
+    coordinates,
+    cluster_size: int = DEFAULT_CLUSTER_SIZE,
+    method: str = "grid",
+    cluster_solver: str = "local_search",
+    workers: int = None,
+    repair: bool = True,
+    n_neighbors: int = 10,
+    seed: int = None,
+):
+    """
+    Solve a large Euclidean instance by partitioning it, solving the parts in parallel and merging.
+
+    The cities are split into grid cells or k-means clusters of about
+    cluster_size cities. Each cluster is solved independently, across a
+    process pool when workers > 1, with the coordinates and cluster members
+    in shared memory so a task is only a slice of the members array. The
+    cluster tours are joined along a tour through the cluster centres, and a
+    2-opt / Or-opt pass started from the cities next to a cluster border
+    repairs the seams. Distances are Euclidean as in
+    logic.cities.calculate_distance, so lengths are comparable with the
+    other solvers. A Progress snapshot is yielded after the merge and after
+    the repair.
+
+    Parameters:
+    - coordinates: (n, 2) city coordinates.
+    - cluster_size (int): Target number of cities per cluster (default is 2000).
+    - method (str): "grid" or "kmeans" (default is "grid").
+    - cluster_solver (str): Key of CLUSTER_SOLVERS used per cluster (default is "local_search").
+    - workers (int): Worker processes; solves in-process when None or 1.
+    - repair (bool): Run the boundary repair pass (default is True).
+    - n_neighbors (int): Candidate neighbors for the repair pass (default is 10).
+    - seed (int): Seed for k-means and the cluster solvers.
+
+    Returns:
+    DecompositionResult: The merged tour, its length, the cluster count and phase timings.
+    """
+    if method not in PARTITIONS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {sorted(PARTITIONS)}")
+    if cluster_solver not in CLUSTER_SOLVERS:
+        raise ValueError(f"Unknown cluster_solver {cluster_solver!r}, expected one of {sorted(CLUSTER_SOLVERS)}")
+    if cluster_size < 4:
+        raise ValueError("cluster_size must be at least 4")
+
+    start = time.perf_counter()
+    timings = {}
+    points = as_coordinates(coordinates)
+    n_cities = points.shape[0]
+    if n_cities == 0:
+        raise ValueError("Cannot solve an empty instance")
+
+    labels = PARTITIONS[method](points, cluster_size, seed)
+    members = np.argsort(labels, kind="stable")
+    boundaries = np.searchsorted(labels[members], np.arange(labels.max() + 2))
+    n_clusters = boundaries.size - 1
+    counts = np.diff(boundaries)
+    centres = np.column_stack([np.bincount(labels, weights=points[:, axis]) for axis in range(2)]) / counts[:, None]
+    timings["partition"] = time.perf_counter() - start
+
+    seeds = np.random.SeedSequence(seed).generate_state(n_clusters).tolist()
+    tasks = [(cluster, int(boundaries[cluster]), int(boundaries[cluster + 1]), cluster_solver, seeds[cluster])
+             for cluster in range(n_clusters)]
+    # Largest clusters first, so a pool does not end on one long straggler.
+    tasks.sort(key=lambda task: task[1] - task[2])
+
+    phase = time.perf_counter()
+    workers = 1 if workers is None else max(1, min(workers, n_clusters))
+    tours = [None] * n_clusters
+    if workers == 1:
+        arrays = {"points": _LocalArray(points), "members": _LocalArray(members)}
+        for task in tasks:
+            cluster, tour = _solve_cluster(task, arrays)
+            tours[cluster] = tour
+    else:
+        arrays = {"points": SharedArray.create(points.shape, points.dtype),
+                  "members": SharedArray.create(members.shape, members.dtype)}
+        try:
+            arrays["points"].array[:] = points
+            arrays["members"].array[:] = members
+            descriptors = {key: shared.descriptor() for key, shared in arrays.items()}
+            with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(descriptors,)) as pool:
+                for cluster, tour in pool.imap_unordered(_solve_cluster, tasks):
+                    tours[cluster] = tour
+        finally:
+            for shared in arrays.values():
+                shared.close()
+    timings["solve"] = time.perf_counter() - phase
+
+    phase = time.perf_counter()
+    tour = merge_cluster_tours(tours, points, _cluster_order(centres), centres)
+    length = tour_length(tour, points)
+    timings["merge"] = time.perf_counter() - phase
+    yield Progress(0, tour, length, time.perf_counter() - start)
+
+    if repair and n_clusters > 1 and n_cities >= 8:
+        phase = time.perf_counter()
+        neighbors = neighbor_lists(n_neighbors, coordinates=points)
+        padded = np.where(neighbors < 0, np.arange(n_cities)[:, None], neighbors)
+        border = np.flatnonzero((labels[padded] != labels[:, None]).any(axis=1))
+        tour, delta = local_search(tour, coordinates=points, neighbors=neighbors, start_cities=border)
+        length += delta
+        timings["repair"] = time.perf_counter() - phase
+        yield Progress(1, tour, length, time.perf_counter() - start)
+
+    return DecompositionResult(tour, length, n_clusters, timings)
+
+
+def decomposition(*args, **kwargs) -> DecompositionResult:
+    """
+    Solve a large Euclidean instance by partitioning it, solving the parts in parallel and merging.
+
+    Takes the same arguments as iter_decomposition and returns its final DecompositionResult.
+    """
+    return exhaust(iter_decomposition(*args, **kwargs))
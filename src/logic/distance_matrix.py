@@ -0,0 +1,105 @@
+import numpy as np
+from scipy.spatial.distance import cdist, pdist
+
+DTYPES = {"float32": np.float32, "float64": np.float64}
+
+
+def _resolve_dtype(dtype) -> np.dtype:
+    """
+    Resolve a dtype name or NumPy dtype to one of the supported float types.
+    """
+    if isinstance(dtype, str):
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {sorted(DTYPES)}")
+        return np.dtype(DTYPES[dtype])
+    resolved = np.dtype(dtype)
+    if resolved not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"Unsupported dtype {resolved}, expected float32 or float64")
+    return resolved
+
+
+def as_coordinates(cities) -> np.ndarray:
+    """
+    Convert a list of (x, y) tuples into a contiguous (n, 2) float64 array.
+    """
+    coordinates = np.ascontiguousarray(cities, dtype=np.float64)
+    if coordinates.size == 0:
+        return coordinates.reshape(0, 2)
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError(f"Expected (n, 2) coordinates, got shape {coordinates.shape}")
+    return coordinates
+
+
+def build_distance_matrix(cities, dtype="float64", condensed: bool = False) -> np.ndarray:
+    """
+    Build the Euclidean distance matrix of a list of cities in a single SciPy call.
+
+    With condensed=True only the upper triangle is returned as a flat array of
+    n * (n - 1) / 2 entries (the scipy.spatial.distance.pdist layout), which
+    halves the memory needed for large instances.
+    """
+    resolved = _resolve_dtype(dtype)
+    coordinates = as_coordinates(cities)
+    if condensed:
+        return pdist(coordinates).astype(resolved, copy=False)
+    return cdist(coordinates, coordinates).astype(resolved, copy=False)
+
+
+def condensed_index(n: int, i, j):
+    """
+    Map (i, j) pairs of an n-city instance to positions in a condensed matrix.
+
+    Works element-wise on arrays. Pairs with i == j have no condensed entry
+    and must be handled by the caller.
+    """
+    i = np.asarray(i, dtype=np.int64)
+    j = np.asarray(j, dtype=np.int64)
+    low = np.minimum(i, j)
+    high = np.maximum(i, j)
+    return n * low - low * (low + 1) // 2 + (high - low - 1)
+
+
+def condensed_lookup(condensed: np.ndarray, n: int, i, j):
+    """
+    Gather distances between city indices i and j from a condensed matrix.
+    """
+    i = np.asarray(i, dtype=np.int64)
+    j = np.asarray(j, dtype=np.int64)
+    same = i == j
+    positions = condensed_index(n, i, np.where(same, i + 1, j))
+    positions = np.where(same, 0, positions)
+    values = condensed[positions] if condensed.size else np.zeros(np.shape(positions), condensed.dtype)
+    return np.where(same, condensed.dtype.type(0), values)
+
+
+def matrix_size(distance_matrix: np.ndarray) -> int:
+    """
+    Return the number of cities described by a square or condensed matrix.
+    """
+    if distance_matrix.ndim == 2:
+        return distance_matrix.shape[0]
+    n = int(round((1 + np.sqrt(1 + 8 * distance_matrix.size)) / 2))
+    if n * (n - 1) // 2 != distance_matrix.size:
+        raise ValueError(f"Condensed matrix of size {distance_matrix.size} is not a valid upper triangle")
+    return n
+
+
+def path_length(path, distance_matrix: np.ndarray, closed: bool = False) -> float:
+    """
+    Score a path given as city indices with one fancy-indexed gather and sum.
+
+    With closed=True the edge from the last city back to the first is included.
+    """
+    path = np.asarray(path, dtype=np.intp)
+    if path.size < 2:
+        return 0.0
+    origins = path[:-1]
+    destinations = path[1:]
+    if closed:
+        origins = path
+        destinations = np.roll(path, -1)
+    if distance_matrix.ndim == 1:
+        edges = condensed_lookup(distance_matrix, matrix_size(distance_matrix), origins, destinations)
+    else:
+        edges = distance_matrix[origins, destinations]
+    return float(edges.sum(dtype=np.float64))
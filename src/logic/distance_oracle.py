@@ -0,0 +1,283 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from logic.construction import as_square_matrix
+from logic.distance_matrix import as_coordinates
+from logic.metrics import get_metric, is_symmetric, metric_distance_matrix, metric_neighbor_lists
+from logic.metrics import pair_distance as metric_pair_distance
+
+DEFAULT_ORACLE_BUDGET = 256 * 1024 * 1024  # bytes a distance oracle may hold
+NEIGHBOR_ENTRY_BYTES = 80  # one cached neighbor distance in Python lists
+LRU_ENTRY_BYTES = 200  # one OrderedDict entry with its pair key and value
+BACKENDS = ("dense", "neighbors", "lru")
+CHEAP_METRICS = ("euclidean", "manhattan")  # computing these costs no more than a cache probe
+
+
+@dataclass
+class OracleStats:
+    """
+    Lookup counters of a distance oracle.
+
+    Attributes:
+    - backend (str): "dense", "neighbors" or "lru".
+    - hits (int): Lookups answered from stored distances.
+    - misses (int): Lookups that had to compute the distance.
+    - nbytes (int): Approximate bytes held by the oracle.
+    """
+
+    backend: str
+    hits: int
+    misses: int
+    nbytes: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of counted lookups that were hits, 1.0 when nothing was counted."""
+        return self.hits / self.lookups if self.lookups else 1.0
+
+
+class DistanceOracle:
+    """
+    Common interface of the distance backends.
+
+    oracle(i, j) returns a distance. Hot loops should bind oracle.distance,
+    a plain function, to skip the method dispatch. The caching backends
+    store one value per unordered pair, so they assume d(i, j) == d(j, i);
+    solvers check `symmetric` before using moves that reverse tour segments.
+    """
+
+    backend = None
+    symmetric = True
+
+    def __init__(self, n_cities: int, coordinates=None, metric="euclidean"):
+        self.n = n_cities
+        self.coordinates = None if coordinates is None else as_coordinates(coordinates)
+        self.metric = get_metric(metric)
+        self.hits = 0
+        self.misses = 0
+        self.distance = None
+
+    def __call__(self, i: int, j: int) -> float:
+        return self.distance(i, j)
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def nbytes(self) -> int:
+        return 0
+
+    def stats(self) -> OracleStats:
+        return OracleStats(self.backend, self.hits, self.misses, self.nbytes)
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def neighbor_lists(self, k: int) -> np.ndarray:
+        """
+        Return the k nearest other cities of every city, closest first.
+        """
+        if self.coordinates is None:
+            raise ValueError(f"The {self.backend} oracle has no coordinates to find neighbors with")
+        return metric_neighbor_lists(self.coordinates, k, self.metric)
+
+
+class DenseOracle(DistanceOracle):
+    """
+    Distances looked up in a full (n, n) matrix. Lookups always hit and are not counted.
+
+    The matrix may be asymmetric, with entry [i, j] the cost of going from i to j.
+    """
+
+    backend = "dense"
+
+    def __init__(self, distance_matrix: np.ndarray, coordinates=None, metric="euclidean"):
+        matrix = as_square_matrix(distance_matrix)
+        super().__init__(matrix.shape[0], coordinates, metric)
+        self.matrix = matrix
+        self.symmetric = is_symmetric(distance_matrix)
+        self.distance = lambda i, j: matrix.item(i, j)
+
+    @property
+    def nbytes(self) -> int:
+        return self.matrix.nbytes
+
+    def neighbor_lists(self, k: int) -> np.ndarray:
+        k = min(k, self.n - 1)
+        if k <= 0:
+            return np.empty((self.n, 0), dtype=np.intp)
+        masked = self.matrix.astype(np.float64)
+        np.fill_diagonal(masked, np.inf)
+        candidates = np.argpartition(masked, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(masked, candidates, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1)
+
+
+class NeighborOracle(DistanceOracle):
+    """
+    Distances to each city's k nearest neighbors stored up front; other pairs are computed.
+
+    Local search and Lin-Kernighan mostly ask for a city's distance to its
+    candidate neighbors and tour neighbors, which in a good tour are nearly
+    always among its nearest ones, so most lookups hit for n * k memory.
+    """
+
+    backend = "neighbors"
+
+    def __init__(self, coordinates, n_neighbors: int = 10, pair_distance=None, metric="euclidean"):
+        points = as_coordinates(coordinates)
+        super().__init__(points.shape[0], points, metric)
+        compute = pair_distance or metric_pair_distance(points, self.metric)
+        self._neighbors = super().neighbor_lists(n_neighbors)
+        ids = [[int(city) for city in row if city >= 0] for row in self._neighbors]
+        values = [[compute(i, j) for j in row] for i, row in enumerate(ids)]
+        self._n_entries = sum(len(row) for row in ids)
+
+        def distance(i, j):
+            row = ids[i]
+            if j in row:
+                self.hits += 1
+                return values[i][row.index(j)]
+            row = ids[j]
+            if i in row:
+                self.hits += 1
+                return values[j][row.index(i)]
+            self.misses += 1
+            return compute(i, j)
+
+        self.distance = distance
+
+    @property
+    def nbytes(self) -> int:
+        return self._n_entries * NEIGHBOR_ENTRY_BYTES
+
+    def neighbor_lists(self, k: int) -> np.ndarray:
+        if k <= self._neighbors.shape[1]:
+            return self._neighbors[:, :k]
+        return super().neighbor_lists(k)
+
+
+class LRUOracle(DistanceOracle):
+    """
+    Distances computed on demand, keeping the `capacity` most recently used pairs.
+
+    With capacity 0 nothing is cached and every lookup is a miss, which is the
+    cheapest choice when computing a distance costs no more than a cache probe,
+    as for plain Euclidean coordinates.
+    """
+
+    backend = "lru"
+
+    def __init__(self, coordinates=None, capacity: int = 100_000, pair_distance=None, n_cities: int = None,
+                 metric="euclidean"):
+        if coordinates is None and (pair_distance is None or n_cities is None):
+            raise ValueError("Either coordinates or pair_distance and n_cities must be given")
+        n_cities = n_cities if coordinates is None else len(as_coordinates(coordinates))
+        super().__init__(n_cities, coordinates, metric)
+        compute = pair_distance or metric_pair_distance(coordinates, self.metric)
+        self.capacity = capacity
+        cache = OrderedDict()
+        self._cache = cache
+
+        if capacity <= 0:
+            def distance(i, j):
+                self.misses += 1
+                return compute(i, j)
+        else:
+            def distance(i, j):
+                key = (i, j) if i < j else (j, i)
+                value = cache.get(key)
+                if value is not None:
+                    self.hits += 1
+                    cache.move_to_end(key)
+                    return value
+                self.misses += 1
+                value = cache[key] = compute(i, j)
+                if len(cache) > capacity:
+                    cache.popitem(last=False)
+                return value
+
+        self.distance = distance
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._cache) * LRU_ENTRY_BYTES
+
+
+def choose_backend(n_cities: int, memory_budget: int = DEFAULT_ORACLE_BUDGET, n_neighbors: int = 10,
+                   cheap_distance: bool = True) -> str:
+    """
+    Pick the fastest oracle backend that fits a memory budget.
+
+    A dense float64 matrix is used whenever it fits. Otherwise a neighbor
+    cache pays off only when computing a distance costs more than probing a
+    cache, so Euclidean or Manhattan coordinates (cheap_distance) are computed on
+    the fly and expensive distances get the neighbor cache, or an LRU if even
+    that does not fit.
+    """
+    if n_cities * n_cities * 8 <= memory_budget:
+        return "dense"
+    if not cheap_distance and n_cities * n_neighbors * NEIGHBOR_ENTRY_BYTES <= memory_budget:
+        return "neighbors"
+    return "lru"
+
+
+def make_oracle(distance_matrix: np.ndarray = None, coordinates=None, pair_distance=None, n_cities: int = None,
+                backend: str = "auto", memory_budget: int = DEFAULT_ORACLE_BUDGET,
+                n_neighbors: int = 10, metric="euclidean") -> DistanceOracle:
+    """
+    Build a distance oracle over a matrix, coordinates or a pair distance function.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix; always served by the dense backend.
+    - coordinates: (n, 2) city coordinates, measured with `metric` unless pair_distance is given.
+    - pair_distance: d(i, j) callable for distances no registered metric covers.
+    - n_cities (int): Number of cities when neither a matrix nor coordinates is given.
+    - backend (str): "dense", "neighbors", "lru" or "auto" (default is "auto").
+    - memory_budget (int): Bytes the oracle may hold (default is 256 MiB).
+    - n_neighbors (int): Neighbors cached per city by the neighbors backend (default is 10).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+
+    Returns:
+    DistanceOracle: The oracle; its stats() report hits and misses.
+    """
+    if isinstance(distance_matrix, DistanceOracle):
+        return distance_matrix
+    if distance_matrix is not None:
+        return DenseOracle(distance_matrix, coordinates)
+    if coordinates is None and pair_distance is None:
+        raise ValueError("Either distance_matrix, coordinates or pair_distance must be given")
+    if coordinates is not None:
+        n_cities = len(as_coordinates(coordinates))
+    elif n_cities is None:
+        raise ValueError("n_cities is required with a pair_distance and no coordinates")
+
+    metric = get_metric(metric)
+    cheap = pair_distance is None and metric.name in CHEAP_METRICS
+    capacity = memory_budget // LRU_ENTRY_BYTES
+    if backend == "auto":
+        backend = choose_backend(n_cities, memory_budget, n_neighbors, cheap_distance=cheap)
+        if backend == "neighbors" and coordinates is None:
+            backend = "lru"
+        if cheap:
+            capacity = 0
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected 'auto' or one of {BACKENDS}")
+
+    if backend == "dense":
+        if pair_distance is None:
+            return DenseOracle(metric_distance_matrix(coordinates, metric), coordinates, metric)
+        matrix = np.array([[pair_distance(i, j) for j in range(n_cities)] for i in range(n_cities)], dtype=np.float64)
+        return DenseOracle(matrix, coordinates, metric)
+    if backend == "neighbors":
+        if coordinates is None:
+            raise ValueError("The neighbors backend needs coordinates to find neighbors")
+        return NeighborOracle(coordinates, n_neighbors, pair_distance, metric)
+    return LRUOracle(coordinates, capacity, pair_distance, n_cities, metric)
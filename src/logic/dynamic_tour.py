@@ -0,0 +1,326 @@
+import math
+from collections import deque
+
+import numpy as np
+
+from logic.construction import greedy_edge_tour
+from logic.distance_matrix import as_coordinates
+from logic.spatial_index import SpatialIndex
+
+EPSILON = 1e-9  # smallest gain accepted as an improvement
+MAX_SEGMENT = 3  # longest path Or-opt repair moves
+
+
+class DynamicTour:
+    """
+    Closed Euclidean tour over a city set that changes one city at a time.
+
+    The tour is a doubly linked list with the length of every edge cached
+    next to it, and the cities live in a logic.spatial_index.SpatialIndex,
+    so inserting, removing and moving a city never touch the whole tour:
+    insert tries the edges at the n_neighbors closest cities for the
+    cheapest insertion, remove splices the city out, and move does both
+    while keeping the city's id. The length is updated from the cached
+    edges instead of being summed again.
+
+    After every change a bounded repair runs 2-opt and Or-opt moves from
+    the touched cities outward, examining at most repair_budget cities and
+    never reversing more than max_reverse cities, so an update takes about
+    the same time on 50 or 50k cities.
+
+    City ids are positions in the initial coordinates followed by the ids
+    returned by insert; ids of removed cities are not reused.
+
+    Parameters:
+    - coordinates: (n, 2) initial city coordinates, such as a list of (x, y) tuples from data.cities (default is none).
+    - tour: Initial closed tour over them; defaults to logic.construction.greedy_edge_tour.
+    - n_neighbors (int): Closest cities whose edges insertion and repair try (default is 8).
+    - repair (bool): Run the local repair after each change (default is True).
+    - max_reverse (int): Most cities a 2-opt repair move may reverse (default is 50).
+    - repair_budget (int): Most cities a repair examines per change (default is 32).
+    """
+
+    def __init__(self, coordinates=(), tour=None, n_neighbors: int = 8, repair: bool = True,
+                 max_reverse: int = 50, repair_budget: int = 32):
+        if n_neighbors < 1:
+            raise ValueError("n_neighbors must be at least 1")
+        points = as_coordinates(coordinates)
+        n_cities = points.shape[0]
+        tour = greedy_edge_tour(points) if tour is None else np.asarray(tour, dtype=np.intp)
+        if tour.size != n_cities or not np.array_equal(np.sort(tour), np.arange(n_cities)):
+            raise ValueError(f"tour must be a permutation of the {n_cities} cities")
+
+        self.n_neighbors = n_neighbors
+        self.repair = repair
+        self.max_reverse = max_reverse
+        self.repair_budget = repair_budget
+        self._index = SpatialIndex(points)
+        self._xs = points[:, 0].tolist()
+        self._ys = points[:, 1].tolist()
+        self._slot = list(range(n_cities))
+        self._city = list(range(n_cities))
+        successors = np.empty(n_cities, dtype=np.intp)
+        successors[tour] = np.roll(tour, -1)
+        predecessors = np.empty(n_cities, dtype=np.intp)
+        predecessors[tour] = np.roll(tour, 1)
+        costs = np.hypot(*(points[successors] - points).T)
+        self._succ = successors.tolist()
+        self._pred = predecessors.tolist()
+        self._cost = costs.tolist()
+        self.length = float(costs.sum())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, city: int) -> bool:
+        return 0 <= city < len(self._slot) and self._slot[city] >= 0
+
+    def _check(self, city: int) -> None:
+        if city not in self:
+            raise KeyError(f"City {city} is not in the tour")
+
+    def _distance(self, a: int, b: int) -> float:
+        return math.hypot(self._xs[a] - self._xs[b], self._ys[a] - self._ys[b])
+
+    def _nearest(self, x: float, y: float, k: int) -> list[int]:
+        _, slots = self._index.nearest((x, y), k)
+        return [self._city[slot] for slot in slots.tolist()]
+
+    def _link_after(self, city: int, after: int) -> None:
+        """Splice a detached city into the edge leaving after."""
+        following = self._succ[after]
+        before_cost = self._distance(after, city)
+        after_cost = self._distance(city, following)
+        self.length += before_cost + after_cost - self._cost[after]
+        self._cost[after] = before_cost
+        self._cost[city] = after_cost
+        self._succ[after] = city
+        self._pred[city] = after
+        self._succ[city] = following
+        self._pred[following] = city
+
+    def _unlink(self, city: int) -> None:
+        """Splice a city out, joining its neighbors."""
+        previous, following = self._pred[city], self._succ[city]
+        cost = self._distance(previous, following)
+        self.length += cost - self._cost[previous] - self._cost[city]
+        self._cost[previous] = cost
+        self._succ[previous] = following
+        self._pred[following] = previous
+
+    def _cheapest_edge(self, city: int) -> int:
+        """Return the city whose outgoing edge is cheapest to route through city."""
+        best, best_delta = -1, math.inf
+        for near in self._nearest(self._xs[city], self._ys[city], self.n_neighbors):
+            for after in (near, self._pred[near]):
+                delta = (self._distance(after, city) + self._distance(city, self._succ[after])
+                         - self._cost[after])
+                if delta < best_delta:
+                    best, best_delta = after, delta
+        return best
+
+    def _place(self, city: int) -> None:
+        """Add a detached city to the index and link it in at its cheapest position."""
+        after = self._cheapest_edge(city) if len(self._index) else city
+        self._slot[city] = self._index.add((self._xs[city], self._ys[city]))
+        self._city.append(city)
+        self._succ[city] = self._pred[city] = city
+        self._cost[city] = 0.0
+        if after != city:
+            self._link_after(city, after)
+
+    def insert(self, point) -> int:
+        """
+        Insert a city at its cheapest position among the edges around its nearest cities.
+
+        Parameters:
+        - point (tuple): (x, y) coordinates of the new city.
+
+        Returns:
+        int: Id of the new city.
+        """
+        x, y = (float(value) for value in point)
+        city = len(self._slot)
+        self._xs.append(x)
+        self._ys.append(y)
+        self._succ.append(city)
+        self._pred.append(city)
+        self._cost.append(0.0)
+        self._slot.append(-1)
+        self._place(city)
+        self._repair((city, self._pred[city], self._succ[city]))
+        return city
+
+    def remove(self, city: int) -> None:
+        """
+        Remove a city, joining its two neighbors.
+        """
+        self._check(city)
+        previous, following = self._pred[city], self._succ[city]
+        self._unlink(city)
+        self._index.remove(self._slot[city])
+        self._slot[city] = -1
+        if not len(self._index):
+            self.length = 0.0
+        self._repair((previous, following))
+
+    def move(self, city: int, point) -> None:
+        """
+        Move a city to new coordinates and reinsert it at its cheapest position there.
+        """
+        self._check(city)
+        previous, following = self._pred[city], self._succ[city]
+        self._unlink(city)
+        self._index.remove(self._slot[city])
+        self._xs[city], self._ys[city] = (float(value) for value in point)
+        self._place(city)
+        self._repair((city, self._pred[city], self._succ[city], previous, following))
+
+    def next(self, city: int) -> int:
+        self._check(city)
+        return self._succ[city]
+
+    def prev(self, city: int) -> int:
+        self._check(city)
+        return self._pred[city]
+
+    def point(self, city: int) -> tuple[float, float]:
+        self._check(city)
+        return self._xs[city], self._ys[city]
+
+    def order(self, start: int = None) -> np.ndarray:
+        """
+        Return the tour as city ids, beginning at start (default is the lowest id).
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        if start is None:
+            start = next(city for city, slot in enumerate(self._slot) if slot >= 0)
+        self._check(start)
+        tour = [start]
+        city = self._succ[start]
+        while city != start:
+            tour.append(city)
+            city = self._succ[city]
+        return np.array(tour, dtype=np.intp)
+
+    def recompute_length(self) -> float:
+        """
+        Sum the tour length from scratch, reset the incremental length to it and return it.
+
+        Incremental updates add rounding error, which this clears.
+        """
+        tour = self.order()
+        self.length = float(sum(self._distance(a, b) for a, b in zip(tour.tolist(), np.roll(tour, -1).tolist())))
+        return self.length
+
+    def _reverse(self, before: int, first: int, last: int, after: int) -> None:
+        """
+        Turn before -> first ... last -> after into before -> last ... first -> after.
+        """
+        path = [first]
+        while path[-1] != last:
+            path.append(self._succ[path[-1]])
+        old_costs = [self._cost[city] for city in path]
+        for city in path:
+            self._succ[city], self._pred[city] = self._pred[city], self._succ[city]
+        for position in range(1, len(path)):
+            self._cost[path[position]] = old_costs[position - 1]
+        old = self._cost[before] + old_costs[-1]
+        self._succ[before], self._pred[last] = last, before
+        self._succ[first], self._pred[after] = after, first
+        self._cost[before] = self._distance(before, last)
+        self._cost[first] = self._distance(first, after)
+        self.length += self._cost[before] + self._cost[first] - old
+
+    def _reaches(self, first: int, last: int) -> bool:
+        """Return True if last follows first within max_reverse steps."""
+        city = first
+        for _ in range(self.max_reverse):
+            if city == last:
+                return True
+            city = self._succ[city]
+        return False
+
+    def _two_opt(self, a: int, b: int, c: int, d: int) -> bool:
+        """
+        Replace edges a -> b and c -> d by a -> c and b -> d, reversing whichever side is short enough.
+        """
+        if self._reaches(b, c):
+            self._reverse(a, b, c, d)
+        elif self._reaches(d, a):
+            self._reverse(c, d, a, b)
+        else:
+            return False
+        return True
+
+    def _try_two_opt(self, a: int, neighbors: list[int]):
+        for forward in (True, False):
+            b = self._succ[a] if forward else self._pred[a]
+            d_ab = self._distance(a, b)
+            for c in neighbors:
+                d_ac = self._distance(a, c)
+                if d_ac >= d_ab:
+                    break
+                d = self._succ[c] if forward else self._pred[c]
+                if d == a or c == b:
+                    continue
+                if d_ac + self._distance(b, d) - d_ab - self._distance(c, d) < -EPSILON:
+                    applied = self._two_opt(a, b, c, d) if forward else self._two_opt(d, c, b, a)
+                    if applied:
+                        return a, b, c, d
+        return None
+
+    def _try_or_opt(self, a: int, neighbors: list[int]):
+        segment = [a]
+        previous = self._pred[a]
+        for _ in range(min(MAX_SEGMENT, len(self) - 3)):
+            last = segment[-1]
+            following = self._succ[last]
+            removed = self._cost[previous] + self._cost[last] - self._distance(previous, following)
+            if removed > EPSILON:
+                candidates = neighbors if len(segment) == 1 else self._nearest(
+                    self._xs[last], self._ys[last], self.n_neighbors + 1)
+                for c in candidates:
+                    if c in segment:
+                        continue
+                    for after in (c, self._pred[c]):
+                        e = self._succ[after]
+                        if after == previous or after in segment or e in segment:
+                            continue
+                        keep = self._distance(after, a) + self._distance(last, e)
+                        flip = self._distance(after, last) + self._distance(a, e)
+                        if min(keep, flip) - self._cost[after] - removed < -EPSILON:
+                            for city in segment:
+                                self._unlink(city)
+                            for city in (segment if keep <= flip else segment[::-1]):
+                                self._link_after(city, after)
+                                after = city
+                            return previous, following, a, last, e
+            segment.append(following)
+            if self._succ[following] == previous:
+                break
+        return None
+
+    def _repair(self, cities) -> None:
+        """
+        Apply improving 2-opt and Or-opt moves around the given cities, examining at most repair_budget cities.
+        """
+        if not self.repair or len(self) < 5:
+            return
+        queue = deque(city for city in dict.fromkeys(cities) if city in self)
+        queued = set(queue)
+        for _ in range(self.repair_budget):
+            if not queue:
+                break
+            city = queue.popleft()
+            queued.discard(city)
+            neighbors = [near for near in self._nearest(self._xs[city], self._ys[city], self.n_neighbors + 1)
+                         if near != city]
+            touched = self._try_two_opt(city, neighbors) or self._try_or_opt(city, neighbors)
+            if touched is None:
+                continue
+            for other in (city, *touched):
+                if other not in queued:
+                    queue.append(other)
+                    queued.add(other)
@@ -0,0 +1,330 @@
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from logic.construction import as_square_matrix
+from logic.instrumentation import active, phase
+from logic.population import score_population
+from logic.progress import Progress, exhaust
+
+
+@dataclass
+class GeneticResult:
+    """
+    Outcome of a genetic algorithm run.
+
+    Attributes:
+    - tour (np.ndarray): Best closed tour found, as city indices.
+    - length (float): Length of that tour.
+    - history (list[float]): Best length over all islands after each generation.
+    """
+
+    tour: np.ndarray
+    length: float
+    history: list = field(default_factory=list)
+
+
+def order_crossover(parent_a: np.ndarray, parent_b: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Create a child with order crossover (OX).
+
+    A random slice of parent_a is kept in place and the remaining cities are
+    filled in the order they appear in parent_b, starting after the slice.
+    """
+    n_cities = parent_a.size
+    start, stop = np.sort(rng.choice(n_cities + 1, size=2, replace=False))
+    child = np.empty_like(parent_a)
+    kept = parent_a[start:stop]
+    child[start:stop] = kept
+
+    taken = np.zeros(n_cities, dtype=bool)
+    taken[kept] = True
+    rotated = np.roll(parent_b, -stop)
+    remaining = rotated[~taken[rotated]]
+    slots = np.roll(np.arange(n_cities), -stop)[: n_cities - kept.size]
+    child[slots] = remaining
+    return child
+
+
+def inversion_mutation(tour: np.ndarray, rng: np.random.Generator) -> None:
+    """
+    Reverse a random segment of a tour in place.
+    """
+    start, stop = np.sort(rng.choice(tour.size + 1, size=2, replace=False))
+    tour[start:stop] = tour[start:stop][::-1]
+
+
+def tournament_selection(
+    fitness: np.ndarray, n_selected: int, tournament_size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Pick n_selected indices, each the shortest tour of a random tournament.
+    """
+    contestants = rng.integers(0, fitness.size, size=(n_selected, tournament_size))
+    winners = np.argmin(fitness[contestants], axis=1)
+    return contestants[np.arange(n_selected), winners]
+
+
+def evolve_generation(
+    population: np.ndarray,
+    fitness: np.ndarray,
+    distance_matrix: np.ndarray,
+    rng: np.random.Generator,
+    elite_size: int = 2,
+    tournament_size: int = 3,
+    mutation_rate: float = 0.2,
+) -> None:
+    """
+    Replace a population and its fitness in place with the next generation.
+
+    The elite_size shortest tours survive unchanged, the rest are bred by
+    tournament selection, order crossover and inversion mutation, then
+    scored in one batched pass.
+    """
+    size = population.shape[0]
+    elite_size = min(elite_size, size)
+    order = np.argsort(fitness, kind="stable")
+    next_population = np.empty_like(population)
+    next_population[:elite_size] = population[order[:elite_size]]
+
+    n_children = size - elite_size
+    parents = tournament_selection(fitness, 2 * n_children, tournament_size, rng).reshape(n_children, 2)
+    mutate = rng.random(n_children) < mutation_rate
+    for child_index, (a, b) in enumerate(parents):
+        child = order_crossover(population[a], population[b], rng)
+        if mutate[child_index]:
+            inversion_mutation(child, rng)
+        next_population[elite_size + child_index] = child
+
+    population[:] = next_population
+    fitness[:] = score_population(population, distance_matrix)
+
+
+class SharedArray:
+    """
+    NumPy array backed by multiprocessing.shared_memory.
+
+    Workers attach by name through descriptor(), so the data is never pickled.
+    """
+
+    __slots__ = ("shm", "array", "_owner")
+
+    def __init__(self, shm: shared_memory.SharedMemory, shape: tuple, dtype, owner: bool):
+        self.shm = shm
+        self.array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        self._owner = owner
+
+    @classmethod
+    def create(cls, shape: tuple, dtype) -> "SharedArray":
+        nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=nbytes), shape, dtype, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: tuple) -> "SharedArray":
+        name, shape, dtype = descriptor
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype, owner=False)
+
+    def descriptor(self) -> tuple:
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    def close(self) -> None:
+        self.array = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+class _LocalArray:
+    """
+    In-process stand-in for SharedArray when no worker pool is used.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+
+_worker_arrays = {}
+
+
+def _init_worker(descriptors: dict) -> None:
+    """
+    Attach a pool worker to the shared distance matrix, populations and fitness.
+    """
+    for key, descriptor in descriptors.items():
+        _worker_arrays[key] = SharedArray.attach(descriptor)
+
+
+def _run_islands(task: tuple, arrays: dict = None) -> np.ndarray:
+    """
+    Evolve a group of islands in place for a number of generations.
+
+    Returns an (generations, islands) array of the best length per island
+    after each generation.
+    """
+    islands, generations, seeds, parameters = task
+    arrays = _worker_arrays if arrays is None else arrays
+    matrix = arrays["matrix"].array
+    populations = arrays["populations"].array
+    fitness = arrays["fitness"].array
+
+    best = np.empty((generations, len(islands)))
+    for column, (island, seed) in enumerate(zip(islands, seeds)):
+        rng = np.random.default_rng(seed)
+        for generation in range(generations):
+            evolve_generation(populations[island], fitness[island], matrix, rng, **parameters)
+            best[generation, column] = fitness[island].min()
+    return best
+
+
+def _migrate(populations: np.ndarray, fitness: np.ndarray, migrants: int) -> None:
+    """
+    Copy the best tours of each island over the worst tours of the next island in a ring.
+    """
+    n_islands = populations.shape[0]
+    if n_islands < 2 or migrants <= 0:
+        return
+    order = np.argsort(fitness, axis=1, kind="stable")
+    best = order[:, :migrants]
+    worst = order[:, ::-1][:, :migrants]
+    incoming_tours = [populations[island, best[island]].copy() for island in range(n_islands)]
+    incoming_fitness = [fitness[island, best[island]].copy() for island in range(n_islands)]
+    for island in range(n_islands):
+        target = (island + 1) % n_islands
+        populations[target, worst[target]] = incoming_tours[island]
+        fitness[target, worst[target]] = incoming_fitness[island]
+
+
+def iter_genetic_algorithm(
+    distance_matrix: np.ndarray,
+    population_size: int = 100,
+    generations: int = 500,
+    islands: int = 1,
+    migration_interval: int = 25,
+    migrants: int = 2,
+    elite_size: int = 2,
+    tournament_size: int = 3,
+    mutation_rate: float = 0.2,
+    workers: int = None,
+    seed: int = None,
+) -> GeneticResult:
+    """
+    Solve the TSP with an island-model genetic algorithm, yielding progress.
+
+    Each island evolves its own population with tournament selection, order
+    crossover and inversion mutation. Every migration_interval generations
+    the best tours of each island replace the worst of the next one. With
+    workers > 1, islands are spread over a process pool; the distance matrix,
+    populations and fitness live in shared memory so only small task tuples
+    and per-generation best lengths cross process boundaries. A Progress
+    snapshot is yielded after every migration interval; closing the
+    generator shuts the pool down.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix.
+    - population_size (int): Tours per island (default is 100).
+    - generations (int): Number of generations (default is 500).
+    - islands (int): Number of islands; use at least `workers` for full parallelism (default is 1).
+    - migration_interval (int): Generations between migrations (default is 25).
+    - migrants (int): Tours sent to the next island at each migration (default is 2).
+    - elite_size (int): Shortest tours kept unchanged each generation (default is 2).
+    - tournament_size (int): Contestants per tournament (default is 3).
+    - mutation_rate (float): Probability that a child is mutated (default is 0.2).
+    - workers (int): Worker processes; runs in-process when None or 1.
+    - seed (int): Seed for reproducible runs.
+
+    Returns:
+    GeneticResult: The best tour, its length and the best length per generation.
+    """
+    start = time.perf_counter()
+    matrix = np.ascontiguousarray(as_square_matrix(distance_matrix))
+    n_cities = matrix.shape[0]
+    if population_size < 2:
+        raise ValueError("population_size must be at least 2")
+    if islands < 1:
+        raise ValueError("islands must be at least 1")
+
+    seeds = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seeds.spawn(1)[0])
+    parameters = {"elite_size": elite_size, "tournament_size": tournament_size, "mutation_rate": mutation_rate}
+    shape = (islands, population_size, n_cities)
+    dtype = np.int32
+
+    workers = 1 if workers is None else max(1, min(workers, islands))
+    if workers == 1:
+        arrays = {
+            "matrix": _LocalArray(matrix),
+            "populations": _LocalArray(np.empty(shape, dtype=dtype)),
+            "fitness": _LocalArray(np.empty(shape[:2])),
+        }
+        pool = None
+    else:
+        arrays = {
+            "matrix": SharedArray.create(matrix.shape, matrix.dtype),
+            "populations": SharedArray.create(shape, dtype),
+            "fitness": SharedArray.create(shape[:2], np.float64),
+        }
+        arrays["matrix"].array[:] = matrix
+        descriptors = {key: shared.descriptor() for key, shared in arrays.items()}
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(descriptors,))
+
+    try:
+        populations = arrays["populations"].array
+        fitness = arrays["fitness"].array
+        populations[:] = np.argsort(rng.random(shape), axis=2)
+        for island in range(islands):
+            fitness[island] = score_population(populations[island], matrix)
+        island, member = np.unravel_index(np.argmin(fitness), fitness.shape)
+        tour = populations[island, member].astype(np.intp)
+        length = float(fitness[island, member])
+
+        groups = np.array_split(np.arange(islands), workers)
+        history = []
+        remaining = generations
+        stats = active()
+        while remaining > 0:
+            epoch = min(migration_interval, remaining)
+            island_seeds = seeds.spawn(islands)
+            tasks = [
+                (group.tolist(), epoch, [island_seeds[island] for island in group], parameters)
+                for group in groups
+            ]
+            with phase("evolve"):
+                if pool is None:
+                    results = [_run_islands(task, arrays) for task in tasks]
+                else:
+                    results = pool.map(_run_islands, tasks)
+            if stats is not None:
+                stats.count("generations", epoch)
+                stats.count("tours_evaluated", epoch * islands * population_size)
+            history.extend(np.hstack(results).min(axis=1).tolist())
+            remaining -= epoch
+
+            island, member = np.unravel_index(np.argmin(fitness), fitness.shape)
+            tour = populations[island, member].astype(np.intp)
+            length = float(fitness[island, member])
+            yield Progress(len(history), tour, length, time.perf_counter() - start)
+            if remaining > 0:
+                with phase("migrate"):
+                    _migrate(populations, fitness, migrants)
+
+        return GeneticResult(tour, length, history)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            for shared in arrays.values():
+                shared.close()
+
+
+def genetic_algorithm(*args, **kwargs) -> GeneticResult:
+    """
+    Solve the TSP with an island-model genetic algorithm.
+
+    Takes the same arguments as iter_genetic_algorithm and returns its final GeneticResult.
+    """
+    return exhaust(iter_genetic_algorithm(*args, **kwargs))
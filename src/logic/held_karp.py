@@ -0,0 +1,132 @@
+import time
+
+import numpy as np
+
+from logic.construction import as_square_matrix, nearest_neighbor_tour
+from logic.distance_matrix import path_length
+from logic.progress import Progress, exhaust
+
+DEFAULT_MEMORY_LIMIT = 1024 * 1024 * 1024  # bytes for the DP and parent tables
+
+
+def held_karp_memory(n_cities: int, dtype=np.float64) -> int:
+    """
+    Return the bytes needed by the Held-Karp tables for an n-city instance.
+    """
+    if n_cities < 3:
+        return 0
+    subsets = 1 << (n_cities - 1)
+    parent_itemsize = np.dtype(_parent_dtype(n_cities)).itemsize
+    return subsets * (n_cities - 1) * (np.dtype(dtype).itemsize + parent_itemsize)
+
+
+def _parent_dtype(n_cities: int):
+    """
+    Return the smallest integer type able to hold a city index.
+    """
+    return np.int8 if n_cities <= 127 else np.int16
+
+
+def _masks_by_size(bits: int) -> list[np.ndarray]:
+    """
+    Group every subset mask of `bits` items by its number of set bits.
+    """
+    masks = np.arange(1 << bits, dtype=np.int64)
+    popcount = np.zeros(masks.size, dtype=np.int8)
+    for bit in range(bits):
+        popcount += ((masks >> bit) & 1).astype(np.int8)
+    order = np.argsort(popcount, kind="stable")
+    boundaries = np.searchsorted(popcount[order], np.arange(bits + 2))
+    return [order[boundaries[size]:boundaries[size + 1]] for size in range(bits + 1)]
+
+
+def iter_held_karp(distance_matrix: np.ndarray, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+    """
+    Solve the TSP exactly with the Held-Karp bitmask dynamic program, yielding progress.
+
+    City 0 is fixed as the start. dp[mask, j] holds the shortest path that
+    leaves city 0, visits the cities in mask (bit k stands for city k + 1)
+    and ends at city j + 1. Each subset size is processed as one vectorized
+    layer. Runs in O(n^2 * 2^n) time. Until the optimum is known, the
+    Progress snapshot yielded after each layer (generation = subset size)
+    carries a nearest-neighbor tour.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix.
+      Square matrices may be asymmetric, with entry [i, j] the cost of going from i to j.
+    - memory_limit (int): Maximum bytes allowed for the DP tables.
+
+    Returns:
+    tuple[np.ndarray, float]: The optimal closed tour as city indices starting at 0, and its length.
+
+    Raises:
+    MemoryError: If the DP tables would exceed memory_limit.
+    """
+    start = time.perf_counter()
+    matrix = as_square_matrix(distance_matrix)
+    n_cities = matrix.shape[0]
+
+    if n_cities <= 2:
+        tour = np.arange(n_cities)
+        length = path_length(tour, matrix, closed=True)
+        yield Progress(0, tour, length, time.perf_counter() - start)
+        return tour, length
+
+    required = held_karp_memory(n_cities, matrix.dtype)
+    if required > memory_limit:
+        raise MemoryError(
+            f"Held-Karp on {n_cities} cities needs {required} bytes, above the limit of {memory_limit}"
+        )
+
+    bits = n_cities - 1
+    inner = matrix[1:, 1:]
+    dp = np.full((1 << bits, bits), np.inf, dtype=matrix.dtype)
+    parent = np.full((1 << bits, bits), -1, dtype=_parent_dtype(n_cities))
+
+    singletons = 1 << np.arange(bits)
+    dp[singletons, np.arange(bits)] = matrix[0, 1:]
+
+    incumbent = nearest_neighbor_tour(matrix)
+    incumbent_length = path_length(incumbent, matrix, closed=True)
+    yield Progress(1, incumbent, incumbent_length, time.perf_counter() - start)
+
+    layers = _masks_by_size(bits)
+    for size in range(2, bits + 1):
+        masks = layers[size]
+        for end in range(bits):
+            with_end = masks[(masks >> end) & 1 == 1]
+            previous = with_end ^ (1 << end)
+            candidates = dp[previous] + inner[:, end]
+            best = np.argmin(candidates, axis=1)
+            dp[with_end, end] = candidates[np.arange(best.size), best]
+            parent[with_end, end] = best
+        yield Progress(size, incumbent, incumbent_length, time.perf_counter() - start)
+
+    full = (1 << bits) - 1
+    closing = dp[full] + matrix[1:, 0]
+    end = int(np.argmin(closing))
+    length = float(closing[end])
+
+    tour = [end]
+    mask = full
+    while True:
+        previous = int(parent[mask, end])
+        mask ^= 1 << end
+        if previous < 0:
+            break
+        tour.append(previous)
+        end = previous
+    tour.append(-1)
+    tour = np.array(tour[::-1], dtype=np.intp) + 1
+    yield Progress(n_cities, tour, length, time.perf_counter() - start)
+    return tour, length
+
+
+def held_karp(*args, **kwargs) -> tuple[np.ndarray, float]:
+    """
+    Solve the TSP exactly with the Held-Karp bitmask dynamic program.
+
+    Takes the same arguments as iter_held_karp and returns the optimal
+    closed tour (starting at city 0) and its length.
+    """
+    return exhaust(iter_held_karp(*args, **kwargs))
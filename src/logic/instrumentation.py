@@ -0,0 +1,276 @@
+import contextvars
+import cProfile
+import json
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+
+DEFAULT_PROFILE_ROWS = 20  # functions listed in a snapshot's profile, by cumulative time
+RATE_WINDOW = 0.5  # seconds between refreshes of the live counter rates
+
+_active = contextvars.ContextVar("instrumentation", default=None)
+_no_phase = nullcontext()
+
+
+@dataclass
+class PhaseTiming:
+    """
+    Accumulated wall time of one phase.
+
+    Attributes:
+    - seconds (float): Total seconds spent in the phase.
+    - calls (int): Number of times the phase was entered.
+    """
+
+    seconds: float = 0.0
+    calls: int = 0
+
+
+def active():
+    """
+    Return the Instrumentation active in the current context, or None.
+
+    Solvers call this once when they start; every later hook is skipped
+    behind an `is not None` check, so an uninstrumented run pays nothing.
+    """
+    return _active.get()
+
+
+def phase(name: str):
+    """
+    Time a block as a phase of the active Instrumentation, or do nothing when none is active.
+    """
+    instrumentation = _active.get()
+    return _no_phase if instrumentation is None else instrumentation.phase(name)
+
+
+class Instrumentation:
+    """
+    Counters, nested phase timers and optional profiles of a solver run.
+
+    Use it as a context manager: while active, the solvers of this package
+    find it through active() and record what they do, such as
+    "distance_evaluations", "moves_tried" and "moves_accepted", and time
+    their phases. Phases opened inside other phases are keyed by their
+    path, like "kicks/optimize". With profile, cProfile records the active
+    thread, and with trace_memory tracemalloc records the peak memory.
+
+    Snapshots are plain dicts, so they can be sent between processes and
+    exported with to_json or prometheus_text.
+
+    Parameters:
+    - solver (str): Solver label of the exported metrics (default is "solver").
+    - labels (dict): More metric labels, such as the instance (default is none).
+    - profile (bool): Capture a cProfile profile while active (default is False).
+    - trace_memory (bool): Measure memory with tracemalloc while active (default is False).
+    """
+
+    def __init__(self, solver: str = "solver", labels: dict = None, profile: bool = False,
+                 trace_memory: bool = False):
+        self.solver = solver
+        self.labels = {"solver": solver, **(labels or {})}
+        self.counters = {}
+        self.phases = {}
+        self.profiler = cProfile.Profile() if profile else None
+        self.trace_memory = trace_memory
+        self.memory = None
+        self._stack = []
+        self._token = None
+        self._started = None
+        self._elapsed = 0.0
+        self._owns_tracing = False
+        self._rate_mark = None
+        self._rates = {}
+
+    def start(self) -> "Instrumentation":
+        """
+        Make this the active instrumentation of the current context and start the profilers.
+        """
+        if self._token is not None:
+            raise RuntimeError("Instrumentation is already active")
+        self._token = _active.set(self)
+        self._started = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        if self.trace_memory:
+            self._owns_tracing = not tracemalloc.is_tracing()
+            if self._owns_tracing:
+                tracemalloc.start()
+            else:
+                tracemalloc.reset_peak()
+        return self
+
+    def stop(self) -> None:
+        """
+        Deactivate and stop the profilers; counters and timings are kept.
+        """
+        if self._token is None:
+            return
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.trace_memory:
+            self.memory = self._traced_memory()
+            if self._owns_tracing:
+                tracemalloc.stop()
+        self._elapsed += time.perf_counter() - self._started
+        _active.reset(self._token)
+        self._token = None
+
+    def __enter__(self) -> "Instrumentation":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        return self._token is not None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds this instrumentation has been active."""
+        if self._token is None:
+            return self._elapsed
+        return self._elapsed + time.perf_counter() - self._started
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def counting(self, function, name: str = "distance_evaluations"):
+        """
+        Wrap a function, such as a distance oracle's distance, to count its calls under name.
+        """
+        counters = self.counters
+        counters.setdefault(name, 0)
+
+        def counted(*args):
+            counters[name] += 1
+            return function(*args)
+
+        return counted
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time the enclosed block, nested under the phases already open.
+        """
+        self._stack.append(name)
+        key = "/".join(self._stack)
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.phases.get(key)
+            if timing is None:
+                timing = self.phases[key] = PhaseTiming()
+            timing.seconds += time.perf_counter() - begin
+            timing.calls += 1
+            self._stack.pop()
+
+    def rates(self, window: float = RATE_WINDOW) -> dict:
+        """
+        Return the per-second rate of every counter, refreshed at most every window seconds.
+
+        The first call starts the measurement and returns an empty dict; it is
+        meant to be polled, for example once per frame by a live view.
+        """
+        now = time.perf_counter()
+        if self._rate_mark is None:
+            self._rate_mark = (now, dict(self.counters))
+        elif now - self._rate_mark[0] >= window:
+            then, seen = self._rate_mark
+            self._rates = {name: (value - seen.get(name, 0)) / (now - then)
+                           for name, value in dict(self.counters).items()}
+            self._rate_mark = (now, dict(self.counters))
+        return dict(self._rates)
+
+    def _traced_memory(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory()
+        return {"current": current, "peak": peak}
+
+    def profile_rows(self, top: int = DEFAULT_PROFILE_ROWS) -> list:
+        """
+        Return the top functions of the cProfile capture by cumulative time.
+
+        Empty while the profiler is running or when profile was not requested.
+        """
+        if self.profiler is None or self._token is not None:
+            return []
+        try:
+            entries = pstats.Stats(self.profiler).stats
+        except TypeError:  # nothing was profiled
+            return []
+        rows = sorted(entries.items(), key=lambda entry: entry[1][3], reverse=True)[:top]
+        return [{"function": f"{file}:{line}({function})", "calls": calls, "total": total,
+                 "cumulative": cumulative}
+                for (file, line, function), (_, calls, total, cumulative, _) in rows]
+
+    def snapshot(self, top: int = DEFAULT_PROFILE_ROWS) -> dict:
+        """
+        Return labels, elapsed seconds, counters, phase timings and, when captured, memory and profile.
+        """
+        record = {
+            "labels": dict(self.labels),
+            "elapsed": self.elapsed,
+            "counters": dict(self.counters),
+            "phases": {name: {"seconds": timing.seconds, "calls": timing.calls}
+                       for name, timing in list(self.phases.items())},
+        }
+        if self.trace_memory:
+            record["memory"] = self._traced_memory() if self._token is not None else self.memory
+        if self.profiler is not None:
+            record["profile"] = self.profile_rows(top)
+        return record
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "tsp") -> str:
+        return prometheus_text([self.snapshot()], prefix)
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _label_text(labels: dict) -> str:
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{_metric_name(key)}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def prometheus_text(snapshots: list, prefix: str = "tsp") -> str:
+    """
+    Render Instrumentation snapshots in the Prometheus text exposition format.
+
+    Every counter becomes a <prefix>_<name>_total counter and phases become
+    <prefix>_phase_seconds_total and <prefix>_phase_calls_total with a phase
+    label; the snapshot labels tell the runs apart.
+    """
+    series = {}
+
+    def add(name: str, kind: str, labels: dict, value) -> None:
+        series.setdefault((name, kind), []).append(f"{name}{_label_text(labels)} {value}")
+
+    for snapshot in snapshots:
+        labels = snapshot["labels"]
+        add(f"{prefix}_elapsed_seconds", "gauge", labels, snapshot["elapsed"])
+        for counter, value in snapshot["counters"].items():
+            add(f"{prefix}_{_metric_name(counter)}_total", "counter", labels, value)
+        for name, timing in snapshot["phases"].items():
+            phase_labels = {**labels, "phase": name}
+            add(f"{prefix}_phase_seconds_total", "counter", phase_labels, timing["seconds"])
+            add(f"{prefix}_phase_calls_total", "counter", phase_labels, timing["calls"])
+        if snapshot.get("memory"):
+            add(f"{prefix}_memory_peak_bytes", "gauge", labels, snapshot["memory"]["peak"])
+
+    lines = []
+    for (name, kind), samples in series.items():
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n" if lines else ""
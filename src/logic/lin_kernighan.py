@@ -0,0 +1,294 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from logic.distance_oracle import DEFAULT_ORACLE_BUDGET
+from logic.instrumentation import active, phase
+from logic.local_search import EPSILON, ArrayTour, _try_or_opt, build_oracle, neighbor_lists
+from logic.progress import Progress, exhaust
+
+
+@dataclass
+class LinKernighanResult:
+    """
+    Outcome of a chained Lin-Kernighan run.
+
+    Attributes:
+    - tour (np.ndarray): Best closed tour found, as city indices.
+    - length (float): Length of that tour.
+    - kicks (int): Number of double-bridge kicks tried.
+    - improvements (int): Number of kicks that led to a shorter tour.
+    - time_to_target (float): Seconds until target_length was reached, or None.
+    """
+
+    tour: np.ndarray
+    length: float
+    kicks: int
+    improvements: int
+    time_to_target: float = None
+
+
+def _edge(a: int, b: int) -> tuple[int, int]:
+    return (a, b) if a < b else (b, a)
+
+
+def _flip(tour: ArrayTour, t1: int, first: int, last: int) -> None:
+    """
+    Reverse the path first..last that starts next to t1 and runs away from it.
+    """
+    if tour.next(t1) == first:
+        tour.reverse(first, last)
+    else:
+        tour.reverse(last, first)
+
+
+def _lk_move(tour: ArrayTour, dist, neighbors, t1: int, max_depth: int):
+    """
+    Try a variable-depth Lin-Kernighan move starting by removing an edge at t1.
+
+    The move is built as a chain of 2-opt flips. After each flip t2 is the
+    neighbor of t1 whose edge closes the tour, and g is the gain of the
+    chain before that closing edge. At every level the next city is chosen
+    among t2's candidate neighbors by the largest g - d(t2, t3) + d(t3, t4)
+    while the partial gain stays positive. Edges added by the chain are
+    never removed again and removed edges are never added back. The chain
+    is then cut back to its best closed gain.
+
+    Returns the touched cities and the length change when the tour was improved, otherwise None.
+    """
+    for forward in (True, False):
+        t2 = tour.next(t1) if forward else tour.prev(t1)
+        gain = dist(t1, t2)
+        added = set()
+        removed = {_edge(t1, t2)}
+        flips = []
+        best_gain = EPSILON
+        best_depth = 0
+
+        for _ in range(max_depth):
+            succ_t2 = tour.next(t2) if tour.next(t1) == t2 else tour.prev(t2)
+            choice = None
+            for t3 in neighbors[t2]:
+                partial = gain - dist(t2, t3)
+                if partial <= EPSILON:
+                    break
+                if t3 == t1 or t3 == succ_t2 or _edge(t2, t3) in removed:
+                    continue
+                # t4 is t3's neighbor on the t2 side; removing (t3, t4) keeps the 2-opt flip valid.
+                t4 = tour.prev(t3) if tour.next(t1) == t2 else tour.next(t3)
+                if _edge(t3, t4) in added:
+                    continue
+                value = partial + dist(t3, t4)
+                if choice is None or value > choice[0]:
+                    choice = (value, t3, t4)
+            if choice is None:
+                break
+
+            gain, t3, t4 = choice
+            _flip(tour, t1, t2, t4)
+            flips.append((t2, t4))
+            added.add(_edge(t2, t3))
+            removed.add(_edge(t3, t4))
+            t2 = t4
+            closed = gain - dist(t2, t1)
+            if closed > best_gain:
+                best_gain = closed
+                best_depth = len(flips)
+
+        for first, last in reversed(flips[best_depth:]):
+            _flip(tour, t1, last, first)
+        if best_depth:
+            touched = {t1}
+            for first, last in flips[:best_depth]:
+                touched.update((first, last, tour.next(first), tour.prev(first), tour.next(last), tour.prev(last)))
+            return touched, -best_gain
+    return None
+
+
+def _optimize(tour: ArrayTour, dist, neighbors, queue: deque, queued: np.ndarray,
+              max_depth: int, use_or_opt: bool, max_segment: int, symmetric: bool = True) -> float:
+    """
+    Apply Lin-Kernighan (and Or-opt) moves from queued cities until none improves.
+
+    Lin-Kernighan flips reverse paths, so on an asymmetric metric only
+    direction-preserving Or-opt moves are applied. Returns the total length change.
+    """
+    improvement = 0.0
+    stats = active()
+    while queue:
+        city = queue.popleft()
+        queued[city] = False
+        move = _lk_move(tour, dist, neighbors, city, max_depth) if symmetric else None
+        if move is None and (use_or_opt or not symmetric):
+            move = _try_or_opt(tour, dist, neighbors, city, max_segment, symmetric)
+        if stats is not None:
+            stats.count("cities_examined")
+            stats.count("moves_accepted", move is not None)
+        if move is None:
+            continue
+        touched, delta = move
+        improvement += delta
+        for other in (*touched, city):
+            if not queued[other]:
+                queued[other] = True
+                queue.append(other)
+    return improvement
+
+
+def _double_bridge(tour: ArrayTour, dist, neighbors, rng: np.random.Generator):
+    """
+    Apply a random double-bridge kick in place, returning the touched cities and the length change.
+
+    The three cut points are a random city and two of its candidate
+    neighbors, so segments stay short and the repair is local.
+    """
+    n_cities = tour.n
+    anchor = int(rng.integers(n_cities))
+    pool = [int(city) for city in neighbors[anchor]]
+    if len(pool) >= 2:
+        others = rng.choice(pool, size=2, replace=False).tolist()
+    else:
+        others = rng.choice(np.delete(np.arange(n_cities), anchor), size=2, replace=False).tolist()
+    i, j, k = sorted(int(tour.position[city]) + 1 for city in [anchor] + others)
+
+    order = tour.order
+    a, b = int(order[i - 1]), int(order[i])
+    c, d = int(order[j - 1]), int(order[j])
+    e, f = int(order[k - 1]), int(order[k % n_cities])
+    delta = dist(a, d) + dist(e, b) + dist(c, f) - dist(a, b) - dist(c, d) - dist(e, f)
+
+    tour.order = np.concatenate((order[:i], order[j:k], order[i:j], order[k:]))
+    tour.position[tour.order] = np.arange(n_cities)
+    return (a, b, c, d, e, f), delta
+
+
+def iter_lin_kernighan(
+    tour,
+    distance_matrix: np.ndarray = None,
+    coordinates=None,
+    n_neighbors: int = 8,
+    max_depth: int = 50,
+    kicks: int = None,
+    time_limit: float = None,
+    target_length: float = None,
+    use_or_opt: bool = True,
+    max_segment: int = 3,
+    seed: int = None,
+    neighbors: np.ndarray = None,
+    report_interval: int = 100,
+    memory_budget: int = DEFAULT_ORACLE_BUDGET,
+    metric="euclidean",
+):
+    """
+    Improve a closed tour with chained Lin-Kernighan, yielding progress.
+
+    Lin-Kernighan moves of up to max_depth 2-opt flips (plus Or-opt segment
+    moves) are applied until the tour is locally optimal. Then, kick after
+    kick, a local double bridge perturbs the tour, only the cities around the
+    kick are re-optimized, and the result is kept if it is shorter and undone
+    otherwise. Candidate moves come from k-nearest neighbor lists and the
+    tour is a logic.local_search.ArrayTour, so next, prev and between are
+    O(1). On an asymmetric matrix (ATSP) the flips are skipped and the
+    descent uses Or-opt alone; the double bridge keeps every path in its
+    direction, so the kicks still apply. A Progress snapshot
+    (generation = kicks tried) is yielded after the first descent, after
+    every improving kick and every report_interval kicks. Under a
+    logic.instrumentation.Instrumentation the descent and kick phases are
+    timed and distance evaluations, examined cities, applied moves and
+    kicks are counted.
+
+    Parameters:
+    - tour: Starting closed tour as city indices.
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix, or a
+      logic.distance_oracle.DistanceOracle.
+    - coordinates: (n, 2) city coordinates, used instead of a matrix for large instances.
+    - n_neighbors (int): Size of the candidate neighbor lists (default is 8).
+    - max_depth (int): Longest chain of flips in one move (default is 50).
+    - kicks (int): Number of kicks; defaults to the number of cities.
+    - time_limit (float): Stop kicking after this many seconds.
+    - target_length (float): Stop as soon as the tour is at most this long.
+    - use_or_opt (bool): Also try Or-opt segment moves (default is True).
+    - max_segment (int): Longest segment moved by Or-opt (default is 3).
+    - seed (int): Seed for the kicks.
+    - neighbors (np.ndarray): Precomputed (n, k) candidate lists, such as
+      logic.lower_bound.alpha_neighbor_lists, overriding n_neighbors.
+    - report_interval (int): Kicks between snapshots (default is 100).
+    - memory_budget (int): Bytes the distance oracle built from coordinates may use (default is 256 MiB).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+
+    Returns:
+    LinKernighanResult: The best tour, its length, kick counts and time to target.
+    """
+    start = time.perf_counter()
+    oracle = build_oracle(distance_matrix, coordinates, memory_budget, metric)
+    dist = oracle.distance
+    stats = active()
+    if stats is not None:
+        dist = stats.counting(dist)
+    symmetric = oracle.symmetric
+    state = ArrayTour(tour)
+    n_cities = state.n
+    length = sum(dist(int(a), int(b)) for a, b in zip(state.order, np.roll(state.order, -1)))
+    kicks = n_cities if kicks is None else kicks
+
+    def reached() -> bool:
+        return target_length is not None and length <= target_length + EPSILON
+
+    time_to_target = 0.0 if reached() else None
+    if n_cities < 5:
+        yield Progress(0, state.order.copy(), length, time.perf_counter() - start)
+        return LinKernighanResult(state.order, length, 0, 0, time_to_target)
+
+    if neighbors is None:
+        neighbors = neighbor_lists(n_neighbors, distance_matrix, coordinates, metric)
+    neighbors = [row.tolist() for row in neighbors]
+    queued = np.ones(n_cities, dtype=bool)
+    with phase("descent"):
+        length += _optimize(state, dist, neighbors, deque(state.order.tolist()), queued,
+                            max_depth, use_or_opt, max_segment, symmetric)
+    if time_to_target is None and reached():
+        time_to_target = time.perf_counter() - start
+    yield Progress(0, state.order.copy(), length, time.perf_counter() - start)
+
+    rng = np.random.default_rng(seed)
+    tried = 0
+    improvements = 0
+    while tried < kicks and not reached():
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        tried += 1
+        with phase("kicks"):
+            saved = state.order.copy()
+            touched, delta = _double_bridge(state, dist, neighbors, rng)
+            queue = deque(touched)
+            queued[list(touched)] = True
+            delta += _optimize(state, dist, neighbors, queue, queued, max_depth, use_or_opt, max_segment, symmetric)
+        if stats is not None:
+            stats.count("kicks")
+            stats.count("improving_kicks", delta < -EPSILON)
+
+        if delta < -EPSILON:
+            length += delta
+            improvements += 1
+            if time_to_target is None and reached():
+                time_to_target = time.perf_counter() - start
+            yield Progress(tried, state.order.copy(), length, time.perf_counter() - start)
+        else:
+            state.order = saved
+            state.position[saved] = np.arange(n_cities)
+            if tried % report_interval == 0:
+                yield Progress(tried, state.order.copy(), length, time.perf_counter() - start)
+
+    yield Progress(tried, state.order.copy(), length, time.perf_counter() - start)
+    return LinKernighanResult(state.order, length, tried, improvements, time_to_target)
+
+
+def lin_kernighan(*args, **kwargs) -> LinKernighanResult:
+    """
+    Improve a closed tour with chained Lin-Kernighan.
+
+    Takes the same arguments as iter_lin_kernighan and returns its final LinKernighanResult.
+    """
+    return exhaust(iter_lin_kernighan(*args, **kwargs))
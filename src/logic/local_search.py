@@ -0,0 +1,294 @@
+import time
+from collections import deque
+
+import numpy as np
+
+from logic.construction import as_square_matrix
+from logic.distance_matrix import as_coordinates
+from logic.distance_oracle import DEFAULT_ORACLE_BUDGET, DistanceOracle, make_oracle
+from logic.instrumentation import active
+from logic.metrics import metric_neighbor_lists
+from logic.progress import Progress, exhaust
+
+EPSILON = 1e-9
+
+
+def build_oracle(distance_matrix: np.ndarray = None, coordinates=None,
+                 memory_budget: int = DEFAULT_ORACLE_BUDGET, metric="euclidean") -> DistanceOracle:
+    """
+    Return the distance oracle the improvement heuristics read distances from.
+
+    Coordinates go through logic.distance_oracle.make_oracle, which builds a
+    dense matrix when it fits in memory_budget and computes distances on the
+    fly otherwise. Its `symmetric` flag tells which moves are allowed.
+    """
+    if distance_matrix is None and coordinates is None:
+        raise ValueError("Either distance_matrix or coordinates must be given")
+    return make_oracle(distance_matrix, coordinates, memory_budget=memory_budget, metric=metric)
+
+
+def distance_function(distance_matrix: np.ndarray = None, coordinates=None,
+                      memory_budget: int = DEFAULT_ORACLE_BUDGET, metric="euclidean"):
+    """
+    Return a scalar d(i, j) callable over a distance matrix, a distance oracle or raw coordinates.
+    """
+    return build_oracle(distance_matrix, coordinates, memory_budget, metric).distance
+
+
+def neighbor_lists(k: int, distance_matrix: np.ndarray = None, coordinates=None, metric="euclidean") -> np.ndarray:
+    """
+    Return the k nearest other cities of every city, closest first.
+
+    Uses a partial sort of matrix rows when a matrix is given (row i holds
+    the cheapest cities to go to from i), otherwise a KD-tree query over the
+    coordinates under the metric of logic.metrics. Oracles answer from their
+    own data.
+    """
+    if isinstance(distance_matrix, DistanceOracle):
+        return distance_matrix.neighbor_lists(k)
+    if distance_matrix is not None:
+        matrix = as_square_matrix(distance_matrix).astype(np.float64)
+        n_cities = matrix.shape[0]
+        k = min(k, n_cities - 1)
+        if k <= 0:
+            return np.empty((n_cities, 0), dtype=np.intp)
+        masked = matrix.copy()
+        np.fill_diagonal(masked, np.inf)
+        candidates = np.argpartition(masked, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(masked, candidates, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1)
+
+    return metric_neighbor_lists(as_coordinates(coordinates), k, metric)
+
+
+class ArrayTour:
+    """
+    Tour stored as a city order plus the inverse position array.
+
+    next, prev and between are O(1); reverse costs at most n / 2 swaps.
+    """
+
+    __slots__ = ("order", "position", "n")
+
+    def __init__(self, tour):
+        self.order = np.array(tour, dtype=np.intp)
+        self.n = self.order.size
+        self.position = np.empty(self.n, dtype=np.intp)
+        self.position[self.order] = np.arange(self.n)
+
+    def next(self, city: int) -> int:
+        return int(self.order[(self.position[city] + 1) % self.n])
+
+    def prev(self, city: int) -> int:
+        return int(self.order[self.position[city] - 1])
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        """
+        Return True if b lies on the path from a to c following next (ends included).
+        """
+        start = self.position[a]
+        return (self.position[b] - start) % self.n <= (self.position[c] - start) % self.n
+
+    def reverse(self, first: int, last: int) -> None:
+        """
+        Reverse the path first..last (following next), or its complement when shorter.
+        """
+        start = int(self.position[first])
+        stop = int(self.position[last])
+        length = (stop - start) % self.n + 1
+        if 2 * length > self.n:
+            start, length = (stop + 1) % self.n, self.n - length
+        if length < 2:
+            return
+        indices = np.arange(start, start + length) % self.n
+        cities = self.order[indices][::-1]
+        self.order[indices] = cities
+        self.position[cities] = indices
+
+    def move_segment(self, first: int, last: int, after: int, reverse: bool) -> None:
+        """
+        Move the path first..last so that it follows city `after`, optionally reversed.
+        """
+        rotated = np.roll(self.order, -int(self.position[first]))
+        length = (int(self.position[last]) - int(self.position[first])) % self.n + 1
+        segment = rotated[:length]
+        rest = rotated[length:]
+        cut = (int(self.position[after]) - int(self.position[first])) % self.n - length + 1
+        if reverse:
+            segment = segment[::-1]
+        self.order = np.concatenate((rest[:cut], segment, rest[cut:]))
+        self.position[self.order] = np.arange(self.n)
+
+
+def _try_two_opt(tour: ArrayTour, dist, neighbors, a: int):
+    """
+    Try an improving 2-opt move that adds an edge from a to one of its neighbors.
+
+    Returns the touched cities when a move was applied, otherwise None.
+    """
+    for forward in (True, False):
+        b = tour.next(a) if forward else tour.prev(a)
+        d_ab = dist(a, b)
+        for c in neighbors[a]:
+            c = int(c)
+            d_ac = dist(a, c)
+            if d_ac >= d_ab:
+                break
+            d = tour.next(c) if forward else tour.prev(c)
+            if d == a or c == b:
+                continue
+            delta = d_ac + dist(b, d) - d_ab - dist(c, d)
+            if delta < -EPSILON:
+                if forward:
+                    tour.reverse(b, c)
+                else:
+                    tour.reverse(a, d)
+                return (a, b, c, d), delta
+    return None
+
+
+def _try_or_opt(tour: ArrayTour, dist, neighbors, a: int, max_segment: int, symmetric: bool = True):
+    """
+    Try moving a segment of up to max_segment cities starting at a next to a neighbor.
+
+    The segment is also tried reversed unless the metric is asymmetric, where
+    reversing it would change its own length. Returns the touched cities when a move was applied, otherwise None.
+    """
+    if tour.n < max_segment + 3:
+        max_segment = tour.n - 3
+    first = a
+    p = tour.prev(first)
+    last = first
+    for _ in range(max_segment):
+        nx = tour.next(last)
+        removed = dist(p, first) + dist(last, nx) - dist(p, nx)
+        if removed > EPSILON:
+            for end in (first, last):
+                for c in neighbors[end]:
+                    c = int(c)
+                    if dist(end, c) >= removed:
+                        break
+                    if tour.between(first, c, last):
+                        continue
+                    for after in (c, tour.prev(c)):
+                        e = tour.next(after)
+                        if after == p or tour.between(first, after, last) or tour.between(first, e, last):
+                            continue
+                        keep = dist(after, first) + dist(last, e)
+                        flip = dist(after, last) + dist(first, e) if symmetric else keep
+                        added = min(keep, flip) - dist(after, e)
+                        delta = added - removed
+                        if delta < -EPSILON:
+                            tour.move_segment(first, last, after, reverse=flip < keep)
+                            return (p, nx, first, last, after, e), delta
+        last = nx
+        if last == p:
+            break
+    return None
+
+
+def iter_local_search(
+    tour,
+    distance_matrix: np.ndarray = None,
+    coordinates=None,
+    n_neighbors: int = 10,
+    use_or_opt: bool = True,
+    max_segment: int = 3,
+    neighbors: np.ndarray = None,
+    report_interval: int = 1000,
+    start_cities=None,
+    memory_budget: int = DEFAULT_ORACLE_BUDGET,
+    metric="euclidean",
+):
+    """
+    Improve a closed tour with 2-opt and Or-opt moves until no improving move remains, yielding progress.
+
+    Moves are only tried towards each city's k nearest neighbors and costed
+    in O(1) from the four or six edges they change. Don't-look bits keep a
+    queue of cities whose surroundings changed, so converged regions are
+    skipped. On an asymmetric matrix (ATSP) 2-opt, which reverses a path,
+    is skipped and Or-opt only moves segments in their own direction, so
+    every delta stays exact. A Progress snapshot
+    (generation = moves applied) is yielded every report_interval moves and
+    once at the end. Under a logic.instrumentation.Instrumentation the
+    distance evaluations, examined cities and applied moves are counted.
+
+    Parameters:
+    - tour: Starting closed tour as city indices.
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix, or a
+      logic.distance_oracle.DistanceOracle.
+    - coordinates: (n, 2) city coordinates, used instead of a matrix for large instances.
+    - n_neighbors (int): Size of the candidate neighbor lists (default is 10).
+    - use_or_opt (bool): Also try Or-opt segment moves (default is True).
+    - max_segment (int): Longest segment moved by Or-opt (default is 3).
+    - neighbors (np.ndarray): Precomputed (n, k) neighbor lists, overriding n_neighbors.
+    - report_interval (int): Applied moves between snapshots (default is 1000).
+    - start_cities: Cities whose surroundings are examined first; all cities when None.
+      Other cities are only examined once a move touches them, which repairs a
+      tour that is already good away from a few known spots.
+    - memory_budget (int): Bytes the distance oracle built from coordinates may use (default is 256 MiB).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+
+    Returns:
+    tuple[np.ndarray, float]: The improved tour and the total length change (negative or zero).
+    """
+    start = time.perf_counter()
+    oracle = build_oracle(distance_matrix, coordinates, memory_budget, metric)
+    dist = oracle.distance
+    stats = active()
+    if stats is not None:
+        dist = stats.counting(dist)
+    symmetric = oracle.symmetric
+    state = ArrayTour(tour)
+    initial_length = sum(dist(int(a), int(b)) for a, b in zip(state.order, np.roll(state.order, -1)))
+    if state.n < 4:
+        yield Progress(0, state.order.copy(), initial_length, time.perf_counter() - start)
+        return state.order, 0.0
+    if neighbors is None:
+        neighbors = neighbor_lists(n_neighbors, distance_matrix, coordinates, metric)
+    neighbors = [row.tolist() for row in neighbors]
+
+    if start_cities is None:
+        queue = deque(state.order.tolist())
+        queued = np.ones(state.n, dtype=bool)
+    else:
+        queued = np.zeros(state.n, dtype=bool)
+        queued[np.asarray(start_cities, dtype=np.intp)] = True
+        queue = deque(np.flatnonzero(queued).tolist())
+    improvement = 0.0
+    moves = 0
+    while queue:
+        city = queue.popleft()
+        queued[city] = False
+        move = _try_two_opt(state, dist, neighbors, city) if symmetric else None
+        if move is None and use_or_opt:
+            move = _try_or_opt(state, dist, neighbors, city, max_segment, symmetric)
+        if stats is not None:
+            stats.count("cities_examined")
+            stats.count("moves_accepted", move is not None)
+        if move is None:
+            continue
+        touched, delta = move
+        improvement += delta
+        moves += 1
+        if moves % report_interval == 0:
+            yield Progress(moves, state.order.copy(), initial_length + improvement, time.perf_counter() - start)
+        for other in touched:
+            if not queued[other]:
+                queued[other] = True
+                queue.append(other)
+        if not queued[city]:
+            queued[city] = True
+            queue.append(city)
+    yield Progress(moves, state.order.copy(), initial_length + improvement, time.perf_counter() - start)
+    return state.order, improvement
+
+
+def local_search(*args, **kwargs) -> tuple[np.ndarray, float]:
+    """
+    Improve a closed tour with 2-opt and Or-opt moves until no improving move remains.
+
+    Takes the same arguments as iter_local_search and returns the improved
+    tour and the total length change (negative or zero).
+    """
+    return exhaust(iter_local_search(*args, **kwargs))
@@ -0,0 +1,430 @@
+import math
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order, minimum_spanning_tree
+
+from logic.construction import as_square_matrix, greedy_edge_tour, nearest_neighbor_tour
+from logic.distance_matrix import as_coordinates
+from logic.local_search import local_search, neighbor_lists
+from logic.metrics import get_metric, is_symmetric
+
+DEFAULT_BOUND_ITERATIONS = 200  # subgradient steps of held_karp_bound
+DEFAULT_PATIENCE = 20  # steps without a better bound before the step size is halved
+MIN_STEP_SCALE = 1e-3  # the subgradient stops once the step scale falls below this
+DEFAULT_POOL_FACTOR = 5  # alpha candidates are chosen from this many times k nearest cities
+
+
+class _Costs:
+    """
+    Distances of a symmetric instance by row or by pairs, from a dense matrix or from coordinates.
+    """
+
+    def __init__(self, distance_matrix=None, coordinates=None, metric="euclidean"):
+        if distance_matrix is None and coordinates is None:
+            raise ValueError("Either distance_matrix or coordinates must be given")
+        if distance_matrix is not None:
+            self.matrix = np.asarray(as_square_matrix(distance_matrix), dtype=np.float64)
+            if not is_symmetric(self.matrix):
+                raise ValueError("1-tree bounds need a symmetric instance")
+            self.n = self.matrix.shape[0]
+        else:
+            self.matrix = None
+            self.points = as_coordinates(coordinates)
+            self.metric = get_metric(metric)
+            self.elementwise = self.metric.elementwise
+            self.n = self.points.shape[0]
+
+    def row(self, city: int) -> np.ndarray:
+        if self.matrix is not None:
+            return self.matrix[city]
+        return self.elementwise(self.points[city][None, :], self.points)
+
+    def pairs(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        if self.matrix is not None:
+            return self.matrix[first, second]
+        return self.elementwise(self.points[first], self.points[second])
+
+    def integral(self) -> bool:
+        """Return True if every distance is a whole number, as in TSPLIB instances."""
+        if self.matrix is None:
+            return self.metric.integral
+        return bool(np.all(self.matrix == np.round(self.matrix)))
+
+
+@dataclass
+class OneTree:
+    """
+    Minimum 1-tree under node penalties.
+
+    A 1-tree is a spanning tree over every city but the special one, plus
+    the two cheapest edges from the special city. Every tour is a 1-tree,
+    so with edge costs c(i, j) + pi[i] + pi[j] its cost minus 2 * sum(pi)
+    is a lower bound on the shortest tour.
+
+    Attributes:
+    - edges (np.ndarray): (n - 2, 2) tree edges over the cities other than special.
+    - special (int): The special city.
+    - special_edges (np.ndarray): The two cities joined to the special city.
+    - degrees (np.ndarray): Degree of every city in the 1-tree; all 2 means the 1-tree is a tour.
+    - bound (float): Penalized cost minus twice the penalty sum.
+    """
+
+    edges: np.ndarray
+    special: int
+    special_edges: np.ndarray
+    degrees: np.ndarray
+    bound: float
+
+    @property
+    def is_tour(self) -> bool:
+        return bool(np.all(self.degrees == 2))
+
+
+@dataclass
+class LowerBoundResult:
+    """
+    Result of a Held-Karp lower bound computation.
+
+    Attributes:
+    - bound (float): Proven lower bound on the length of every tour.
+    - penalties (np.ndarray): Node penalties of the best bound.
+    - tree (OneTree): Minimum 1-tree under those penalties.
+    - upper_bound (float): Length of a known tour, used to size the subgradient steps.
+    - iterations (int): Subgradient steps taken.
+    - optimal (bool): The 1-tree is a tour, so the bound is the optimum.
+    - history (list[float]): Bound after every step, from the candidate graph when one was used.
+    """
+
+    bound: float
+    penalties: np.ndarray
+    tree: OneTree
+    upper_bound: float
+    iterations: int
+    optimal: bool = False
+    history: list = field(default_factory=list)
+
+    @property
+    def gap(self) -> float:
+        """Relative gap of upper_bound above the bound."""
+        return tour_gap(self.upper_bound, self.bound)
+
+
+def tour_gap(length: float, bound: float) -> float:
+    """
+    Return how far a tour length is proven to be from optimal at most, relative to a lower bound.
+    """
+    if bound <= 0:
+        return 0.0 if length <= 0 else math.inf
+    return max(0.0, length / bound - 1.0)
+
+
+def _degrees(n_cities: int, edges: np.ndarray, special: int, special_edges: np.ndarray) -> np.ndarray:
+    degrees = np.bincount(edges.ravel(), minlength=n_cities)
+    degrees[special] = 2
+    degrees[special_edges] += 1
+    return degrees
+
+
+def _special_edges(costs: _Costs, penalties: np.ndarray, special: int) -> tuple[np.ndarray, float]:
+    row = costs.row(special) + penalties[special] + penalties
+    row[special] = np.inf
+    cheapest = np.argpartition(row, 1)[:2]
+    return cheapest, float(row[cheapest].sum())
+
+
+def minimum_one_tree(distance_matrix: np.ndarray = None, coordinates=None, penalties: np.ndarray = None,
+                     special: int = 0, metric="euclidean") -> OneTree:
+    """
+    Compute the exact minimum 1-tree over the complete graph with Prim's algorithm.
+
+    Rows of distances are produced one at a time, so coordinates need O(n)
+    memory; the time is O(n^2) in n vectorized steps.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Symmetric square or condensed matrix from logic.distance_matrix.
+    - coordinates: (n, 2) city coordinates, used instead of a matrix.
+    - penalties (np.ndarray): Node penalties added to the cost of every edge at the node (default is zeros).
+    - special (int): The special city (default is 0).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+    """
+    costs = _Costs(distance_matrix, coordinates, metric)
+    if costs.n < 3:
+        raise ValueError("A 1-tree needs at least 3 cities")
+    return _minimum_one_tree(costs, np.zeros(costs.n) if penalties is None else np.asarray(penalties), special)
+
+
+def _minimum_one_tree(costs: _Costs, penalties: np.ndarray, special: int) -> OneTree:
+    n_cities = costs.n
+    in_tree = np.zeros(n_cities, dtype=bool)
+    in_tree[special] = True
+    nearest = np.full(n_cities, np.inf)
+    parent = np.full(n_cities, -1)
+    current = 1 if special == 0 else 0
+    in_tree[current] = True
+    edges = np.empty((n_cities - 2, 2), dtype=np.intp)
+    total = 0.0
+    for step in range(n_cities - 2):
+        row = costs.row(current) + penalties[current] + penalties
+        closer = (row < nearest) & ~in_tree
+        nearest[closer] = row[closer]
+        parent[closer] = current
+        current = int(np.argmin(nearest))
+        total += nearest[current]
+        edges[step] = current, parent[current]
+        in_tree[current] = True
+        nearest[current] = np.inf
+    special_edges, special_cost = _special_edges(costs, penalties, special)
+    bound = total + special_cost - 2.0 * float(penalties.sum())
+    return OneTree(edges, special, special_edges, _degrees(n_cities, edges, special, special_edges), bound)
+
+
+class _CandidateGraph:
+    """
+    Fixed sparse edge set on which 1-trees are recomputed with scipy's minimum spanning tree.
+    """
+
+    def __init__(self, costs: _Costs, candidates: np.ndarray, tree: OneTree):
+        n_cities = costs.n
+        candidates = np.asarray(candidates, dtype=np.intp)
+        origins = np.repeat(np.arange(n_cities), candidates.shape[1])
+        pairs = np.column_stack((origins, candidates.ravel()))
+        pairs = np.vstack((pairs, tree.edges, [(tree.special, city) for city in tree.special_edges]))
+        pairs = pairs[(pairs[:, 0] >= 0) & (pairs[:, 1] >= 0) & (pairs[:, 0] != pairs[:, 1])]
+        pairs = np.unique(np.sort(pairs, axis=1), axis=0)
+        touches_special = (pairs == tree.special).any(axis=1)
+        self.n = n_cities
+        self.special = tree.special
+        self.pairs = pairs[~touches_special]
+        self.lengths = costs.pairs(self.pairs[:, 0], self.pairs[:, 1])
+        special_pairs = pairs[touches_special]
+        self.special_others = np.where(special_pairs[:, 0] == tree.special, special_pairs[:, 1], special_pairs[:, 0])
+        self.special_lengths = costs.pairs(np.full(self.special_others.size, tree.special), self.special_others)
+
+    def one_tree(self, penalties: np.ndarray):
+        """Return the minimum 1-tree within the candidate edges, or None when they do not span the cities."""
+        if self.special_others.size < 2:
+            return None
+        weights = self.lengths + penalties[self.pairs[:, 0]] + penalties[self.pairs[:, 1]]
+        # Every spanning tree has n - 2 edges here, so a uniform shift keeps the minimum and makes weights positive.
+        shift = 1.0 - weights.min()
+        graph = csr_matrix((weights + shift, (self.pairs[:, 0], self.pairs[:, 1])), shape=(self.n, self.n))
+        tree = minimum_spanning_tree(graph).tocoo()
+        if tree.nnz != self.n - 2:
+            return None
+        edges = np.column_stack((tree.row, tree.col)).astype(np.intp)
+        special_weights = self.special_lengths + penalties[self.special] + penalties[self.special_others]
+        cheapest = np.argpartition(special_weights, 1)[:2]
+        special_edges = self.special_others[cheapest]
+        bound = (float(tree.data.sum()) - shift * (self.n - 2) + float(special_weights[cheapest].sum())
+                 - 2.0 * float(penalties.sum()))
+        return OneTree(edges, self.special, special_edges, _degrees(self.n, edges, self.special, special_edges), bound)
+
+
+def _upper_bound(costs: _Costs) -> float:
+    """Length of a quick tour: greedy edge on coordinates, nearest neighbor on a matrix, then local search."""
+    if costs.matrix is not None:
+        tour, delta = local_search(nearest_neighbor_tour(costs.matrix), costs.matrix)
+    else:
+        tour, delta = local_search(greedy_edge_tour(costs.points), coordinates=costs.points, metric=costs.metric)
+    tour = np.asarray(tour)
+    return float(costs.pairs(tour, np.roll(tour, -1)).sum())
+
+
+def held_karp_bound(
+    distance_matrix: np.ndarray = None,
+    coordinates=None,
+    upper_bound: float = None,
+    candidates: np.ndarray = None,
+    iterations: int = DEFAULT_BOUND_ITERATIONS,
+    patience: int = DEFAULT_PATIENCE,
+    time_limit: float = None,
+    special: int = 0,
+    metric="euclidean",
+) -> LowerBoundResult:
+    """
+    Compute the Held-Karp lower bound by subgradient optimization of minimum 1-trees.
+
+    Each step raises the penalty of cities of degree above 2 and lowers it
+    below 2, by a Polyak step scale * (upper_bound - bound) / |degrees - 2|^2,
+    and the scale is halved whenever patience steps bring no better bound.
+    With candidates, the steps use 1-trees on the sparse graph of the
+    candidate edges and the first exact tree, which takes near-linear time
+    per step; the best penalties are then evaluated once on the complete
+    graph, so the returned bound is always proven. Integral matrices round
+    the bound up.
+
+    Parameters:
+    - distance_matrix (np.ndarray): Symmetric square or condensed matrix from logic.distance_matrix.
+    - coordinates: (n, 2) city coordinates, used instead of a matrix for large instances.
+    - upper_bound (float): Length of a known tour; a quick local search tour is measured when None.
+    - candidates (np.ndarray): (n, k) candidate neighbor lists, such as logic.local_search.neighbor_lists;
+      every step uses the complete graph when None.
+    - iterations (int): Most subgradient steps (default is 200).
+    - patience (int): Steps without improvement before the step scale is halved (default is 20).
+    - time_limit (float): Seconds after which the steps stop; unlimited when None.
+    - special (int): The special city of the 1-trees (default is 0).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+
+    Returns:
+    LowerBoundResult: The bound, its penalties and 1-tree, and whether it is the optimum.
+    """
+    start = time.perf_counter()
+    costs = _Costs(distance_matrix, coordinates, metric)
+    n_cities = costs.n
+    if n_cities < 3:
+        raise ValueError("A 1-tree bound needs at least 3 cities")
+    if upper_bound is None:
+        upper_bound = _upper_bound(costs)
+
+    penalties = np.zeros(n_cities)
+    tree = _minimum_one_tree(costs, penalties, special)
+    graph = None if candidates is None else _CandidateGraph(costs, candidates, tree)
+    best_tree, best_penalties = tree, penalties.copy()
+    history = [tree.bound]
+    scale = 2.0
+    stalled = 0
+    step = 0
+    while step < iterations and not tree.is_tour and scale >= MIN_STEP_SCALE:
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        subgradient = tree.degrees - 2
+        size = scale * (upper_bound - tree.bound) / float(subgradient @ subgradient)
+        if size <= 0:
+            break
+        penalties = penalties + size * subgradient
+        step += 1
+        tree = (graph.one_tree(penalties) if graph is not None else None) or _minimum_one_tree(costs, penalties, special)
+        history.append(tree.bound)
+        if tree.bound > best_tree.bound + 1e-9:
+            best_tree, best_penalties = tree, penalties.copy()
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= patience:
+                scale /= 2
+                stalled = 0
+
+    if graph is not None:
+        best_tree = _minimum_one_tree(costs, best_penalties, special)
+    bound = best_tree.bound
+    if costs.integral():
+        bound = math.ceil(bound - 1e-6)
+    return LowerBoundResult(float(bound), best_penalties, best_tree, float(upper_bound), step, best_tree.is_tour,
+                            history)
+
+
+def _max_edge_queries(costs: _Costs, tree: OneTree, penalties: np.ndarray):
+    """
+    Prepare binary lifting tables over the tree part of a 1-tree.
+
+    Returns a function mapping arrays of city pairs to the largest penalized
+    edge cost on the tree path between them, in O(log n) vectorized steps.
+    """
+    n_cities = costs.n
+    first, second = tree.edges[:, 0], tree.edges[:, 1]
+    weights = costs.pairs(first, second) + penalties[first] + penalties[second]
+    graph = csr_matrix((np.ones(first.size), (first, second)), shape=(n_cities, n_cities))
+    root = int(tree.edges[0, 0])
+    order, predecessors = breadth_first_order(graph, root, directed=False)
+    parent = np.where(predecessors < 0, np.arange(n_cities), predecessors)
+    up_weight = np.full(n_cities, -np.inf)
+    up_weight[np.where(parent[first] == second, first, second)] = weights
+    depth = np.zeros(n_cities, dtype=np.intp)
+    for city in order[1:].tolist():
+        depth[city] = depth[parent[city]] + 1
+
+    levels = max(1, int(depth.max()).bit_length())
+    up = [parent]
+    highest = [up_weight]
+    for _ in range(1, levels):
+        up.append(up[-1][up[-1]])
+        highest.append(np.maximum(highest[-1], highest[-1][up[-2]]))
+
+    def query(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        swap = depth[first] < depth[second]
+        lower = np.where(swap, second, first)
+        upper = np.where(swap, first, second)
+        result = np.full(lower.size, -np.inf)
+        difference = depth[lower] - depth[upper]
+        for level in range(levels):
+            jump = ((difference >> level) & 1).astype(bool)
+            result[jump] = np.maximum(result[jump], highest[level][lower[jump]])
+            lower[jump] = up[level][lower[jump]]
+        for level in reversed(range(levels)):
+            differ = up[level][lower] != up[level][upper]
+            result[differ] = np.maximum(result[differ], np.maximum(highest[level][lower[differ]],
+                                                                   highest[level][upper[differ]]))
+            lower[differ] = up[level][lower[differ]]
+            upper[differ] = up[level][upper[differ]]
+        apart = lower != upper
+        result[apart] = np.maximum(result[apart], np.maximum(highest[0][lower[apart]], highest[0][upper[apart]]))
+        return result
+
+    return query
+
+
+def alpha_neighbor_lists(k: int, distance_matrix: np.ndarray = None, coordinates=None,
+                         bound: LowerBoundResult = None, pool_size: int = None, metric="euclidean") -> np.ndarray:
+    """
+    Return the k alpha-nearest cities of every city, ordered by distance.
+
+    The alpha-nearness of an edge is how much the minimum 1-tree under the
+    bound's penalties grows when the edge is forced into it: zero for its
+    own edges, otherwise the edge cost minus the largest cost on the tree
+    path it closes. Optimal tours mostly use edges of small alpha, so these
+    lists are better move candidates than plain nearest neighbors. Alpha is
+    evaluated for the pool_size nearest cities of every city and the k
+    smallest are kept; they are returned closest first, as
+    logic.local_search.neighbor_lists are, so solvers can pass them as
+    `neighbors` and keep pruning by distance.
+
+    Parameters:
+    - k (int): Candidates per city.
+    - distance_matrix (np.ndarray): Symmetric square or condensed matrix from logic.distance_matrix.
+    - coordinates: (n, 2) city coordinates, used instead of a matrix for large instances.
+    - bound (LowerBoundResult): Penalties and 1-tree from held_karp_bound; computed when None.
+    - pool_size (int): Nearest cities evaluated per city (default is 5 * k).
+    - metric (str | Metric): Metric of logic.metrics for coordinates (default is 'euclidean').
+
+    Returns:
+    np.ndarray: (n, k) candidate lists.
+    """
+    costs = _Costs(distance_matrix, coordinates, metric)
+    n_cities = costs.n
+    k = min(k, n_cities - 1)
+    if k <= 0:
+        return np.empty((n_cities, 0), dtype=np.intp)
+    if bound is None:
+        bound = held_karp_bound(distance_matrix, coordinates, metric=metric)
+    penalties, tree = bound.penalties, bound.tree
+    pool_size = min(n_cities - 1, max(k, DEFAULT_POOL_FACTOR * k if pool_size is None else pool_size))
+
+    pool = neighbor_lists(pool_size, distance_matrix, coordinates, metric).astype(np.intp)
+    origins = np.repeat(np.arange(n_cities), pool_size)
+    others = pool.ravel()
+    lengths = costs.pairs(origins, others)
+    weights = lengths + penalties[origins] + penalties[others]
+
+    alpha = np.empty(origins.size)
+    special = tree.special
+    at_special = (origins == special) | (others == special)
+    if n_cities > 3:
+        inner = ~at_special
+        alpha[inner] = weights[inner] - _max_edge_queries(costs, tree, penalties)(origins[inner], others[inner])
+    else:
+        alpha[~at_special] = 0.0
+    special_weights = costs.row(special) + penalties[special] + penalties
+    second_cheapest = special_weights[tree.special_edges].max()
+    alpha[at_special] = weights[at_special] - second_cheapest
+    partner = np.where(origins == special, others, origins)
+    alpha[at_special & np.isin(partner, tree.special_edges)] = 0.0
+    alpha = np.maximum(alpha, 0.0).reshape(n_cities, pool_size)
+    lengths = lengths.reshape(n_cities, pool_size)
+
+    chosen = np.lexsort((lengths, alpha), axis=1)[:, :k]
+    chosen_lengths = np.take_along_axis(lengths, chosen, axis=1)
+    chosen = np.take_along_axis(chosen, np.argsort(chosen_lengths, axis=1, kind="stable"), axis=1)
+    return np.take_along_axis(pool, chosen, axis=1)
@@ -0,0 +1,299 @@
+import math
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
+
+from logic.distance_matrix import _resolve_dtype, as_coordinates, build_distance_matrix
+from logic.spatial_index import SpatialIndex
+
+EARTH_RADIUS_KM = 6371.0088  # mean Earth radius
+TSPLIB_EARTH_RADIUS = 6378.388  # Earth radius of the TSPLIB GEO distance
+TSPLIB_PI = 3.141592  # the truncated pi TSPLIB GEO converts degrees with
+DEFAULT_BLOCK_ROWS = 1024  # rows of a metric matrix computed per NumPy pass
+
+
+@dataclass(frozen=True)
+class Metric:
+    """
+    A distance between points given as coordinate rows.
+
+    Attributes:
+    - name (str): Registry name.
+    - pairwise: f(a, b) -> (len(a), len(b)) matrix of distances, vectorized.
+    - elementwise: f(a, b) -> distances between matching rows of a and b, vectorized.
+    - scalar: f(x1, y1, x2, y2) -> float for one pair, used by on-the-fly oracles.
+    - proxy (str): Registered metric with the same nearest-neighbor order, whose KD-tree query is used.
+    - integral (bool): Whether every distance is a whole number, as with the TSPLIB rounding rules.
+    """
+
+    name: str
+    pairwise: object
+    elementwise: object
+    scalar: object
+    proxy: str = None
+    integral: bool = False
+
+
+def _haversine_terms(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance in km from latitudes and longitudes in radians (NumPy broadcasting).
+    """
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+def _haversine_pairwise(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a, b = np.radians(a), np.radians(b)
+    return _haversine_terms(a[:, None, 0], a[:, None, 1], b[None, :, 0], b[None, :, 1])
+
+
+def _haversine_elementwise(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a, b = np.radians(a), np.radians(b)
+    return _haversine_terms(a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+
+
+def _haversine_scalar(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(h, 1.0)))
+
+
+def _nint(values):
+    """
+    Round to the nearest integer the way TSPLIB does, (int)(x + 0.5).
+    """
+    return np.floor(values + 0.5)
+
+
+def _geo_radians(values):
+    """
+    Convert TSPLIB DDD.MM latitude/longitude values to radians.
+    """
+    degrees = np.trunc(values)
+    return TSPLIB_PI * (degrees + 5.0 * (values - degrees) / 3.0) / 180.0
+
+
+def _tsplib_terms(edge_weight_type: str, x1, y1, x2, y2):
+    """
+    Rounded TSPLIB distances between points given by coordinate arrays (NumPy broadcasting).
+    """
+    if edge_weight_type == "GEO":
+        lat1, lon1, lat2, lon2 = map(_geo_radians, (x1, y1, x2, y2))
+        q1 = np.cos(lon1 - lon2)
+        q2 = np.cos(lat1 - lat2)
+        q3 = np.cos(lat1 + lat2)
+        cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        return np.trunc(TSPLIB_EARTH_RADIUS * np.arccos(cosine) + 1.0)
+    dx, dy = x1 - x2, y1 - y2
+    if edge_weight_type == "EUC_2D":
+        return _nint(np.hypot(dx, dy))
+    if edge_weight_type == "CEIL_2D":
+        return np.ceil(np.hypot(dx, dy))
+    if edge_weight_type == "MAN_2D":
+        return _nint(np.abs(dx) + np.abs(dy))
+    if edge_weight_type == "MAX_2D":
+        return np.maximum(_nint(np.abs(dx)), _nint(np.abs(dy)))
+    # ATT: pseudo-Euclidean distance, rounded up unless it is already whole.
+    pseudo = np.sqrt((dx * dx + dy * dy) / 10.0)
+    rounded = _nint(pseudo)
+    return np.where(rounded < pseudo, rounded + 1, rounded)
+
+
+def _tsplib_pairwise(edge_weight_type: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _tsplib_terms(edge_weight_type, a[:, None, 0], a[:, None, 1], b[None, :, 0], b[None, :, 1])
+
+
+def _tsplib_elementwise(edge_weight_type: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return _tsplib_terms(edge_weight_type, a[:, 0], a[:, 1], b[:, 0], b[:, 1])
+
+
+def _tsplib_scalar(edge_weight_type: str, x1: float, y1: float, x2: float, y2: float) -> float:
+    if edge_weight_type == "GEO":
+        return float(_tsplib_terms("GEO", x1, y1, x2, y2))
+    dx, dy = x1 - x2, y1 - y2
+    if edge_weight_type == "EUC_2D":
+        return float(math.floor(math.hypot(dx, dy) + 0.5))
+    if edge_weight_type == "CEIL_2D":
+        return float(math.ceil(math.hypot(dx, dy)))
+    if edge_weight_type == "MAN_2D":
+        return float(math.floor(abs(dx) + abs(dy) + 0.5))
+    if edge_weight_type == "MAX_2D":
+        return float(max(math.floor(abs(dx) + 0.5), math.floor(abs(dy) + 0.5)))
+    pseudo = math.sqrt((dx * dx + dy * dy) / 10.0)
+    rounded = math.floor(pseudo + 0.5)
+    return float(rounded + 1 if rounded < pseudo else rounded)
+
+
+def _tsplib_metric(edge_weight_type: str, proxy: str = None) -> Metric:
+    """
+    Metric of a TSPLIB coordinate edge weight type, registered under the TSPLIB name.
+    """
+    return Metric(edge_weight_type, partial(_tsplib_pairwise, edge_weight_type),
+                  partial(_tsplib_elementwise, edge_weight_type), partial(_tsplib_scalar, edge_weight_type),
+                  proxy=proxy, integral=True)
+
+
+METRICS = {
+    "euclidean": Metric(
+        "euclidean",
+        lambda a, b: cdist(a, b),
+        lambda a, b: np.hypot(a[:, 0] - b[:, 0], a[:, 1] - b[:, 1]),
+        lambda x1, y1, x2, y2: math.hypot(x1 - x2, y1 - y2),
+    ),
+    "manhattan": Metric(
+        "manhattan",
+        lambda a, b: cdist(a, b, "cityblock"),
+        lambda a, b: np.abs(a - b).sum(axis=1),
+        lambda x1, y1, x2, y2: abs(x1 - x2) + abs(y1 - y2),
+    ),
+    # Coordinates are (latitude, longitude) in degrees; distances are in km.
+    "haversine": Metric("haversine", _haversine_pairwise, _haversine_elementwise, _haversine_scalar),
+    # TSPLIB rounding rules; the rounding keeps the order of the exact distance they round.
+    "EUC_2D": _tsplib_metric("EUC_2D", proxy="euclidean"),
+    "CEIL_2D": _tsplib_metric("CEIL_2D", proxy="euclidean"),
+    "ATT": _tsplib_metric("ATT", proxy="euclidean"),
+    "MAN_2D": _tsplib_metric("MAN_2D", proxy="manhattan"),
+    "MAX_2D": _tsplib_metric("MAX_2D"),
+    "GEO": _tsplib_metric("GEO"),
+}
+
+
+def get_metric(metric) -> Metric:
+    """
+    Return a Metric from its registry name, or the Metric itself.
+    """
+    if isinstance(metric, Metric):
+        return metric
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, expected one of {sorted(METRICS)}")
+    return METRICS[metric]
+
+
+def register_metric(metric: Metric) -> None:
+    """
+    Add a metric to the registry under its name.
+    """
+    METRICS[metric.name] = metric
+
+
+def metric_distance_matrix(coordinates, metric="euclidean", dtype="float64",
+                           block_rows: int = DEFAULT_BLOCK_ROWS) -> np.ndarray:
+    """
+    Build the (n, n) distance matrix of a metric in blocks of rows.
+
+    Euclidean goes through logic.distance_matrix.build_distance_matrix. Other
+    metrics are evaluated block_rows rows at a time, which keeps the
+    temporaries of formulas like haversine to a few block-sized arrays.
+
+    Parameters:
+    - coordinates: (n, 2) points; (latitude, longitude) in degrees for haversine.
+    - metric (str | Metric): Registry name or Metric (default is 'euclidean').
+    - dtype (str): 'float64' or 'float32' (default is 'float64').
+    - block_rows (int): Rows computed per pass (default is 1024).
+
+    Returns:
+    np.ndarray: The symmetric distance matrix.
+    """
+    metric = get_metric(metric)
+    if metric.name == "euclidean":
+        return build_distance_matrix(coordinates, dtype=dtype)
+    points = as_coordinates(coordinates)
+    matrix = np.empty((points.shape[0], points.shape[0]), dtype=_resolve_dtype(dtype))
+    for start in range(0, points.shape[0], block_rows):
+        matrix[start:start + block_rows] = metric.pairwise(points[start:start + block_rows], points)
+    np.fill_diagonal(matrix, 0.0)
+    return matrix
+
+
+def tour_length(tour, coordinates, metric="euclidean", closed: bool = True) -> float:
+    """
+    Calculate the length of a tour over coordinates in one vectorized pass, without a matrix.
+    """
+    points = as_coordinates(coordinates)[np.asarray(tour, dtype=np.intp)]
+    following = np.roll(points, -1, axis=0) if closed else points[1:]
+    origins = points if closed else points[:-1]
+    return float(get_metric(metric).elementwise(origins, following).sum())
+
+
+def pair_distance(coordinates, metric="euclidean"):
+    """
+    Return a scalar d(i, j) callable over coordinates, for on-the-fly distance oracles.
+    """
+    scalar = get_metric(metric).scalar
+    points = as_coordinates(coordinates)
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+    return lambda i, j: scalar(xs[i], ys[i], xs[j], ys[j])
+
+
+def _unit_vectors(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Map (latitude, longitude) degrees to points on the unit sphere.
+
+    Chord length grows monotonically with great-circle distance, so nearest
+    neighbors on the sphere can be found with a 3-D KD-tree.
+    """
+    lat, lon = np.radians(coordinates).T
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def metric_neighbor_lists(coordinates, k: int, metric="euclidean") -> np.ndarray:
+    """
+    Return the k nearest other points of every point under a metric, closest first.
+
+    Metrics with a proxy are answered by the proxy's KD-tree. Others are
+    ranked block_rows rows at a time, so no (n, n) matrix is built.
+    """
+    metric = get_metric(metric)
+    if metric.proxy is not None:
+        return metric_neighbor_lists(coordinates, k, metric.proxy)
+    points = as_coordinates(coordinates)
+    n_points = points.shape[0]
+    k = max(0, min(k, n_points - 1))
+    if metric.name == "euclidean":
+        return SpatialIndex(points).k_nearest_lists(k)
+    if k == 0:
+        return np.empty((n_points, 0), dtype=np.intp)
+    if metric.name == "manhattan":
+        _, ids = cKDTree(points).query(points, k=k + 1, p=1)
+    elif metric.name == "haversine":
+        _, ids = cKDTree(_unit_vectors(points)).query(_unit_vectors(points), k=k + 1)
+    else:
+        lists = np.empty((n_points, k), dtype=np.intp)
+        for start in range(0, n_points, DEFAULT_BLOCK_ROWS):
+            block = metric.pairwise(points[start:start + DEFAULT_BLOCK_ROWS], points)
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = np.inf
+            lists[start:start + DEFAULT_BLOCK_ROWS] = np.argsort(block, axis=1, kind="stable")[:, :k]
+        return lists
+    # Drop each point itself; with duplicate points it may not come first.
+    own = ids == np.arange(n_points)[:, None]
+    own[~own.any(axis=1), -1] = True
+    return ids[~own].reshape(n_points, k)
+
+
+def cost_matrix(matrix) -> np.ndarray:
+    """
+    Validate a user-supplied, possibly asymmetric (ATSP) cost matrix.
+
+    Entry [i, j] is the cost of travelling from i to j. The matrix must be
+    square, finite and non-negative; the diagonal is set to zero.
+    """
+    costs = np.array(matrix, dtype=np.float64)
+    if costs.ndim != 2 or costs.shape[0] != costs.shape[1]:
+        raise ValueError(f"Expected a square cost matrix, got shape {costs.shape}")
+    if not np.all(np.isfinite(costs)) or np.any(costs < 0):
+        raise ValueError("Cost matrix entries must be finite and non-negative")
+    np.fill_diagonal(costs, 0.0)
+    return costs
+
+
+def is_symmetric(matrix: np.ndarray) -> bool:
+    """
+    Return True if a square (or condensed, hence symmetric) matrix has d[i, j] == d[j, i].
+    """
+    matrix = np.asarray(matrix)
+    return matrix.ndim == 1 or bool(np.allclose(matrix, matrix.T))
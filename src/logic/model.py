@@ -0,0 +1,147 @@
+import numpy as np
+
+from logic.distance_matrix import as_coordinates, build_distance_matrix, path_length
+
+
+class CitySet:
+    """
+    Immutable set of cities stored as one contiguous (n, 2) float64 array.
+
+    That is 16 bytes per city instead of a tuple with two boxed ints per city.
+    The coordinates array is read-only and can be handed to NumPy, SciPy and
+    pygame drawing calls without a copy. Iterating or indexing yields (x, y)
+    tuples, so a CitySet can stand in for the list of tuples of data.cities.
+
+    Parameters:
+    - cities: (n, 2) coordinates such as a list of (x, y) tuples, an array or another CitySet.
+    """
+
+    __slots__ = ("coordinates",)
+
+    def __init__(self, cities):
+        if isinstance(cities, CitySet):
+            self.coordinates = cities.coordinates
+            return
+        coordinates = as_coordinates(cities)
+        if not np.all(np.isfinite(coordinates)):
+            raise ValueError("City coordinates must be finite")
+        if isinstance(cities, np.ndarray) and coordinates.flags.writeable and np.shares_memory(coordinates, cities):
+            # Freezing the caller's own array would surprise them; read-only inputs are shared as is.
+            coordinates = coordinates.copy()
+        coordinates.flags.writeable = False
+        self.coordinates = coordinates
+
+    def __len__(self) -> int:
+        return self.coordinates.shape[0]
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        x, y = self.coordinates[index].tolist()
+        return x, y
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __repr__(self) -> str:
+        return f"CitySet({len(self)} cities)"
+
+    def to_list(self) -> list[tuple[float, float]]:
+        """
+        Return the cities as the list of (x, y) tuples used by the older functions.
+        """
+        return [tuple(point) for point in self.coordinates.tolist()]
+
+    def distance_matrix(self, dtype="float64", condensed: bool = False) -> np.ndarray:
+        """
+        Build the Euclidean distance matrix of the cities, see logic.distance_matrix.
+        """
+        return build_distance_matrix(self.coordinates, dtype=dtype, condensed=condensed)
+
+
+class Tour:
+    """
+    Order in which a tour visits the cities of a CitySet, as an int32 permutation.
+
+    The tour only holds indices into its CitySet, so rearranging it never
+    copies coordinates; points() gathers them in tour order when drawing.
+
+    Parameters:
+    - cities (CitySet): The cities visited (other inputs are wrapped in a CitySet).
+    - order: City indices, each city exactly once.
+    - validate (bool): Check that order is a permutation (default is True).
+    """
+
+    __slots__ = ("cities", "order")
+
+    def __init__(self, cities, order, validate: bool = True):
+        self.cities = cities if isinstance(cities, CitySet) else CitySet(cities)
+        order = np.asarray(order)
+        if validate:
+            n_cities = len(self.cities)
+            if order.ndim != 1 or order.size != n_cities:
+                raise ValueError(f"Expected a tour of {n_cities} cities, got shape {order.shape}")
+            if order.size and not np.issubdtype(order.dtype, np.integer):
+                raise ValueError(f"Tour order must hold integer city indices, got {order.dtype}")
+            if order.size and (order.min() < 0 or order.max() >= n_cities
+                               or np.bincount(order, minlength=n_cities).max() != 1):
+                raise ValueError("Tour order must visit every city exactly once")
+        self.order = order.astype(np.int32, copy=False)
+
+    @classmethod
+    def identity(cls, cities) -> "Tour":
+        """
+        Visit the cities in the order they are stored.
+        """
+        cities = cities if isinstance(cities, CitySet) else CitySet(cities)
+        return cls(cities, np.arange(len(cities), dtype=np.int32), validate=False)
+
+    @classmethod
+    def from_path(cls, cities, path) -> "Tour":
+        """
+        Build a tour from a path of (x, y) tuples, such as the output of routes_to_cities.
+
+        A closing city that repeats the first one is dropped.
+        """
+        cities = cities if isinstance(cities, CitySet) else CitySet(cities)
+        lookup = {point: index for index, point in enumerate(cities.to_list())}
+        path = [tuple(map(float, point)) for point in path]
+        if len(path) > 1 and path[0] == path[-1]:
+            path = path[:-1]
+        try:
+            order = [lookup[point] for point in path]
+        except KeyError as error:
+            raise ValueError(f"City {error.args[0]} is not in the city set") from None
+        return cls(cities, order)
+
+    def __len__(self) -> int:
+        return self.order.size
+
+    def __iter__(self):
+        return iter(self.order.tolist())
+
+    def __repr__(self) -> str:
+        return f"Tour({len(self)} cities)"
+
+    def points(self) -> np.ndarray:
+        """
+        Return the (n, 2) coordinates in tour order, ready for pygame.draw.lines.
+        """
+        return self.cities.coordinates[self.order]
+
+    def to_path(self) -> list[tuple[float, float]]:
+        """
+        Return the tour as a list of (x, y) tuples in visiting order.
+        """
+        return [tuple(point) for point in self.points().tolist()]
+
+    def length(self, distance_matrix: np.ndarray = None, closed: bool = True) -> float:
+        """
+        Return the tour length, Euclidean unless a distance matrix is given.
+        """
+        if distance_matrix is not None:
+            return path_length(self.order, distance_matrix, closed=closed)
+        points = self.points()
+        if closed:
+            steps = points - np.roll(points, 1, axis=0)
+        else:
+            steps = np.diff(points, axis=0)
+        return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
@@ -0,0 +1,75 @@
+import numpy as np
+
+from logic.distance_matrix import condensed_lookup, matrix_size
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # bytes of temporaries per chunk
+
+
+def chunk_size_for_budget(n_cities: int, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> int:
+    """
+    Return how many tours can be scored at once within a memory budget.
+
+    Each tour of n cities needs roughly three n-length temporaries of 8 bytes
+    (the shifted index array and the gathered edge lengths).
+    """
+    bytes_per_tour = max(1, 3 * 8 * n_cities)
+    return max(1, memory_budget // bytes_per_tour)
+
+
+def _score_chunk(tours: np.ndarray, distance_matrix: np.ndarray, closed: bool) -> np.ndarray:
+    """
+    Score a (k, n) block of tours with one gather over the distance matrix.
+    """
+    if closed:
+        origins = tours
+        destinations = np.roll(tours, -1, axis=1)
+    else:
+        origins = tours[:, :-1]
+        destinations = tours[:, 1:]
+    if distance_matrix.ndim == 1:
+        edges = condensed_lookup(distance_matrix, matrix_size(distance_matrix), origins, destinations)
+    else:
+        edges = distance_matrix[origins, destinations]
+    return edges.sum(axis=1, dtype=np.float64)
+
+
+def score_population(
+    tours,
+    distance_matrix: np.ndarray,
+    closed: bool = True,
+    chunk_size: int = None,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+) -> np.ndarray:
+    """
+    Calculate the length of every tour in a population.
+
+    Parameters:
+    - tours: (population, n) integer array of city indices, one tour per row.
+    - distance_matrix (np.ndarray): Square or condensed matrix from logic.distance_matrix.
+    - closed (bool): Include the edge back to the first city (default is True).
+    - chunk_size (int): Tours scored per vectorized pass; derived from memory_budget when None.
+    - memory_budget (int): Upper bound in bytes for per-chunk temporaries.
+
+    Returns:
+    np.ndarray: float64 array of tour lengths, one per row.
+    """
+    tours = np.asarray(tours)
+    if tours.ndim != 2:
+        raise ValueError(f"Expected a (population, n) array of tours, got shape {tours.shape}")
+    if not np.issubdtype(tours.dtype, np.integer):
+        raise ValueError(f"Tours must be integer city indices, got dtype {tours.dtype}")
+
+    population, n_cities = tours.shape
+    lengths = np.zeros(population, dtype=np.float64)
+    if population == 0 or n_cities < 2:
+        return lengths
+
+    if chunk_size is None:
+        chunk_size = chunk_size_for_budget(n_cities, memory_budget)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    for start in range(0, population, chunk_size):
+        stop = min(start + chunk_size, population)
+        lengths[start:stop] = _score_chunk(tours[start:stop], distance_matrix, closed)
+    return lengths
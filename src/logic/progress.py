@@ -0,0 +1,266 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Progress:
+    """
+    Snapshot of a running solver.
+
+    Attributes:
+    - generation (int): Solver-specific step count (generations, nodes, moves or DP layers).
+    - tour (np.ndarray): Best closed tour found so far, as city indices.
+    - length (float): Length of that tour.
+    - elapsed (float): Seconds since the solver started.
+    """
+
+    generation: int
+    tour: np.ndarray
+    length: float
+    elapsed: float
+
+
+def exhaust(generator):
+    """
+    Run a solver generator to completion and return its return value.
+    """
+    while True:
+        try:
+            next(generator)
+        except StopIteration as stop:
+            return stop.value
+
+
+class _LatestSlot:
+    """
+    Holds only the newest snapshot, so a slow consumer never blocks the producer.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.snapshot = None
+        self.sequence = 0
+        self.done = False
+        self.result = None
+        self.error = None
+
+    def publish(self, snapshot: Progress) -> None:
+        with self.condition:
+            self.snapshot = snapshot
+            self.sequence += 1
+            self.condition.notify_all()
+
+    def finish(self, result=None, error: BaseException = None) -> None:
+        with self.condition:
+            self.result = result
+            self.error = error
+            self.done = True
+            self.condition.notify_all()
+
+    def wait_newer(self, seen: int, timeout: float = None) -> tuple:
+        """
+        Block until a snapshot newer than `seen` exists or the run is over.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.sequence > seen or self.done, timeout)
+            return self.sequence, self.snapshot, self.done
+
+
+def _drive(generator, publish, should_stop, min_interval: float):
+    """
+    Advance a solver generator, forwarding at most one snapshot per min_interval seconds.
+    """
+    last_sent = -np.inf
+    pending = None
+    try:
+        while True:
+            if should_stop():
+                generator.close()
+                return None
+            try:
+                snapshot = next(generator)
+            except StopIteration as stop:
+                if pending is not None:
+                    publish(pending)
+                return stop.value
+            now = time.perf_counter()
+            if now - last_sent >= min_interval:
+                publish(snapshot)
+                last_sent = now
+                pending = None
+            else:
+                pending = snapshot
+    finally:
+        generator.close()
+
+
+def _process_main(solver, args, kwargs, channel, stop_event, min_interval):
+    """
+    Entry point of the worker process backend.
+    """
+    try:
+        result = _drive(solver(*args, **kwargs), lambda snapshot: channel.put(("progress", snapshot)),
+                        stop_event.is_set, min_interval)
+        channel.put(("result", result))
+    except BaseException as error:
+        channel.put(("error", error))
+
+
+class SolverStream:
+    """
+    Run a solver generator in the background and expose its progress.
+
+    The solver is any generator function of this package that yields
+    Progress snapshots, such as logic.genetic.iter_genetic_algorithm. It runs
+    in a worker thread (backend="thread") or process (backend="process")
+    while consumers pull snapshots at their own rate: latest() never blocks,
+    iteration yields each newer snapshot, and `async for` does the same
+    without blocking the event loop. Snapshots the consumer did not get to
+    are dropped, so the solver never waits on its consumers.
+
+    An instrumentation is made active in the worker thread, so a view can
+    poll its counters while the solver runs; it needs the thread backend.
+
+    Parameters:
+    - solver: Generator function yielding Progress and returning the final result.
+    - *args, **kwargs: Arguments for the solver.
+    - backend (str): "thread" or "process" (default is "thread").
+    - min_interval (float): Minimum seconds between forwarded snapshots (default is 0).
+    - instrumentation (logic.instrumentation.Instrumentation): Records the run (default is none).
+    """
+
+    def __init__(self, solver, *args, backend: str = "thread", min_interval: float = 0.0,
+                 instrumentation=None, **kwargs):
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown backend {backend!r}, expected 'thread' or 'process'")
+        if instrumentation is not None and backend != "thread":
+            raise ValueError("instrumentation needs the thread backend")
+        self.solver = solver
+        self.args = args
+        self.kwargs = kwargs
+        self.backend = backend
+        self.min_interval = min_interval
+        self.instrumentation = instrumentation
+        self._slot = _LatestSlot()
+        self._threads = []
+        self._process = None
+        self._stop = threading.Event()
+
+    def start(self) -> "SolverStream":
+        if self._threads:
+            raise RuntimeError("SolverStream already started")
+        if self.backend == "thread":
+            self._threads.append(threading.Thread(target=self._run_thread, daemon=True))
+        else:
+            channel = multiprocessing.Queue()
+            self._stop = multiprocessing.Event()
+            self._process = multiprocessing.Process(
+                target=_process_main,
+                args=(self.solver, self.args, self.kwargs, channel, self._stop, self.min_interval),
+                daemon=True,
+            )
+            self._process.start()
+            self._threads.append(threading.Thread(target=self._relay, args=(channel,), daemon=True))
+        self._threads[0].start()
+        return self
+
+    def _run_thread(self) -> None:
+        try:
+            with self.instrumentation if self.instrumentation is not None else nullcontext():
+                result = _drive(self.solver(*self.args, **self.kwargs), self._slot.publish,
+                                self._stop.is_set, self.min_interval)
+            self._slot.finish(result)
+        except BaseException as error:
+            self._slot.finish(error=error)
+
+    def _relay(self, channel) -> None:
+        while True:
+            try:
+                kind, payload = channel.get(timeout=0.1)
+            except queue.Empty:
+                if self._process.is_alive() or not channel.empty():
+                    continue
+                self._slot.finish(error=RuntimeError("Solver process exited without a result"))
+                return
+            if kind == "progress":
+                self._slot.publish(payload)
+            elif kind == "result":
+                self._slot.finish(payload)
+                return
+            else:
+                self._slot.finish(error=payload)
+                return
+
+    def latest(self) -> Progress:
+        """
+        Return the newest snapshot without waiting, or None before the first one.
+        """
+        return self._slot.snapshot
+
+    @property
+    def done(self) -> bool:
+        return self._slot.done
+
+    def result(self, timeout: float = None):
+        """
+        Wait for the solver to finish and return its final result.
+        """
+        with self._slot.condition:
+            if not self._slot.condition.wait_for(lambda: self._slot.done, timeout):
+                raise TimeoutError("Solver did not finish in time")
+        if self._slot.error is not None:
+            raise self._slot.error
+        return self._slot.result
+
+    def stop(self) -> None:
+        """
+        Ask the solver to stop after its current step and wait for it.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        if self._process is not None:
+            self._process.join()
+
+    def __enter__(self) -> "SolverStream":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _advance(self, yielded: int) -> tuple:
+        """
+        Wait for a snapshot newer than `yielded`; returns (sequence, snapshot or None, done).
+        """
+        sequence, snapshot, done = self._slot.wait_newer(yielded)
+        if done and self._slot.error is not None:
+            raise self._slot.error
+        if sequence > yielded and snapshot is not None:
+            return sequence, snapshot, done
+        return yielded, None, done
+
+    def __iter__(self):
+        yielded = 0
+        while True:
+            yielded, snapshot, done = self._advance(yielded)
+            if snapshot is not None:
+                yield snapshot
+            if done:
+                return
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        yielded = 0
+        while True:
+            yielded, snapshot, done = await loop.run_in_executor(None, self._advance, yielded)
+            if snapshot is not None:
+                yield snapshot
+            if done:
+                return
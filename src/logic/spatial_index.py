@@ -0,0 +1,158 @@
+import math
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from logic.distance_matrix import as_coordinates
+
+MIN_PENDING = 16  # added points kept outside the tree before a rebuild, on top of sqrt(n)
+
+
+class SpatialIndex:
+    """
+    KD-tree over city coordinates that supports deleting and adding points.
+
+    cKDTree is static, so deletions only clear an alive flag. Queries ask the
+    tree for progressively more candidates until enough alive points are
+    found, and the tree is rebuilt over the survivors once the deleted share
+    passes rebuild_fraction, which keeps each query O(log n) amortized.
+    Added points get the next free index and wait in a pending block that
+    queries scan directly; it is folded into the tree once it holds more
+    than sqrt(n) + MIN_PENDING points, so adds and queries stay sublinear.
+
+    Parameters:
+    - points: (n, 2) coordinates, such as a list of (x, y) tuples from data.cities.
+    - rebuild_fraction (float): Share of deleted points that triggers a rebuild (default is 0.5).
+    """
+
+    __slots__ = ("points", "alive", "rebuild_fraction", "_tree", "_ids", "_deleted_in_tree", "_n_alive",
+                 "_n_indexed", "_point_storage", "_alive_storage")
+
+    def __init__(self, points, rebuild_fraction: float = 0.5):
+        if not 0 < rebuild_fraction <= 1:
+            raise ValueError("rebuild_fraction must be in (0, 1]")
+        self.points = as_coordinates(points)
+        self.alive = np.ones(len(self.points), dtype=bool)
+        self._point_storage = self.points
+        self._alive_storage = self.alive
+        self.rebuild_fraction = rebuild_fraction
+        self._n_alive = len(self.points)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return self._n_alive
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self.points) and bool(self.alive[index])
+
+    def _rebuild(self) -> None:
+        self._ids = np.flatnonzero(self.alive)
+        self._tree = cKDTree(self.points[self._ids]) if self._ids.size else None
+        self._deleted_in_tree = 0
+        self._n_indexed = len(self.points)
+
+    def add(self, point) -> int:
+        """
+        Add a point and return its index.
+        """
+        index = len(self.points)
+        if index == len(self._point_storage):
+            capacity = max(MIN_PENDING, 2 * index)
+            self._point_storage = np.empty((capacity, 2))
+            self._point_storage[:index] = self.points
+            self._alive_storage = np.zeros(capacity, dtype=bool)
+            self._alive_storage[:index] = self.alive
+        self._point_storage[index] = point
+        self._alive_storage[index] = True
+        self.points = self._point_storage[:index + 1]
+        self.alive = self._alive_storage[:index + 1]
+        self._n_alive += 1
+        if index + 1 - self._n_indexed > math.sqrt(self._ids.size) + MIN_PENDING:
+            self._rebuild()
+        return index
+
+    def _pending(self) -> np.ndarray:
+        """Return the alive added points that are not in the tree yet."""
+        return self._n_indexed + np.flatnonzero(self.alive[self._n_indexed:])
+
+    def remove(self, index: int) -> None:
+        """
+        Delete a point so that later queries skip it.
+        """
+        if index not in self:
+            raise KeyError(f"Point {index} is not in the index")
+        self.alive[index] = False
+        self._n_alive -= 1
+        if index >= self._n_indexed:
+            return
+        self._deleted_in_tree += 1
+        if self._deleted_in_tree > self.rebuild_fraction * self._ids.size:
+            self._rebuild()
+
+    def nearest(self, point, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the distances and indices of the k closest alive points, closest first.
+
+        Fewer than k results are returned when fewer points are alive.
+        """
+        k = min(k, self._n_alive)
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        point = np.asarray(point, dtype=np.float64)
+        distances, ids = self._tree_nearest(point, k)
+        if len(self.points) > self._n_indexed:
+            pending = self._pending()
+            distances = np.concatenate((distances, np.hypot(*(self.points[pending] - point).T)))
+            ids = np.concatenate((ids, pending))
+            order = np.argsort(distances, kind="stable")[:k]
+            distances, ids = distances[order], ids[order]
+        return distances, ids
+
+    def _tree_nearest(self, point: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        tree_size = self._ids.size
+        if tree_size == 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        query_size = min(tree_size, 2 * k + 8 if self._deleted_in_tree else k)
+        while True:
+            distances, positions = self._tree.query(point, k=query_size)
+            distances = np.atleast_1d(distances)
+            ids = self._ids[np.atleast_1d(positions)]
+            keep = self.alive[ids]
+            if keep.sum() >= k or query_size == tree_size:
+                return distances[keep][:k], ids[keep][:k]
+            query_size = min(tree_size, 2 * query_size)
+
+    def within(self, point, radius: float) -> np.ndarray:
+        """
+        Return the indices of alive points within radius of point, in index order.
+        """
+        point = np.asarray(point, dtype=np.float64)
+        ids = np.empty(0, dtype=np.intp)
+        if self._tree is not None:
+            positions = self._tree.query_ball_point(point, radius)
+            ids = self._ids[np.asarray(positions, dtype=np.intp)]
+            ids = ids[self.alive[ids]]
+        pending = self._pending()
+        pending = pending[np.hypot(*(self.points[pending] - point).T) <= radius]
+        return np.sort(np.concatenate((ids, pending)))
+
+    def k_nearest_lists(self, k: int) -> np.ndarray:
+        """
+        Return the k nearest other alive points of every point, closest first.
+
+        Rows of deleted points and missing neighbors are filled with -1.
+        """
+        n_points = len(self.points)
+        result = np.full((n_points, max(k, 0)), -1, dtype=np.intp)
+        k = min(k, self._n_alive - 1)
+        if k <= 0:
+            return result
+        if self._deleted_in_tree or len(self.points) > self._n_indexed:
+            self._rebuild()
+        _, positions = self._tree.query(self.points[self._ids], k=k + 1)
+        positions = positions.reshape(self._ids.size, k + 1)
+        ids = self._ids[positions]
+        is_self = ids == self._ids[:, None]
+        order = np.argsort(is_self, axis=1, kind="stable")
+        result[self._ids, :k] = np.take_along_axis(ids, order, axis=1)[:, :k]
+        return result
@@ -1,13 +1,361 @@
 #!/usr/bin/env python3
 """
 Main module for the TSP (Traveling Salesman Problem) solver.
+
+Without arguments it prints a welcome message. Given instance specs it runs
+a headless batch: every (instance, seed) pair is solved, across a process
+pool when there are several, and one JSON object per result is written as a
+line as soon as it is ready:
+
+    python src/main.py bundled:15 data/berlin52.tsp --solver lin_kernighan --time-limit 5 --seed 1 2 3
+
+With --cache, results are kept in a data.solution_cache.SolutionCache:
+repeating a request returns the stored answer at once, and an instance
+close to a cached one starts local search from the cached tour.
+
+With --stats each record gets a logic.instrumentation snapshot of the run
+(counters such as distance evaluations and moves, and phase timings),
+--profile adds the top cProfile functions and the tracemalloc peak, and
+--metrics FILE writes the snapshots of the batch as Prometheus text.
+With --bound each record also carries a Held-Karp lower bound from
+logic.lower_bound and the proven gap of the tour above it.
+
+Solver modules are imported inside the runners, and the pygame and
+Matplotlib views are never imported, so the CLI starts quickly on servers
+without a display.
 """
 
-def main():
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+
+HELD_KARP_LIMIT = 12  # largest instance the auto solver hands to Held-Karp
+DECOMPOSITION_LIMIT = 50_000  # smallest instance the auto solver decomposes
+BOUND_DENSE_LIMIT = 200  # larger instances run the bound's subgradient steps on candidate edges
+BOUND_CANDIDATES = 10  # nearest neighbors per city in the bound's candidate graph
+
+
+def _distance_arguments(instance) -> dict:
+    """
+    Pass coordinate instances as coordinates with their metric, which applies any TSPLIB rounding,
+    and explicit ones as their matrix.
+    """
+    if instance.metric is not None:
+        return {"coordinates": instance.coordinates, "metric": instance.metric}
+    return {"distance_matrix": instance.distance_matrix()}
+
+
+def _start_tour(instance, distances: dict, start=None):
+    """
+    Return the warm start if there is one, otherwise build a quick tour: greedy edge on coordinates,
+    nearest neighbor on a matrix.
+    """
+    from logic.construction import greedy_edge_tour, nearest_neighbor_tour
+
+    if start is not None:
+        return start
+    if "coordinates" in distances:
+        return greedy_edge_tour(distances["coordinates"])
+    return nearest_neighbor_tour(distances["distance_matrix"])
+
+
+def _lower_bound(instance, length: float) -> dict:
+    """
+    Bound a solved instance from below, returning the lower_bound and gap fields of its record.
+
+    Asymmetric instances have no 1-tree bound and get None for both.
+    """
+    from logic.local_search import neighbor_lists
+    from logic.lower_bound import held_karp_bound, tour_gap
+    from logic.metrics import is_symmetric
+
+    distances = _distance_arguments(instance)
+    if "distance_matrix" in distances and not is_symmetric(distances["distance_matrix"]):
+        return {"lower_bound": None, "gap": None}
+    candidates = None
+    if len(instance) > BOUND_DENSE_LIMIT:
+        candidates = neighbor_lists(BOUND_CANDIDATES, **distances)
+    bound = held_karp_bound(**distances, upper_bound=length, candidates=candidates).bound
+    return {"lower_bound": bound, "gap": tour_gap(length, bound)}
+
+
+def _single_progress(tour, length: float):
+    """
+    Wrap a one-shot construction result as a solver generator.
+    """
+    from logic.progress import Progress
+
+    yield Progress(0, tour, length, 0.0)
+
+
+def _run_held_karp(instance, seed, time_limit, start=None):
+    from logic.held_karp import iter_held_karp
+
+    return iter_held_karp(instance.distance_matrix())
+
+
+def _run_branch_and_bound(instance, seed, time_limit, start=None):
+    from logic.branch_and_bound import iter_branch_and_bound
+
+    return iter_branch_and_bound(instance.distance_matrix(), time_limit=time_limit, initial_tour=start)
+
+
+def _run_greedy(instance, seed, time_limit, start=None):
+    from logic.distance_oracle import make_oracle
+
+    distances = _distance_arguments(instance)
+    tour = _start_tour(instance, distances)
+    dist = make_oracle(**distances).distance
+    length = sum(dist(int(a), int(b)) for a, b in zip(tour, [*tour[1:], tour[0]]))
+    return _single_progress(tour, length)
+
+
+def _run_local_search(instance, seed, time_limit, start=None):
+    from logic.local_search import iter_local_search
+
+    distances = _distance_arguments(instance)
+    return iter_local_search(_start_tour(instance, distances, start), **distances)
+
+
+def _run_lin_kernighan(instance, seed, time_limit, start=None):
+    from logic.lin_kernighan import iter_lin_kernighan
+
+    distances = _distance_arguments(instance)
+    return iter_lin_kernighan(_start_tour(instance, distances, start), time_limit=time_limit, seed=seed, **distances)
+
+
+def _run_genetic(instance, seed, time_limit, start=None):
+    from logic.genetic import iter_genetic_algorithm
+
+    return iter_genetic_algorithm(instance.distance_matrix(), seed=seed)
+
+
+def _run_annealing(instance, seed, time_limit, start=None):
+    from logic.annealing import iter_simulated_annealing
+
+    return iter_simulated_annealing(instance.distance_matrix(), initial_tour=start, time_limit=time_limit, seed=seed)
+
+
+def _run_ant_colony(instance, seed, time_limit, start=None):
+    from logic.ant_colony import iter_ant_colony
+
+    return iter_ant_colony(**_distance_arguments(instance), time_limit=time_limit, seed=seed)
+
+
+def _run_decomposition(instance, seed, time_limit, start=None):
+    from logic.decomposition import iter_decomposition
+
+    if instance.metric != "euclidean":
+        raise ValueError(f"decomposition needs a Euclidean instance, {instance.name!r} is {instance.edge_weight_type}")
+    return iter_decomposition(instance.coordinates, seed=seed)
+
+
+def _run_auto(instance, seed, time_limit, start=None):
+    """
+    Held-Karp for tiny instances, decomposition for huge Euclidean ones and chained Lin-Kernighan otherwise.
+
+    A warm start always goes to Lin-Kernighan.
+    """
+    n_cities = len(instance)
+    if n_cities <= HELD_KARP_LIMIT:
+        return _run_held_karp(instance, seed, time_limit)
+    if start is None and n_cities >= DECOMPOSITION_LIMIT and instance.metric == "euclidean":
+        return _run_decomposition(instance, seed, time_limit)
+    return _run_lin_kernighan(instance, seed, time_limit, start)
+
+
+SOLVERS = {
+    "auto": _run_auto,
+    "held_karp": _run_held_karp,
+    "branch_and_bound": _run_branch_and_bound,
+    "greedy": _run_greedy,
+    "local_search": _run_local_search,
+    "lin_kernighan": _run_lin_kernighan,
+    "genetic": _run_genetic,
+    "annealing": _run_annealing,
+    "ant_colony": _run_ant_colony,
+    "decomposition": _run_decomposition,
+}
+
+
+def solve_instance(task: tuple) -> dict:
+    """
+    Load and solve one instance, returning its result record.
+
+    The solver generator is stopped at the first snapshot past time_limit,
+    so every solver is an anytime solver here. With a cache directory, an
+    exact hit is returned without solving, a similar cached instance
+    provides the starting tour, and the result is stored. Failures are
+    reported in the record's "error" field instead of being raised, so one
+    bad file does not end a batch.
+
+    Parameters:
+    - task (tuple): (spec, solver name, time limit in seconds or None, seed or None, include the tour,
+      solution cache directory or None, instrumentation: None, "stats" or "profile", add a lower bound).
+
+    Returns:
+    dict: spec, instance, n, solver, seed, length, steps, time, stopped, cached, warm_start and
+    optionally tour, stats, lower_bound and gap, or error.
+    """
+    spec, solver, time_limit, seed, include_tour, cache_dir, instrument, bound = task
+    record = {"spec": spec, "solver": solver, "seed": seed}
+    start = time.perf_counter()
+    try:
+        from data.instances import load_instance
+
+        instance = load_instance(spec)
+        record.update(instance=instance.name, n=len(instance))
+        cache = key = warm = None
+        if cache_dir is not None:
+            from data.solution_cache import SolutionCache, fingerprint
+
+            cache = SolutionCache(cache_dir)
+            key = fingerprint(instance.coordinates, instance.matrix, instance.edge_weight_type,
+                              solver=solver, time_limit=time_limit, seed=seed)
+            hit = cache.get(key)
+            if hit is not None:
+                record.update(length=hit.length, steps=0, stopped=False, cached=True, warm_start=None)
+                if include_tour:
+                    record["tour"] = hit.tour.tolist()
+                if bound:
+                    record.update(_lower_bound(instance, hit.length))
+                record["time"] = time.perf_counter() - start
+                return record
+            if instance.coordinates is not None:
+                warm = cache.warm_start(instance.coordinates, instance.edge_weight_type)
+
+        instrumentation = None
+        if instrument is not None:
+            from logic.instrumentation import Instrumentation
+
+            profile = instrument == "profile"
+            instrumentation = Instrumentation(solver, {"instance": spec, "seed": seed}, profile=profile,
+                                              trace_memory=profile)
+        generator = SOLVERS[solver](instance, seed, time_limit, None if warm is None else warm.tour)
+        latest = None
+        stopped = False
+        with instrumentation if instrumentation is not None else nullcontext():
+            for latest in generator:
+                if time_limit is not None and time.perf_counter() - start >= time_limit:
+                    generator.close()
+                    stopped = True
+                    break
+        if latest is None:
+            raise RuntimeError(f"{solver} returned no tour")
+        record.update(length=float(latest.length), steps=int(latest.generation), stopped=stopped)
+        if cache is not None:
+            cache.put(key, latest.tour, latest.length, instance.coordinates, instance.edge_weight_type)
+            record.update(cached=False, warm_start=None if warm is None else warm.similarity)
+        if include_tour:
+            record["tour"] = [int(city) for city in latest.tour]
+        if instrumentation is not None:
+            record["stats"] = instrumentation.snapshot()
+        if bound:
+            record.update(_lower_bound(instance, float(latest.length)))
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["time"] = time.perf_counter() - start
+    return record
+
+
+def run_batch(specs: list, solver: str = "auto", time_limit: float = None, seeds: list = None,
+              workers: int = None, include_tour: bool = False, cache_dir=None, instrument: str = None,
+              bound: bool = False):
+    """
+    Solve every (instance, seed) pair, yielding result records as they finish.
+
+    Parameters:
+    - specs (list[str]): Instance specs for data.instances.load_instance.
+    - solver (str): Key of SOLVERS (default is "auto").
+    - time_limit (float): Seconds per instance; unlimited when None.
+    - seeds (list[int]): Seeds to run every instance with (default is one unseeded run).
+    - workers (int): Worker processes; defaults to one per task up to the CPU count, 1 solves in-process.
+    - include_tour (bool): Add the tour to each record (default is False).
+    - cache_dir (str | Path): Solution cache directory; no caching when None.
+    - instrument (str): "stats" to add an instrumentation snapshot to each record, "profile" to also
+      profile time and memory; no instrumentation when None.
+    - bound (bool): Add a Held-Karp lower bound and the proven gap to each record (default is False).
+
+    Yields:
+    dict: One record per task in completion order, see solve_instance.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {sorted(SOLVERS)}")
+    cache_dir = None if cache_dir is None else str(cache_dir)
+    tasks = [(spec, solver, time_limit, seed, include_tour, cache_dir, instrument, bound)
+             for spec in specs for seed in (seeds or [None])]
+    workers = min(len(tasks), os.cpu_count() or 1) if workers is None else max(1, min(workers, len(tasks)))
+    if workers <= 1:
+        for task in tasks:
+            yield solve_instance(task)
+        return
+
+    import multiprocessing
+
+    # Each task is small to send (a spec string); workers load their own instance,
+    # sharing memory-mapped cache files, and results stream back unordered.
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(solve_instance, tasks)
+
+
+def _parse_arguments(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="main.py", description="Solve TSP instances and print JSON-lines results.")
+    parser.add_argument("instances", nargs="+", help="Instance files (.tsp, .atsp, .csv, .txt, .npy) or specs like bundled:15")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="auto")
+    parser.add_argument("--time-limit", type=float, help="Seconds per instance")
+    parser.add_argument("--seed", type=int, nargs="+", dest="seeds", help="Run every instance once per seed")
+    parser.add_argument("--workers", type=int, help="Worker processes (default is one per task up to the CPU count)")
+    parser.add_argument("--tour", action="store_true", help="Include the tour in each record")
+    parser.add_argument("--output", help="Append records to this file instead of standard output")
+    parser.add_argument("--cache", action="store_true", help="Reuse and store solutions in the solution cache")
+    parser.add_argument("--cache-dir", help="Solution cache directory (implies --cache)")
+    parser.add_argument("--stats", action="store_true", help="Add solver counters and phase timings to each record")
+    parser.add_argument("--profile", action="store_true", help="Also add cProfile and tracemalloc results")
+    parser.add_argument("--metrics", help="Write the run statistics to this file as Prometheus text")
+    parser.add_argument("--bound", action="store_true", help="Add a Held-Karp lower bound and the proven gap")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None):
     """Main entry point for the TSP solver."""
-    print("Welcome to the TSP Problem Solver!")
-    # TODO: Add TSP solving logic here
+    if not argv:
+        print("Welcome to the TSP Problem Solver!")
+        print("Pass instance files to solve them, see --help.")
+        return None
+
+    args = _parse_arguments(argv)
+    cache_dir = args.cache_dir
+    if args.cache and cache_dir is None:
+        from data.solution_cache import SolutionCache
+
+        cache_dir = SolutionCache().directory
+    instrument = "profile" if args.profile else "stats" if args.stats or args.metrics else None
+    handle = open(args.output, "a", encoding="utf-8") if args.output else sys.stdout
+    failures = 0
+    snapshots = []
+    try:
+        for record in run_batch(args.instances, args.solver, args.time_limit, args.seeds, args.workers, args.tour,
+                                cache_dir, instrument, args.bound):
+            failures += "error" in record
+            if "stats" in record:
+                snapshots.append(record["stats"])
+            handle.write(json.dumps(record) + "\n")
+            handle.flush()
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    if args.metrics:
+        from logic.instrumentation import prometheus_text
+
+        with open(args.metrics, "w", encoding="utf-8") as metrics:
+            metrics.write(prometheus_text(snapshots))
+    if failures:
+        sys.exit(1)
+    return None
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(sys.argv[1:])
@@ -1,54 +1,258 @@
-import pylab
-import matplotlib.pyplot as plt
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib
+import numpy as np
 import pygame
+from collections import OrderedDict
 from typing import List, Tuple
 
+from logic.model import CitySet, Tour
+
 matplotlib.use("Agg")
 
+DEFAULT_FONT = 'Arial'
+DEFAULT_FONT_SIZE = 15
+
+_fonts = {}
+
+
+def get_font(size: int = DEFAULT_FONT_SIZE, name: str = DEFAULT_FONT) -> pygame.font.Font:
+    """
+    Return a system font, loading it only the first time it is requested.
+
+    Parameters:
+    - size (int): Font size in points (default is 15).
+    - name (str): System font name (default is 'Arial').
+
+    Returns:
+    pygame.font.Font: The cached font object.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed by (text, color, size).
+
+    Parameters:
+    - max_size (int): Maximum number of surfaces kept; the least recently used is evicted first.
+    """
+
+    def __init__(self, max_size: int = 256):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, text: str, color, size: int = DEFAULT_FONT_SIZE) -> pygame.Surface:
+        """
+        Return the surface for text, rendering it only on a cache miss.
+        """
+        key = (text, tuple(pygame.Color(color)), size)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = get_font(size).render(text, False, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+def downsample_min_max(x, y, max_points: int):
+    """
+    Reduce a series to at most max_points points while keeping its envelope.
+
+    The series is cut into max_points // 2 buckets and only the minimum and
+    maximum of each bucket (plus the last point) are kept, so spikes and the
+    current value stay visible.
+
+    Parameters:
+    - x, y: Series values of equal length.
+    - max_points (int): Upper bound on the number of returned points.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: The reduced x and y values in their original order.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n_points = y.size
+    if n_points <= max_points:
+        return x, y
+
+    buckets = max(1, (max_points - 1) // 2)
+    bucket_size = -(-n_points // buckets)
+    full = n_points // bucket_size
+    offsets = np.arange(full) * bucket_size
+    blocks = y[:full * bucket_size].reshape(full, bucket_size)
+    keep = [blocks.argmin(axis=1) + offsets, blocks.argmax(axis=1) + offsets, [n_points - 1]]
+    if full * bucket_size < n_points:
+        tail = y[full * bucket_size:]
+        keep.append([full * bucket_size + tail.argmin(), full * bucket_size + tail.argmax()])
+    indices = np.unique(np.concatenate(keep).astype(np.intp))
+    return x[indices], y[indices]
+
+
+class FitnessPlot:
+    """
+    Persistent Matplotlib line plot rendered into a reused Pygame surface.
+
+    One figure is created for the lifetime of the widget. Updates change the
+    line data in place. When the data still fits the current axis limits only
+    the line is redrawn over a saved background (blitting); limits grow with
+    headroom so full redraws stay rare. The Pygame surface wraps the Agg
+    RGBA buffer directly, so no pixel data is copied per frame, and long
+    histories are down-sampled to max_points before drawing.
+
+    Parameters:
+    - size (Tuple[int, int]): Plot size in pixels (default is (400, 400)).
+    - x_label (str): Label for the x-axis (default is 'Generation').
+    - y_label (str): Label for the y-axis (default is 'Fitness').
+    - max_points (int): Maximum number of points drawn (default is 2000).
+    - dpi (int): Figure resolution (default is 100).
+    """
+
+    def __init__(self, size: Tuple[int, int] = (400, 400), x_label: str = 'Generation', y_label: str = 'Fitness', max_points: int = 2000, dpi: int = 100):
+        self.max_points = max_points
+        self.figure = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel(x_label)
+        self.axes.set_ylabel(y_label)
+        (self.line,) = self.axes.plot([], [], animated=True)
+        self.figure.tight_layout()
+        self._background = None
+        self._surface = None
+        self._buffer = None
+        self._limits = None
+
+    def _fits(self, x: np.ndarray, y: np.ndarray) -> bool:
+        if self._limits is None or x.size == 0:
+            return x.size == 0 and self._limits is not None
+        x_low, x_high, y_low, y_high = self._limits
+        return x.min() >= x_low and x.max() <= x_high and y.min() >= y_low and y.max() <= y_high
+
+    def _rescale(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Pick new axis limits with headroom and redraw the static background.
+        """
+        if x.size:
+            x_low, x_high = float(x.min()), float(x.max())
+            x_high = x_low + max(2 * (x_high - x_low), 1.0)
+            y_low, y_high = float(y.min()), float(y.max())
+            margin = max((y_high - y_low) * 0.1, abs(y_high) * 0.01, 1e-9)
+            self._limits = (x_low, x_high, y_low - margin, y_high + margin)
+            self.axes.set_xlim(self._limits[0], self._limits[1])
+            self.axes.set_ylim(self._limits[2], self._limits[3])
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.axes.bbox)
+
+    def update(self, x: list, y: list) -> pygame.Surface:
+        """
+        Replace the plotted series and re-render it.
+
+        Parameters:
+        - x (list): The x-axis values.
+        - y (list): The y-axis values.
+
+        Returns:
+        pygame.Surface: The surface holding the rendered plot. It is reused between calls.
+        """
+        x, y = downsample_min_max(x, y, self.max_points)
+        self.line.set_data(x, y)
+        if self._background is None or not self._fits(x, y):
+            self._rescale(x, y)
+        else:
+            self.canvas.restore_region(self._background)
+        self.axes.draw_artist(self.line)
+        self.canvas.blit(self.axes.bbox)
+        return self.surface
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """The Pygame surface sharing memory with the Agg RGBA buffer."""
+        buffer = self.canvas.buffer_rgba()
+        if self._surface is None or self._buffer is None or self._buffer.obj is not buffer.obj:
+            self._buffer = buffer
+            self._surface = pygame.image.frombuffer(buffer, self.canvas.get_width_height(), "RGBA")
+        return self._surface
+
+    def draw(self, screen: pygame.Surface, position: Tuple[int, int] = (0, 0)) -> None:
+        """
+        Blit the last rendered plot onto a screen.
+        """
+        screen.blit(self.surface, position)
+
 
-def draw_plot(screen: pygame.Surface, x: list, y: list, x_label: str = 'Generation', y_label: str = 'Fitness') -> None:
+_plots = {}
+
+
+def draw_plot(screen: pygame.Surface, x: list, y: list, x_label: str = 'Generation', y_label: str = 'Fitness', position: Tuple[int, int] = (0, 0)) -> None:
     """
     Draw a plot on a Pygame screen using Matplotlib.
 
+    A FitnessPlot per pair of axis labels is created on first use and reused
+    afterwards, so repeated calls neither leak figures nor rebuild the layout.
+
     Parameters:
     - screen (pygame.Surface): The Pygame surface to draw the plot on.
     - x (list): The x-axis values.
     - y (list): The y-axis values.
     - x_label (str): Label for the x-axis (default is 'Generation').
     - y_label (str): Label for the y-axis (default is 'Fitness').
+    - position (Tuple[int, int]): Top-left corner of the plot on the screen (default is (0, 0)).
+    """
+    plot = _plots.get((x_label, y_label))
+    if plot is None:
+        plot = _plots[(x_label, y_label)] = FitnessPlot(x_label=x_label, y_label=y_label)
+    screen.blit(plot.update(x, y), position)
+
+
+def as_points(cities):
+    """
+    Return something pygame can draw from a list of (x, y) tuples, a CitySet or a Tour.
+
+    A CitySet gives its coordinates array without a copy and a Tour its
+    coordinates in visiting order; anything else is returned unchanged.
     """
-    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
-    ax.plot(x, y)
-    ax.set_ylabel(y_label)
-    ax.set_xlabel(x_label)
-    plt.tight_layout()
-
-    canvas = FigureCanvasAgg(fig)
-    canvas.draw()
-    renderer = canvas.get_renderer()
-    raw_data = renderer.tostring_rgb()
-
-    size = canvas.get_width_height()
-    surf = pygame.image.fromstring(raw_data, size, "RGB")
-    screen.blit(surf, (0, 0))
-    
+    if isinstance(cities, CitySet):
+        return cities.coordinates
+    if isinstance(cities, Tour):
+        return cities.points()
+    return cities
+
+
 def draw_cities(screen: pygame.Surface, cities_locations: List[Tuple[int, int]], rgb_color: Tuple[int, int, int], node_radius: int) -> None:
     """
     Draws circles representing cities on the given Pygame screen.
 
     Parameters:
     - screen (pygame.Surface): The Pygame surface on which to draw the cities.
-    - cities_locations (List[Tuple[int, int]]): List of (x, y) coordinates representing the locations of cities.
+    - cities_locations (List[Tuple[int, int]]): List of (x, y) coordinates representing the locations of cities, or a CitySet.
     - rgb_color (Tuple[int, int, int]): Tuple of three integers (R, G, B) representing the color of the city circles.
     - node_radius (int): The radius of the city circles.
 
     Returns:
     None
     """
-    for city_location in cities_locations:
+    for city_location in as_points(cities_locations):
         pygame.draw.circle(screen, rgb_color, city_location, node_radius)
 
 
@@ -59,30 +263,78 @@ def draw_paths(screen: pygame.Surface, path: List[Tuple[int, int]], rgb_color: T
 
     Parameters:
     - screen (pygame.Surface): The Pygame surface to draw the path on.
-    - path (List[Tuple[int, int]]): List of tuples representing the coordinates of the path.
+    - path (List[Tuple[int, int]]): List of tuples representing the coordinates of the path, or a Tour.
     - rgb_color (Tuple[int, int, int]): RGB values for the color of the path.
     - width (int): Width of the path lines (default is 1).
     """
-    pygame.draw.lines(screen, rgb_color, True, path, width=width)
+    pygame.draw.lines(screen, rgb_color, True, as_points(path), width=width)
 
 
-def draw_text(screen: pygame.Surface, text: str, color: pygame.Color, x: int, y: int) -> None:
+def render_cities_layer(size: Tuple[int, int], cities_locations: List[Tuple[int, int]], rgb_color: Tuple[int, int, int], node_radius: int, background: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
+    """
+    Pre-render the cities onto a background surface that can be blitted every frame.
+
+    Parameters:
+    - size (Tuple[int, int]): Width and height of the layer, usually the screen size.
+    - cities_locations (List[Tuple[int, int]]): List of (x, y) coordinates representing the locations of cities, or a CitySet.
+    - rgb_color (Tuple[int, int, int]): Color of the city circles.
+    - node_radius (int): The radius of the city circles.
+    - background (Tuple[int, int, int]): Fill color of the layer (default is white).
+
+    Returns:
+    pygame.Surface: The rendered layer.
+    """
+    layer = pygame.Surface(size)
+    layer.fill(background)
+    draw_cities(layer, cities_locations, rgb_color, node_radius)
+    return layer
+
+
+def draw_text(screen: pygame.Surface, text: str, color: pygame.Color, x: int, y: int, size: int = DEFAULT_FONT_SIZE) -> None:
     """
     Draw text on a Pygame screen.
 
+    Rendered surfaces come from the module-level text_cache, so text that is
+    unchanged between frames is not rendered again.
+
     Parameters:
     - screen (pygame.Surface): The Pygame surface to draw the text on.
     - text (str): The text to be displayed.
     - color (pygame.Color): The color of the text.
+    - x (int), y (int): Top-left position of the text.
+    - size (int): Font size (default is 15).
     """
-    pygame.font.init()  # You have to call this at the start
+    screen.blit(text_cache.render(text, color, size), (x, y))
 
-    font_size = 15
-    my_font = pygame.font.SysFont('Arial', font_size)
-    text_surface = my_font.render(text, False, color)
-    
-    
-    text_position = (x, y)
-    
-    screen.blit(text_surface, text_position)
 
+
+def format_count(value: float) -> str:
+    """
+    Format a count or rate with a k, M or G suffix.
+    """
+    for threshold, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if abs(value) >= threshold:
+            return f"{value / threshold:.1f}{suffix}"
+    return f"{value:.0f}"
+
+
+def draw_stats(screen: pygame.Surface, instrumentation, fps: float, color: pygame.Color, x: int, y: int,
+               size: int = 13, line_height: int = 16) -> None:
+    """
+    Overlay live solver statistics: the frame rate and every counter with its rate per second.
+
+    Parameters:
+    - screen (pygame.Surface): The Pygame surface to draw on.
+    - instrumentation (logic.instrumentation.Instrumentation): Instrumentation of the running solver.
+    - fps (float): Measured frame rate, such as pygame.time.Clock.get_fps().
+    - color (pygame.Color): The color of the text.
+    - x (int), y (int): Top-left position of the overlay.
+    - size (int): Font size (default is 13).
+    - line_height (int): Pixels between lines (default is 16).
+    """
+    rates = instrumentation.rates()
+    lines = [f"FPS {fps:.0f}"]
+    for name, total in sorted(instrumentation.counters.items()):
+        lines.append(f"{name.replace('_', ' ')}: {format_count(total)} ({format_count(rates.get(name, 0))}/s)")
+    for row, line in enumerate(lines):
+        draw_text(screen, line, color, x, y + row * line_height, size)
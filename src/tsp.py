@@ -1,8 +1,13 @@
 from logic.cities import calculate_distance, calculate_total_distance, routes_to_cities
+from logic.ant_colony import iter_ant_colony
+from logic.genetic import iter_genetic_algorithm
+from logic.instrumentation import Instrumentation
+from logic.model import CitySet, Tour
+from logic.progress import SolverStream
 import pygame 
 import sys
 
-from pygame_functions.graphics import draw_text, draw_cities
+from pygame_functions.graphics import draw_text, draw_paths, draw_plot, draw_stats, render_cities_layer
 from data.cities import cities_locations
 
 # Define constant values
@@ -13,6 +18,14 @@ FPS = 30
 PLOT_X_OFFSET = 450
 
 N_CITIES = 15
+SOLVER = "genetic"  # key of SOLVERS
+SHOW_STATS = True  # overlay solver counters and FPS; S toggles it while running
+
+# Solver generators with their arguments; each yields the Progress snapshots plotted per generation
+SOLVERS = {
+    "genetic": (iter_genetic_algorithm, dict(generations=2000, migration_interval=10)),
+    "ant_colony": (iter_ant_colony, dict(iterations=2000)),
+}
 
 # Define colors
 WHITE = (255, 255, 255)
@@ -26,6 +39,18 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("TSP Solver using Pygame")
 clock = pygame.time.Clock()
 
+cities = CitySet(cities_locations[N_CITIES])
+
+# The city dots never move, so they are drawn once onto a background layer
+background = render_cities_layer((WIDTH, HEIGHT), cities, RED, NODE_RADIUS, WHITE)
+
+# Run the solver in a background thread; the frame loop only reads its latest snapshot
+solver_function, solver_options = SOLVERS[SOLVER]
+stats = Instrumentation(SOLVER)
+solver = SolverStream(solver_function, cities.distance_matrix(), instrumentation=stats, **solver_options)
+solver.start()
+generations, best_lengths = [], []
+
 # Main game loop
 running = True
 while running:
@@ -35,21 +60,35 @@ while running:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_q:
                 running = False
+            elif event.key == pygame.K_s:
+                SHOW_STATS = not SHOW_STATS
 
-    screen.fill(WHITE)
-    
-    draw_cities(screen, cities_locations[N_CITIES], RED, NODE_RADIUS)
-    city1 = cities_locations[N_CITIES][0]
-    city2 = cities_locations[N_CITIES][1]
+    screen.blit(background, (0, 0))
+
+    progress = solver.latest()
+    if progress is not None and (not generations or progress.generation != generations[-1]):
+        generations.append(progress.generation)
+        best_lengths.append(progress.length)
+    if progress is not None:
+        draw_plot(screen, generations, best_lengths, position=(PLOT_X_OFFSET, 0))
+        draw_paths(screen, Tour(cities, progress.tour, validate=False), BLUE, width=2)
+
+    city1 = cities[0]
+    city2 = cities[1]
     distance = calculate_distance(city1,city2)
     draw_text(screen, f"Distance: {distance}", BLACK, city1[0], city1[1])
-    total_distance = calculate_total_distance(cities_locations[N_CITIES])
+    total_distance = calculate_total_distance(cities)
     draw_text(screen, f"Total distance: {total_distance}", BLACK, 5, 350)
-    draw_text(screen, "TSP Solver - Press Q to quit", BLACK, 5, 380)
+    if progress is not None:
+        draw_text(screen, f"Generation {progress.generation}: best {progress.length:.1f}", BLACK, 5, 320)
+    if SHOW_STATS:
+        draw_stats(screen, stats, clock.get_fps(), BLACK, 5, 5)
+    draw_text(screen, "TSP Solver - Press Q to quit, S for stats", BLACK, 5, 380)
     
     # Update display
     pygame.display.flip()
     clock.tick(FPS)
 
+solver.stop()
 pygame.quit()
 sys.exit()
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Shared fixtures for the data tests.
+"""
+
+import pytest
+
+
+BURMA14 = """NAME: burma14
+TYPE: TSP
+COMMENT: 14-Staedte in Burma (Zaw Win)
+DIMENSION: 14
+EDGE_WEIGHT_TYPE: GEO
+EDGE_WEIGHT_FORMAT: FUNCTION
+DISPLAY_DATA_TYPE: COORD_DISPLAY
+NODE_COORD_SECTION
+   1  16.47       96.10
+   2  16.47       94.44
+   3  20.09       92.54
+   4  22.39       93.37
+   5  25.23       97.24
+   6  22.00       96.05
+   7  20.47       97.02
+   8  17.20       96.29
+   9  16.30       97.38
+  10  14.05       98.12
+  11  16.53       97.38
+  12  21.52       95.59
+  13  19.41       97.13
+  14  20.09       94.55
+EOF
+"""
+
+
+@pytest.fixture
+def burma14_text():
+    """Provide the TSPLIB burma14 instance (GEO, known optimum 3323)."""
+    return BURMA14
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the instance cache at a temporary directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("TSP_CACHE_DIR", str(directory))
+    return directory
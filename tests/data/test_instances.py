@@ -0,0 +1,123 @@
+"""
+Unit tests for the instance loader and cache.
+"""
+
+import pytest
+import numpy as np
+from data.cities import cities_locations
+from data.instances import (
+    Instance,
+    load_instance,
+    read_coordinates_csv,
+    register_source,
+)
+from logic.distance_matrix import build_distance_matrix
+from logic.metrics import tour_length
+
+
+class TestLoadInstance:
+    """Test cases for the load_instance function."""
+
+    def test_bundled_source(self):
+        """Test that the cities_locations dict is available as a source."""
+        instance = load_instance("bundled:15")
+
+        assert len(instance) == 15
+        assert instance.cities == [tuple(map(float, city)) for city in cities_locations[15]]
+        assert np.allclose(instance.distance_matrix(), build_distance_matrix(cities_locations[15]))
+
+    def test_bundled_unknown_size(self):
+        """Test that missing bundled sizes raise KeyError."""
+        with pytest.raises(KeyError):
+            load_instance("bundled:7")
+
+    def test_tsplib_file_with_opt_tour(self, tmp_path, cache_dir, burma14_text):
+        """Test loading a .tsp file together with its .opt.tour."""
+        (tmp_path / "burma14.tsp").write_text(burma14_text)
+        tour = "NAME: burma14.opt.tour\nTYPE: TOUR\nDIMENSION: 14\nTOUR_SECTION\n" + "\n".join(
+            str(city) for city in [1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]
+        ) + "\n-1\nEOF\n"
+        (tmp_path / "burma14.opt.tour").write_text(tour)
+
+        instance = load_instance(tmp_path / "burma14.tsp")
+
+        matrix = instance.distance_matrix()
+        optimal = instance.optimal_tour
+        assert instance.edge_weight_type == "GEO"
+        assert matrix[optimal, np.roll(optimal, -1)].sum() == 3323
+        assert instance.metric == "GEO"
+        assert tour_length(optimal, instance.coordinates, instance.metric) == 3323
+
+    def test_cache_is_memory_mapped_and_reused(self, tmp_path, cache_dir, burma14_text):
+        """Test that a second load comes from the memory-mapped cache."""
+        path = tmp_path / "burma14.tsp"
+        path.write_text(burma14_text)
+
+        first = load_instance(path)
+        second = load_instance(path)
+
+        assert isinstance(second.coordinates, np.memmap)
+        assert np.array_equal(first.coordinates, second.coordinates)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_cache_can_be_bypassed(self, tmp_path, cache_dir, burma14_text):
+        """Test that use_cache=False parses without writing the cache."""
+        path = tmp_path / "burma14.tsp"
+        path.write_text(burma14_text)
+
+        instance = load_instance(path, use_cache=False)
+
+        assert len(instance) == 14
+        assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+    def test_npy_file(self, tmp_path):
+        """Test loading coordinates from an .npy array."""
+        points = np.random.default_rng(0).random((100, 2))
+        np.save(tmp_path / "points.npy", points)
+
+        instance = load_instance(tmp_path / "points.npy")
+
+        assert np.array_equal(instance.coordinates, points)
+
+    def test_unknown_format_and_missing_file(self, tmp_path):
+        """Test errors for unsupported suffixes and missing files."""
+        with pytest.raises(ValueError):
+            load_instance(tmp_path / "points.xlsx")
+        with pytest.raises(FileNotFoundError):
+            load_instance(tmp_path / "missing.tsp")
+
+    def test_register_source(self):
+        """Test that new sources can be registered."""
+        register_source("unit", lambda key: Instance(key, coordinates=np.zeros((int(key), 2))))
+
+        assert len(load_instance("unit:3")) == 3
+
+
+class TestReadCoordinatesCsv:
+    """Test cases for the read_coordinates_csv function."""
+
+    def test_read_coordinates_csv_chunks_and_header(self, tmp_path):
+        """Test that chunked reading matches the file and skips the header."""
+        points = np.random.default_rng(1).random((1000, 2)) * 100
+        path = tmp_path / "points.csv"
+        path.write_text("x,y\n" + "\n".join(f"{x},{y}" for x, y in points) + "\n")
+
+        result = read_coordinates_csv(path, chunk_lines=77)
+
+        assert np.allclose(result, points)
+
+    def test_read_coordinates_csv_columns(self, tmp_path):
+        """Test picking coordinate columns out of wider rows."""
+        path = tmp_path / "stops.csv"
+        path.write_text("1,10,20\n2,30,40\n")
+
+        result = read_coordinates_csv(path, columns=(1, 2))
+
+        assert result.tolist() == [[10, 20], [30, 40]]
+
+    def test_read_coordinates_csv_empty(self, tmp_path):
+        """Test that an empty file gives no coordinates."""
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+
+        assert read_coordinates_csv(path).shape == (0, 2)
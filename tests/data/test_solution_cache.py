@@ -0,0 +1,131 @@
+"""
+Unit tests for the solution cache.
+"""
+
+import os
+
+import pytest
+import numpy as np
+from data.solution_cache import SolutionCache, fingerprint, transfer_tour
+from logic.decomposition import tour_length
+from logic.local_search import local_search
+
+
+def is_permutation(tour, n):
+    return sorted(int(city) for city in tour) == list(range(n))
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).random((300, 2)) * 1000
+
+
+@pytest.fixture
+def solved(points):
+    """A locally optimal tour of points."""
+    tour, _ = local_search(np.arange(len(points)), coordinates=points)
+    return tour
+
+
+class TestFingerprint:
+    """Test cases for the fingerprint function."""
+
+    def test_same_instance_same_key(self, points):
+        """Test that equal coordinates in different containers give the same key."""
+        assert fingerprint(points, solver="auto") == fingerprint(points.tolist(), solver="auto")
+
+    def test_metric_and_parameters_change_key(self, points):
+        """Test that the metric, the parameters and any coordinate change the key."""
+        key = fingerprint(points, solver="auto", seed=1)
+        moved = points.copy()
+        moved[0, 0] += 1e-9
+
+        assert key != fingerprint(points, metric="manhattan", solver="auto", seed=1)
+        assert key != fingerprint(points, solver="auto", seed=2)
+        assert key != fingerprint(moved, solver="auto", seed=1)
+
+    def test_requires_instance(self):
+        """Test that a fingerprint needs coordinates or a matrix."""
+        with pytest.raises(ValueError):
+            fingerprint(solver="auto")
+
+
+class TestSolutionCache:
+    """Test cases for the SolutionCache class."""
+
+    def test_put_and_get(self, tmp_path, points, solved):
+        """Test that a stored tour is returned for its key and a missing key misses."""
+        cache = SolutionCache(tmp_path)
+        key = fingerprint(points)
+
+        assert cache.get(key) is None
+        assert cache.put(key, solved, 1234.5, points)
+        hit = cache.get(key)
+
+        assert np.array_equal(hit.tour, solved)
+        assert hit.length == 1234.5
+        assert hit.similarity == 1.0
+
+    def test_keeps_shortest_tour(self, tmp_path, points, solved):
+        """Test that a longer tour never replaces a shorter one."""
+        cache = SolutionCache(tmp_path)
+        key = fingerprint(points)
+        cache.put(key, solved, 100.0)
+
+        assert not cache.put(key, np.arange(len(points)), 200.0)
+        assert cache.put(key, np.arange(len(points)), 50.0)
+        assert cache.get(key).length == 50.0
+
+    def test_evicts_least_recently_used(self, tmp_path, points):
+        """Test that the entry used longest ago is evicted first when the cache is full."""
+        cache = SolutionCache(tmp_path, max_bytes=10**9)
+        keys = [f"entry{index}" for index in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, np.arange(len(points)), 1.0, points)
+            os.utime(tmp_path / f"{key}.json", ns=(age * 10**9, age * 10**9))
+        cache.get("entry0")
+
+        cache.max_bytes = cache.nbytes() - 1
+        assert cache.evict() == 1
+
+        assert cache.get("entry1") is None
+        assert cache.get("entry0") is not None
+        assert cache.get("entry2") is not None
+
+    def test_warm_start_from_similar_instance(self, tmp_path, points, solved):
+        """Test that a slightly changed instance gets a transferred tour close to the cached length."""
+        cache = SolutionCache(tmp_path)
+        cache.put(fingerprint(points), solved, tour_length(solved, points), points)
+        changed = points.copy()
+        changed[:10] = np.random.default_rng(1).random((10, 2)) * 1000
+
+        warm = cache.warm_start(changed)
+
+        assert warm.similarity == pytest.approx(290 / 300)
+        assert is_permutation(warm.tour, 300)
+        assert tour_length(warm.tour, changed) < 1.3 * tour_length(solved, points)
+
+    def test_no_warm_start_for_different_instance(self, tmp_path, points, solved):
+        """Test that unrelated city sets and other metrics are not used as warm starts."""
+        cache = SolutionCache(tmp_path)
+        cache.put(fingerprint(points), solved, 1.0, points)
+
+        assert cache.warm_start(np.random.default_rng(5).random((300, 2)) * 1000) is None
+        assert cache.warm_start(points, metric="manhattan") is None
+
+
+class TestTransferTour:
+    """Test cases for the transfer_tour function."""
+
+    def test_identity_on_same_cities(self, points, solved):
+        """Test that transferring onto the same cities keeps the tour."""
+        assert np.array_equal(transfer_tour(solved, points, points), solved)
+
+    def test_added_city_goes_next_to_its_neighbors(self):
+        """Test that a new city is inserted along the cached edge it lies on."""
+        square = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=float)
+        grown = np.vstack((square, [[5, 0.1]]))
+
+        tour = transfer_tour(np.arange(4), square, grown)
+
+        assert tour.tolist() == [0, 4, 1, 2, 3]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the TSPLIB parser.
+"""
+
+import pytest
+import numpy as np
+from data.tsplib import parse_tsplib, problem_distance_matrix, tsplib_distance_matrix
+from logic.held_karp import held_karp
+
+
+class TestParseTsplib:
+    """Test cases for the parse_tsplib function."""
+
+    def test_parse_header_and_coordinates(self, burma14_text):
+        """Test that header fields and node coordinates are read."""
+        problem = parse_tsplib(burma14_text)
+
+        assert problem.name == "burma14"
+        assert problem.type == "TSP"
+        assert problem.dimension == 14
+        assert problem.edge_weight_type == "GEO"
+        assert problem.coordinates.shape == (14, 2)
+        assert problem.coordinates[2].tolist() == [20.09, 92.54]
+
+    def test_geo_distances_give_known_optimum(self, burma14_text):
+        """Test GEO distances against the published burma14 optimum."""
+        matrix = problem_distance_matrix(parse_tsplib(burma14_text))
+
+        assert held_karp(matrix)[1] == 3323
+
+    @pytest.mark.parametrize("edge_weight_format,weights", [
+        ("FULL_MATRIX", "0 1 2\n1 0 3\n2 3 0"),
+        ("UPPER_ROW", "1 2\n3"),
+        ("LOWER_ROW", "1\n2 3"),
+        ("UPPER_DIAG_ROW", "0 1 2\n0 3\n0"),
+        ("LOWER_DIAG_ROW", "0\n1 0\n2 3 0"),
+        ("UPPER_COL", "1\n2 3"),
+        ("LOWER_COL", "1 2\n3"),
+    ])
+    def test_explicit_matrix_formats(self, edge_weight_format, weights):
+        """Test that every triangle layout expands to the same symmetric matrix."""
+        text = (
+            "NAME: tiny\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+            f"EDGE_WEIGHT_FORMAT: {edge_weight_format}\nEDGE_WEIGHT_SECTION\n{weights}\nEOF\n"
+        )
+
+        matrix = problem_distance_matrix(parse_tsplib(text))
+
+        assert matrix.tolist() == [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
+
+    def test_asymmetric_full_matrix(self):
+        """Test that ATSP full matrices keep their direction."""
+        text = (
+            "NAME: a\nTYPE: ATSP\nDIMENSION: 2\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+            "EDGE_WEIGHT_FORMAT: FULL_MATRIX\nEDGE_WEIGHT_SECTION\n0 5\n7 0\nEOF\n"
+        )
+
+        problem = parse_tsplib(text)
+
+        assert problem.type == "ATSP"
+        assert problem.matrix.tolist() == [[0, 5], [7, 0]]
+
+    def test_tour_section(self):
+        """Test that tours are read 0-based and split at -1."""
+        text = "NAME: t.opt.tour\nTYPE: TOUR\nDIMENSION: 4\nTOUR_SECTION\n1\n3\n2\n4\n-1\nEOF\n"
+
+        problem = parse_tsplib(text)
+
+        assert [tour.tolist() for tour in problem.tours] == [[0, 2, 1, 3]]
+
+    def test_unexpected_line_raises(self):
+        """Test that stray data outside a section is rejected."""
+        with pytest.raises(ValueError):
+            parse_tsplib("NAME: x\n1 2 3\n")
+
+
+class TestTsplibDistanceMatrix:
+    """Test cases for the tsplib_distance_matrix function."""
+
+    def test_euc_2d_rounds_to_nearest(self):
+        """Test EUC_2D nint rounding."""
+        matrix = tsplib_distance_matrix([(0, 0), (1, 1), (3, 4)], "EUC_2D")
+
+        assert matrix.tolist() == [[0, 1, 5], [1, 0, 4], [5, 4, 0]]
+
+    def test_ceil_and_manhattan(self):
+        """Test CEIL_2D, MAN_2D and MAX_2D distances."""
+        points = [(0, 0), (1, 1)]
+
+        assert tsplib_distance_matrix(points, "CEIL_2D")[0, 1] == 2
+        assert tsplib_distance_matrix(points, "MAN_2D")[0, 1] == 2
+        assert tsplib_distance_matrix(points, "MAX_2D")[0, 1] == 1
+
+    def test_att_pseudo_euclidean(self):
+        """Test ATT rounding up of the pseudo-Euclidean distance."""
+        matrix = tsplib_distance_matrix([(0, 0), (10, 0)], "ATT")
+
+        # sqrt(100 / 10) = 3.16..., nint = 3 < 3.16 so the distance is 4
+        assert matrix[0, 1] == 4
+
+    def test_unknown_type(self):
+        """Test that unsupported edge weight types are rejected."""
+        with pytest.raises(ValueError):
+            tsplib_distance_matrix([(0, 0)], "XRAY1")
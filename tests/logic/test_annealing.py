@@ -0,0 +1,129 @@
+"""
+Unit tests for the simulated annealing module.
+"""
+
+import pytest
+import numpy as np
+from logic.annealing import (
+    SCHEDULES,
+    apply_swap,
+    apply_two_opt,
+    iter_simulated_annealing,
+    propose_swap,
+    propose_two_opt,
+    simulated_annealing,
+)
+from logic.distance_matrix import build_distance_matrix
+from logic.held_karp import held_karp
+from logic.population import score_population
+from data.cities import cities_locations
+
+
+def is_permutation(tour, n):
+    return sorted(int(city) for city in tour) == list(range(n))
+
+
+def chains_state(n_chains, n_cities, seed=0):
+    rng = np.random.default_rng(seed)
+    tours = np.argsort(rng.random((n_chains, n_cities)), axis=1).astype(np.int32)
+    positions = np.empty_like(tours)
+    positions[np.arange(n_chains)[:, None], tours] = np.arange(n_cities)
+    return tours, positions, rng
+
+
+@pytest.fixture
+def matrix():
+    return build_distance_matrix(np.random.default_rng(0).random((40, 2)) * 100)
+
+
+class TestMoves:
+    """Test cases for the batched move proposals and their application."""
+
+    @pytest.mark.parametrize("neighbors", [False, True])
+    def test_two_opt_delta_matches_rescoring(self, matrix, neighbors):
+        """Test that applied 2-opt moves change every chain's length by exactly its delta."""
+        tours, positions, rng = chains_state(64, 40)
+        candidates = np.argsort(matrix, axis=1)[:, 1:6] if neighbors else None
+        before = score_population(tours, matrix)
+
+        i, j, delta = propose_two_opt(tours, positions, matrix, rng, candidates)
+        apply_two_opt(tours, positions, np.arange(64), i, j)
+
+        assert np.allclose(score_population(tours, matrix), before + delta)
+        assert all(is_permutation(tour, 40) for tour in tours)
+        assert np.array_equal(np.take_along_axis(positions, tours, axis=1), np.tile(np.arange(40), (64, 1)))
+
+    def test_swap_delta_matches_rescoring_on_asymmetric_matrix(self, matrix):
+        """Test that swap deltas are exact even when d(i, j) != d(j, i)."""
+        asymmetric = matrix + np.random.default_rng(1).random(matrix.shape) * 30
+        tours, positions, rng = chains_state(64, 40)
+        before = score_population(tours, asymmetric)
+
+        i, j, delta = propose_swap(tours, positions, asymmetric, rng)
+        apply_swap(tours, positions, np.arange(64), i, j)
+
+        assert np.allclose(score_population(tours, asymmetric), before + delta)
+        assert np.array_equal(np.take_along_axis(positions, tours, axis=1), np.tile(np.arange(40), (64, 1)))
+
+    def test_only_selected_rows_change(self, matrix):
+        """Test that rejected chains keep their tours."""
+        tours, positions, rng = chains_state(8, 40)
+        original = tours.copy()
+        i, j, _ = propose_two_opt(tours, positions, matrix, rng)
+
+        apply_two_opt(tours, positions, np.array([2, 5]), i[[2, 5]], j[[2, 5]])
+
+        untouched = [0, 1, 3, 4, 6, 7]
+        assert np.array_equal(tours[untouched], original[untouched])
+
+
+class TestSimulatedAnnealing:
+    """Test cases for the simulated_annealing solver."""
+
+    @pytest.mark.parametrize("schedule", sorted(SCHEDULES))
+    def test_finds_optimum_of_small_instance(self, schedule):
+        """Test that every schedule reaches the Held-Karp optimum of the 12-city set."""
+        matrix = build_distance_matrix(cities_locations[12])
+        optimum = held_karp(matrix)[1]
+
+        result = simulated_annealing(matrix, chains=64, steps=3000, schedule=schedule, seed=0)
+
+        assert is_permutation(result.tour, 12)
+        assert result.length == pytest.approx(optimum)
+        assert 0 < result.acceptance < 1
+
+    def test_length_matches_tour(self, matrix):
+        """Test that the reported length is the exact length of the reported tour."""
+        result = simulated_annealing(matrix, chains=32, steps=2000, seed=1)
+
+        assert result.length == pytest.approx(score_population(result.tour[None, :], matrix)[0])
+
+    def test_reheating(self, matrix):
+        """Test that a stalled run reheats and never reports a worse best."""
+        result = simulated_annealing(matrix, chains=16, steps=3000, reheat_after=200, seed=2)
+
+        assert result.reheats > 0
+        assert result.history == sorted(result.history, reverse=True)
+
+    def test_asymmetric_matrix(self, matrix):
+        """Test that an asymmetric matrix is annealed with exact lengths."""
+        asymmetric = matrix + np.random.default_rng(3).random(matrix.shape) * 30
+        np.fill_diagonal(asymmetric, 0)
+
+        result = simulated_annealing(asymmetric, chains=32, steps=2000, seed=3)
+
+        assert is_permutation(result.tour, 40)
+        assert result.length == pytest.approx(score_population(result.tour[None, :], asymmetric)[0])
+
+    def test_progress_and_time_limit(self, matrix):
+        """Test that snapshots are yielded per report interval and a time limit stops the run."""
+        snapshots = list(iter_simulated_annealing(matrix, chains=8, steps=500, report_interval=100, seed=4))
+        stopped = simulated_annealing(matrix, chains=8, steps=10**9, time_limit=0.2, seed=4)
+
+        assert [snapshot.generation for snapshot in snapshots] == [100, 200, 300, 400, 500, 500]
+        assert stopped.steps < 10**9
+
+    def test_unknown_schedule(self, matrix):
+        """Test that an unknown schedule raises a ValueError."""
+        with pytest.raises(ValueError):
+            simulated_annealing(matrix, schedule="quadratic")
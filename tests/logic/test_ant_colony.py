@@ -0,0 +1,144 @@
+"""
+Unit tests for the ant colony module.
+"""
+
+import pytest
+import numpy as np
+from scipy.spatial import cKDTree
+from logic.ant_colony import (
+    _LocalArray,
+    _deposit,
+    _nearest_unvisited,
+    ant_colony,
+    construct_tours,
+    iter_ant_colony,
+)
+from logic.distance_matrix import build_distance_matrix
+from logic.held_karp import held_karp
+from logic.local_search import neighbor_lists
+from logic.metrics import get_metric, metric_distance_matrix
+from logic.population import score_population
+from data.cities import cities_locations
+from data.tsplib import tsplib_distance_matrix
+
+
+def is_permutation(tour, n):
+    return sorted(int(city) for city in tour) == list(range(n))
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).random((120, 2)) * 1000
+
+
+class TestConstruction:
+    """Test cases for the lockstep tour construction."""
+
+    def test_tours_are_permutations(self, points):
+        """Test that every ant visits every city once, even when candidate lists run out."""
+        neighbors = neighbor_lists(3, coordinates=points)
+        attractiveness = np.ones(neighbors.shape)
+
+        tours = construct_tours(16, neighbors, attractiveness, {"points": _LocalArray(points)},
+                                np.random.default_rng(1))
+
+        assert tours.shape == (16, 120)
+        assert all(is_permutation(tour, 120) for tour in tours)
+
+    def test_follows_attractiveness(self, points):
+        """Test that ants take the only attractive candidate edge whenever it is free."""
+        neighbors = neighbor_lists(5, coordinates=points)
+        attractiveness = np.zeros(neighbors.shape)
+        attractiveness[:, 0] = 1.0
+        matrix = build_distance_matrix(points)
+
+        tours = construct_tours(4, neighbors, attractiveness, {"matrix": _LocalArray(matrix)},
+                                np.random.default_rng(2))
+
+        for tour in tours:
+            for step in range(119):
+                a, b = tour[step], tour[step + 1]
+                assert b == neighbors[a, 0] or neighbors[a, 0] in tour[:step]
+
+    @pytest.mark.parametrize("metric", ["euclidean", "manhattan", "EUC_2D"])
+    def test_stuck_ants_go_to_nearest_unvisited(self, points, metric):
+        """Test that the KD-tree fallback finds the nearest unvisited city, even when almost all are visited."""
+        rng = np.random.default_rng(5)
+        cities = rng.integers(0, 120, 30)
+        visited = rng.random((30, 120)) < 0.95
+        visited[np.arange(30), cities] = True
+        distances = metric_distance_matrix(points, metric)[cities]
+        distances[visited] = np.inf
+
+        chosen = _nearest_unvisited(cities, visited, {"points": _LocalArray(points)}, get_metric(metric),
+                                    cKDTree(points), 2)
+
+        assert not visited[np.arange(30), chosen].any()
+        assert np.array_equal(distances[np.arange(30), chosen], distances.min(axis=1))
+
+    def test_deposit_only_on_candidate_edges(self):
+        """Test that a tour deposits on its candidate edges in both directions and nowhere else."""
+        neighbors = np.array([[1, 2], [0, 2], [1, 3], [2, 0]])
+        pheromone = np.zeros((4, 2))
+
+        _deposit(pheromone, neighbors, np.array([0, 1, 2, 3]), 1.0, symmetric=True)
+
+        assert pheromone.tolist() == [[1.0, 0.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0]]
+
+
+class TestAntColony:
+    """Test cases for the ant_colony solver."""
+
+    def test_finds_optimum_of_bundled_instance(self):
+        """Test that the colony reaches the Held-Karp optimum of the 12-city set without local search."""
+        matrix = build_distance_matrix(cities_locations[12])
+        optimum = held_karp(matrix)[1]
+
+        result = ant_colony(matrix, ants=10, iterations=200, improve=False, seed=0)
+
+        assert is_permutation(result.tour, 12)
+        assert result.length == pytest.approx(optimum)
+
+    def test_length_matches_tour(self, points):
+        """Test that the reported length is the length of the reported tour on coordinates."""
+        result = ant_colony(coordinates=points, ants=8, iterations=10, seed=1)
+
+        matrix = build_distance_matrix(points)
+        assert result.length == pytest.approx(score_population(result.tour[None, :], matrix)[0])
+        assert result.history == sorted(result.history, reverse=True)
+
+    def test_workers_give_valid_tours(self, points):
+        """Test that building ant batches in a process pool gives a valid, improving run."""
+        result = ant_colony(coordinates=points, ants=8, iterations=5, workers=2, seed=2)
+
+        assert is_permutation(result.tour, 120)
+        assert result.iterations == 5
+
+    def test_asymmetric_matrix(self, points):
+        """Test that an asymmetric matrix is solved with exact directed lengths."""
+        matrix = build_distance_matrix(points[:30]) + np.random.default_rng(3).random((30, 30)) * 50
+        np.fill_diagonal(matrix, 0)
+
+        result = ant_colony(matrix, ants=8, iterations=10, seed=3)
+
+        assert result.length == pytest.approx(score_population(result.tour[None, :], matrix)[0])
+
+    def test_tsplib_metric_on_coordinates(self, points):
+        """Test that coordinates under a TSPLIB metric give the length of its rounded distances."""
+        coordinates = points[:40] * 10
+        matrix = tsplib_distance_matrix(coordinates, "ATT")
+
+        result = ant_colony(coordinates=coordinates, ants=6, iterations=5, seed=5, metric="ATT")
+
+        assert result.length == score_population(result.tour[None, :], matrix)[0]
+
+    def test_progress_per_iteration(self, points):
+        """Test that one snapshot per iteration is yielded for the fitness plot."""
+        snapshots = list(iter_ant_colony(coordinates=points, ants=4, iterations=6, improve=False, seed=4))
+
+        assert [snapshot.generation for snapshot in snapshots] == [1, 2, 3, 4, 5, 6]
+
+    def test_requires_distances(self):
+        """Test that a missing matrix and coordinates raise a ValueError."""
+        with pytest.raises(ValueError):
+            ant_colony()
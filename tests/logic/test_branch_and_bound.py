@@ -0,0 +1,91 @@
+"""
+Unit tests for the branch-and-bound solver.
+"""
+
+import pytest
+import numpy as np
+from logic.branch_and_bound import branch_and_bound, minimum_spanning_tree_weight
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.held_karp import held_karp
+from data.cities import cities_locations
+
+
+class TestBranchAndBound:
+    """Test cases for the branch_and_bound function."""
+
+    @pytest.mark.parametrize("n_cities", [5, 10, 12, 15])
+    def test_branch_and_bound_matches_held_karp(self, n_cities):
+        """Test that a complete search proves the Held-Karp optimum."""
+        matrix = build_distance_matrix(cities_locations[n_cities])
+
+        result = branch_and_bound(matrix)
+
+        assert result.optimal
+        assert result.length == pytest.approx(held_karp(matrix)[1])
+        assert result.gap == pytest.approx(0.0)
+        assert path_length(result.tour, matrix, closed=True) == pytest.approx(result.length)
+
+    def test_branch_and_bound_node_budget_reports_gap(self):
+        """Test that an exhausted node budget returns a valid bound and gap."""
+        rng = np.random.default_rng(3)
+        matrix = build_distance_matrix(rng.random((25, 2)))
+
+        result = branch_and_bound(matrix, node_limit=50)
+
+        assert not result.optimal
+        assert result.nodes == 50
+        assert result.lower_bound <= result.length
+        assert 0.0 < result.gap < 1.0
+        assert sorted(result.tour.tolist()) == list(range(25))
+
+    def test_branch_and_bound_time_budget(self):
+        """Test that the time budget bounds the search."""
+        rng = np.random.default_rng(4)
+        matrix = build_distance_matrix(rng.random((35, 2)))
+
+        result = branch_and_bound(matrix, time_limit=0.2)
+
+        assert result.lower_bound <= result.length
+
+    def test_branch_and_bound_lower_bound_is_valid(self):
+        """Test that the budgeted lower bound never exceeds the true optimum."""
+        matrix = build_distance_matrix(cities_locations[15])
+        optimum = held_karp(matrix)[1]
+
+        result = branch_and_bound(matrix, node_limit=10)
+
+        assert result.lower_bound <= optimum + 1e-9
+
+    def test_branch_and_bound_asymmetric(self):
+        """Test that direction-dependent costs are respected."""
+        matrix = np.array([
+            [0, 1, 10, 10],
+            [10, 0, 1, 10],
+            [10, 10, 0, 1],
+            [1, 10, 10, 0],
+        ], dtype=float)
+
+        result = branch_and_bound(matrix)
+
+        assert result.tour.tolist() == [0, 1, 2, 3]
+        assert result.length == 4.0
+
+    def test_branch_and_bound_initial_tour(self):
+        """Test that a given incumbent is used and rotated to start at city 0."""
+        matrix = build_distance_matrix(cities_locations[10])
+        tour, length = held_karp(matrix)
+
+        result = branch_and_bound(matrix, initial_tour=np.roll(tour, 3), node_limit=0)
+
+        assert result.tour[0] == 0
+        assert result.length == pytest.approx(length)
+
+
+class TestMinimumSpanningTreeWeight:
+    """Test cases for the minimum_spanning_tree_weight function."""
+
+    def test_minimum_spanning_tree_weight_unit_square(self, sample_coordinates):
+        """Test the MST of a unit square."""
+        matrix = build_distance_matrix(sample_coordinates)
+
+        assert minimum_spanning_tree_weight(matrix) == pytest.approx(3.0)
@@ -4,7 +4,9 @@ Unit tests for the cities logic module.
 
 import pytest
 import math
+import numpy as np
 from logic.cities import calculate_distance, calculate_total_distance, routes_to_cities
+from logic.distance_matrix import build_distance_matrix
 
 
 class TestCalculateDistance:
@@ -309,3 +311,23 @@ class TestCalculateTotalDistance:
         result = calculate_total_distance(path)
         
         assert abs(result - expected_total) < 1e-10
+
+    def test_calculate_total_distance_index_path_matches_tuple_path(self):
+        """Test that an index path scored against a matrix matches the tuple path."""
+        cities = [(533, 251), (506, 87), (346, 97), (362, 49), (376, 253)]
+        order = np.array([2, 0, 4, 1, 3])
+        matrix = build_distance_matrix(cities)
+
+        result = calculate_total_distance(order, matrix)
+        expected = calculate_total_distance([cities[i] for i in order])
+
+        assert abs(result - expected) < 1e-10
+        assert isinstance(result, float)
+
+    def test_calculate_total_distance_index_path_condensed(self, sample_coordinates):
+        """Test index path scoring against a condensed matrix."""
+        matrix = build_distance_matrix(sample_coordinates, condensed=True)
+
+        result = calculate_total_distance([0, 1, 3, 2, 0], matrix)
+
+        assert abs(result - 4.0) < 1e-10
@@ -0,0 +1,117 @@
+"""
+Unit tests for the tour construction module.
+"""
+
+import pytest
+import numpy as np
+from logic.construction import (
+    as_square_matrix,
+    greedy_edge_tour,
+    nearest_neighbor_tour,
+    spatial_nearest_neighbor_tour,
+)
+from logic.distance_matrix import build_distance_matrix, path_length
+from data.cities import cities_locations
+
+
+class TestNearestNeighborTour:
+    """Test cases for the nearest_neighbor_tour function."""
+
+    def test_nearest_neighbor_tour_is_permutation(self):
+        """Test that every city is visited exactly once."""
+        matrix = build_distance_matrix(cities_locations[15])
+
+        tour = nearest_neighbor_tour(matrix)
+
+        assert sorted(tour.tolist()) == list(range(15))
+        assert tour[0] == 0
+
+    def test_nearest_neighbor_tour_follows_line(self):
+        """Test that cities on a line are visited in order."""
+        cities = [(0, 0), (5, 0), (1, 0), (3, 0), (2, 0)]
+
+        tour = nearest_neighbor_tour(build_distance_matrix(cities))
+
+        assert tour.tolist() == [0, 2, 4, 3, 1]
+
+    def test_nearest_neighbor_tour_start_and_condensed(self):
+        """Test a custom start city on a condensed matrix."""
+        matrix = build_distance_matrix(cities_locations[10], condensed=True)
+
+        tour = nearest_neighbor_tour(matrix, start=4)
+
+        assert tour[0] == 4
+        assert sorted(tour.tolist()) == list(range(10))
+
+    def test_nearest_neighbor_tour_empty(self):
+        """Test that an empty instance gives an empty tour."""
+        assert nearest_neighbor_tour(np.zeros((0, 0))).size == 0
+
+
+class TestSpatialNearestNeighborTour:
+    """Test cases for the spatial_nearest_neighbor_tour function."""
+
+    @pytest.mark.parametrize("n_cities", [5, 10, 12, 15])
+    def test_spatial_nearest_neighbor_matches_matrix_version(self, n_cities):
+        """Test that the spatial index builder visits cities in the same order."""
+        cities = cities_locations[n_cities]
+
+        tour = spatial_nearest_neighbor_tour(cities)
+
+        assert tour.tolist() == nearest_neighbor_tour(build_distance_matrix(cities)).tolist()
+
+    def test_spatial_nearest_neighbor_large_instance(self):
+        """Test a permutation is produced for a larger random instance."""
+        cities = np.random.default_rng(0).random((2000, 2))
+
+        tour = spatial_nearest_neighbor_tour(cities, start=17)
+
+        assert tour[0] == 17
+        assert sorted(tour.tolist()) == list(range(2000))
+
+
+class TestGreedyEdgeTour:
+    """Test cases for the greedy_edge_tour function."""
+
+    @pytest.mark.parametrize("n_cities", [3, 50, 2000])
+    def test_greedy_edge_tour_is_permutation(self, n_cities):
+        """Test that every city is visited exactly once."""
+        cities = np.random.default_rng(n_cities).random((n_cities, 2))
+
+        tour = greedy_edge_tour(cities)
+
+        assert sorted(tour.tolist()) == list(range(n_cities))
+
+    def test_greedy_edge_tour_follows_line(self):
+        """Test that cities on a line are joined in order."""
+        cities = [(0, 0), (5, 0), (1, 0), (3, 0), (2, 0)]
+
+        tour = greedy_edge_tour(cities, n_neighbors=2).tolist()
+
+        assert tour in ([0, 2, 4, 3, 1], [1, 3, 4, 2, 0])
+
+    def test_greedy_edge_tour_quality(self):
+        """Test that greedy edge is within 30% of the nearest-neighbor length or better."""
+        cities = np.random.default_rng(1).random((500, 2))
+        matrix = build_distance_matrix(cities)
+
+        greedy = path_length(greedy_edge_tour(cities), matrix, closed=True)
+        nearest = path_length(nearest_neighbor_tour(matrix), matrix, closed=True)
+
+        assert greedy <= 1.3 * nearest
+
+    def test_greedy_edge_tour_tiny(self):
+        """Test instances with fewer than three cities."""
+        assert greedy_edge_tour([(0, 0), (1, 1)]).tolist() == [0, 1]
+
+
+class TestAsSquareMatrix:
+    """Test cases for the as_square_matrix function."""
+
+    def test_as_square_matrix_expands_condensed(self, sample_coordinates):
+        """Test that condensed matrices are expanded and square ones are unchanged."""
+        square = build_distance_matrix(sample_coordinates)
+        condensed = build_distance_matrix(sample_coordinates, condensed=True)
+
+        assert np.allclose(as_square_matrix(condensed), square)
+        assert as_square_matrix(square) is square
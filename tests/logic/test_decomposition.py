@@ -0,0 +1,131 @@
+"""
+Unit tests for the partition-and-merge decomposition module.
+"""
+
+import pytest
+import numpy as np
+from logic.cities import calculate_distance
+from logic.decomposition import (
+    decomposition,
+    grid_partition,
+    kmeans_partition,
+    merge_cluster_tours,
+    tour_length,
+)
+
+
+def is_permutation(tour, n_cities: int) -> bool:
+    """Return True if tour visits every city exactly once."""
+    return sorted(np.asarray(tour).tolist()) == list(range(n_cities))
+
+
+class TestPartitions:
+    """Test cases for the grid and k-means partitions."""
+
+    def test_grid_partition_cell_sizes(self):
+        """Test that uniform cities are split into cells of about cluster_size."""
+        points = np.random.default_rng(0).random((4000, 2))
+
+        labels = grid_partition(points, cluster_size=1000)
+
+        counts = np.bincount(labels)
+        assert counts.size == 4
+        assert counts.min() > 800
+
+    def test_grid_partition_degenerate_line(self):
+        """Test that collinear cities do not divide by a zero extent."""
+        points = np.column_stack((np.arange(100.0), np.zeros(100)))
+
+        labels = grid_partition(points, cluster_size=10)
+
+        assert np.array_equal(np.unique(labels), np.arange(labels.max() + 1))
+
+    def test_kmeans_partition_separates_blobs(self):
+        """Test that two far-apart blobs end up in different clusters."""
+        rng = np.random.default_rng(1)
+        points = np.vstack((rng.random((500, 2)), rng.random((500, 2)) + 100))
+
+        labels = kmeans_partition(points, cluster_size=500, seed=0)
+
+        assert len(set(labels[:500].tolist())) == 1
+        assert len(set(labels[500:].tolist())) == 1
+        assert labels[0] != labels[-1]
+
+
+class TestMergeClusterTours:
+    """Test cases for the merge_cluster_tours function."""
+
+    def test_merge_two_squares(self):
+        """Test that two unit squares merge by dropping their facing edges."""
+        points = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (3, 0), (4, 0), (4, 1), (3, 1)], dtype=float)
+        tours = [np.array([0, 1, 2, 3]), np.array([4, 5, 6, 7])]
+        centres = np.array([(0.5, 0.5), (3.5, 0.5)])
+
+        tour = merge_cluster_tours(tours, points, np.array([0, 1]), centres)
+
+        assert is_permutation(tour, 8)
+        assert tour_length(tour, points) == pytest.approx(10.0)
+
+
+class TestDecomposition:
+    """Test cases for the decomposition function."""
+
+    def test_tour_length_uses_calculate_distance(self):
+        """Test that lengths match summing calculate_distance around the tour."""
+        points = np.random.default_rng(2).integers(0, 1000, size=(50, 2)).astype(float)
+        tour = np.arange(50)
+        cities = [tuple(point) for point in points.tolist()]
+
+        expected = sum(calculate_distance(cities[i], cities[(i + 1) % 50]) for i in range(50))
+
+        assert tour_length(tour, points) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("method", ["grid", "kmeans"])
+    def test_decomposition_valid_and_close_to_monolithic(self, method):
+        """Test that the merged tour is valid and near a single local search run."""
+        points = np.random.default_rng(3).random((3000, 2))
+
+        result = decomposition(points, cluster_size=500, method=method, seed=0)
+
+        assert is_permutation(result.tour, 3000)
+        assert result.n_clusters > 1
+        assert result.length == pytest.approx(tour_length(result.tour, points))
+        # A 2-opt / Or-opt tour on uniform points is about 5% above 0.7124 * sqrt(n * area).
+        assert result.length < 0.7124 * np.sqrt(3000) * 1.12
+
+    def test_repair_never_lengthens(self):
+        """Test that the boundary repair pass only shortens the merged tour."""
+        points = np.random.default_rng(4).random((2000, 2))
+
+        merged = decomposition(points, cluster_size=250, cluster_solver="greedy", repair=False)
+        repaired = decomposition(points, cluster_size=250, cluster_solver="greedy")
+
+        assert repaired.length <= merged.length
+        assert "repair" in repaired.timings and "repair" not in merged.timings
+
+    def test_worker_pool_matches_in_process(self):
+        """Test that solving clusters in a process pool gives the in-process result."""
+        points = np.random.default_rng(5).random((1200, 2))
+
+        local = decomposition(points, cluster_size=300, seed=0)
+        pooled = decomposition(points, cluster_size=300, seed=0, workers=2)
+
+        assert np.array_equal(local.tour, pooled.tour)
+
+    def test_single_cluster_and_tiny_instances(self):
+        """Test instances that fit in one cluster or have only a few cities."""
+        points = np.random.default_rng(6).random((50, 2))
+
+        assert is_permutation(decomposition(points).tour, 50)
+        assert is_permutation(decomposition(points[:3], cluster_size=4).tour, 3)
+
+    def test_invalid_arguments(self):
+        """Test that unknown methods, solvers and empty inputs are rejected."""
+        points = np.random.default_rng(7).random((10, 2))
+
+        with pytest.raises(ValueError):
+            decomposition(points, method="hexagons")
+        with pytest.raises(ValueError):
+            decomposition(points, cluster_solver="oracle")
+        with pytest.raises(ValueError):
+            decomposition(np.empty((0, 2)))
@@ -0,0 +1,122 @@
+"""
+Unit tests for the distance matrix module.
+"""
+
+import pytest
+import numpy as np
+from logic.cities import calculate_distance
+from logic.distance_matrix import (
+    build_distance_matrix,
+    condensed_index,
+    condensed_lookup,
+    matrix_size,
+    path_length,
+)
+from data.cities import cities_locations
+
+
+class TestBuildDistanceMatrix:
+    """Test cases for the build_distance_matrix function."""
+
+    def test_build_distance_matrix_matches_calculate_distance(self):
+        """Test that every matrix entry agrees with calculate_distance."""
+        cities = cities_locations[10]
+
+        matrix = build_distance_matrix(cities)
+
+        for i, city1 in enumerate(cities):
+            for j, city2 in enumerate(cities):
+                assert abs(matrix[i, j] - calculate_distance(city1, city2)) < 1e-10
+
+    def test_build_distance_matrix_shape_and_symmetry(self, sample_coordinates):
+        """Test that the square matrix is n x n, symmetric and zero on the diagonal."""
+        matrix = build_distance_matrix(sample_coordinates)
+
+        assert matrix.shape == (4, 4)
+        assert np.allclose(matrix, matrix.T)
+        assert np.all(np.diag(matrix) == 0)
+
+    @pytest.mark.parametrize("dtype,expected", [
+        ("float32", np.float32),
+        ("float64", np.float64),
+        (np.float32, np.float32),
+    ])
+    def test_build_distance_matrix_dtype(self, sample_coordinates, dtype, expected):
+        """Test that the requested precision is used."""
+        matrix = build_distance_matrix(sample_coordinates, dtype=dtype)
+
+        assert matrix.dtype == expected
+
+    def test_build_distance_matrix_invalid_dtype(self, sample_coordinates):
+        """Test that unsupported dtypes are rejected."""
+        with pytest.raises(ValueError):
+            build_distance_matrix(sample_coordinates, dtype="int32")
+
+    def test_build_distance_matrix_invalid_shape(self):
+        """Test that coordinates that are not (x, y) pairs are rejected."""
+        with pytest.raises(ValueError):
+            build_distance_matrix([(0, 0, 0), (1, 1, 1)])
+
+    def test_build_distance_matrix_condensed(self):
+        """Test that the condensed layout holds the upper triangle of the square matrix."""
+        cities = cities_locations[12]
+        n = len(cities)
+
+        square = build_distance_matrix(cities)
+        condensed = build_distance_matrix(cities, condensed=True)
+
+        assert condensed.shape == (n * (n - 1) // 2,)
+        rows, cols = np.triu_indices(n, k=1)
+        assert np.allclose(condensed[condensed_index(n, rows, cols)], square[rows, cols])
+
+
+class TestCondensedLookup:
+    """Test cases for condensed matrix indexing helpers."""
+
+    def test_condensed_lookup_symmetric_and_diagonal(self):
+        """Test lookups in both directions and on the diagonal."""
+        cities = cities_locations[5]
+        square = build_distance_matrix(cities)
+        condensed = build_distance_matrix(cities, condensed=True)
+        i, j = np.meshgrid(np.arange(5), np.arange(5), indexing="ij")
+
+        result = condensed_lookup(condensed, 5, i, j)
+
+        assert np.allclose(result, square)
+
+    @pytest.mark.parametrize("n", [1, 2, 5, 15])
+    def test_matrix_size(self, n):
+        """Test that the city count is recovered from both layouts."""
+        cities = cities_locations[15][:n]
+
+        assert matrix_size(build_distance_matrix(cities)) == n
+        assert matrix_size(build_distance_matrix(cities, condensed=True)) == n
+
+
+class TestPathLength:
+    """Test cases for the path_length function."""
+
+    def test_path_length_open_and_closed(self, sample_coordinates):
+        """Test open path and closed tour scoring on a unit square."""
+        matrix = build_distance_matrix(sample_coordinates)
+        tour = np.array([0, 1, 3, 2])
+
+        assert path_length(tour, matrix) == pytest.approx(3.0)
+        assert path_length(tour, matrix, closed=True) == pytest.approx(4.0)
+
+    def test_path_length_condensed_matches_square(self):
+        """Test that both matrix layouts give the same length."""
+        cities = cities_locations[15]
+        tour = np.random.default_rng(0).permutation(len(cities))
+
+        square = path_length(tour, build_distance_matrix(cities), closed=True)
+        condensed = path_length(tour, build_distance_matrix(cities, condensed=True), closed=True)
+
+        assert condensed == pytest.approx(square)
+
+    def test_path_length_short_paths(self, sample_coordinates):
+        """Test that empty and single-city paths have zero length."""
+        matrix = build_distance_matrix(sample_coordinates)
+
+        assert path_length([], matrix) == 0.0
+        assert path_length([2], matrix, closed=True) == 0.0
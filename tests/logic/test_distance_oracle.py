@@ -0,0 +1,148 @@
+"""
+Unit tests for the distance oracle module.
+"""
+
+import pytest
+import numpy as np
+from logic.cities import calculate_distance
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.distance_oracle import (
+    DenseOracle,
+    LRUOracle,
+    NeighborOracle,
+    choose_backend,
+    make_oracle,
+)
+from logic.local_search import local_search, neighbor_lists
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).random((300, 2)) * 1000
+
+
+class TestBackends:
+    """Test cases for the three oracle backends."""
+
+    @pytest.mark.parametrize("backend", ["dense", "neighbors", "lru"])
+    def test_backends_agree_with_calculate_distance(self, points, backend):
+        """Test that every backend returns the calculate_distance value."""
+        oracle = make_oracle(coordinates=points, backend=backend)
+        cities = [tuple(point) for point in points.tolist()]
+        pairs = np.random.default_rng(1).integers(0, 300, size=(500, 2)).tolist()
+
+        for i, j in pairs:
+            assert oracle(i, j) == pytest.approx(calculate_distance(cities[i], cities[j]))
+        assert oracle.backend == backend
+        assert len(oracle) == 300
+
+    def test_neighbor_oracle_hits_for_neighbors(self, points):
+        """Test that neighbor pairs in either order hit and other pairs miss."""
+        oracle = NeighborOracle(points, n_neighbors=5)
+        neighbors = oracle.neighbor_lists(5)
+
+        oracle(0, int(neighbors[0, 0]))
+        oracle(int(neighbors[0, 1]), 0)
+        far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        oracle(0, far)
+
+        stats = oracle.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_lru_oracle_evicts_least_recent(self):
+        """Test LRU hits, eviction order and the capacity bound."""
+        calls = []
+
+        def pair_distance(i, j):
+            calls.append((i, j))
+            return float(abs(i - j))
+
+        oracle = LRUOracle(capacity=2, pair_distance=pair_distance, n_cities=10)
+        oracle(1, 2)
+        oracle(2, 1)
+        oracle(3, 4)
+        oracle(1, 2)
+        oracle(5, 6)
+        oracle(3, 4)
+
+        assert calls == [(1, 2), (3, 4), (5, 6), (3, 4)]
+        assert (oracle.hits, oracle.misses) == (2, 4)
+        assert oracle.nbytes > 0 and len(oracle._cache) == 2
+
+    def test_lru_without_capacity_only_computes(self, points):
+        """Test that capacity 0 computes every lookup and stores nothing."""
+        oracle = LRUOracle(points, capacity=0)
+
+        oracle(0, 1)
+        oracle(0, 1)
+
+        assert oracle.stats().misses == 2
+        assert oracle.nbytes == 0
+
+    def test_reset_stats(self, points):
+        """Test that counters can be reset."""
+        oracle = LRUOracle(points, capacity=10)
+        oracle(0, 1)
+
+        oracle.reset_stats()
+
+        assert oracle.stats().lookups == 0
+        assert oracle.stats().hit_rate == 1.0
+
+    def test_neighbor_lists_match_local_search(self, points):
+        """Test that every backend gives the same candidate lists as local_search."""
+        expected = neighbor_lists(6, coordinates=points)
+
+        for backend in ("dense", "neighbors", "lru"):
+            assert np.array_equal(make_oracle(coordinates=points, backend=backend).neighbor_lists(6), expected)
+
+
+class TestMakeOracle:
+    """Test cases for backend selection."""
+
+    def test_choose_backend_by_budget(self):
+        """Test that dense is picked when it fits and the fallbacks otherwise."""
+        assert choose_backend(1000, memory_budget=8 * 1000 * 1000) == "dense"
+        assert choose_backend(100_000, memory_budget=2**30) == "lru"
+        assert choose_backend(100_000, memory_budget=2**30, cheap_distance=False) == "neighbors"
+        assert choose_backend(100_000, memory_budget=2**20, cheap_distance=False) == "lru"
+
+    def test_make_oracle_auto(self, points):
+        """Test automatic backends for matrices, small and large coordinate sets."""
+        assert isinstance(make_oracle(build_distance_matrix(points)), DenseOracle)
+        assert isinstance(make_oracle(coordinates=points), DenseOracle)
+
+        large = make_oracle(coordinates=points, memory_budget=1000)
+        assert isinstance(large, LRUOracle) and large.capacity == 0
+
+        expensive = make_oracle(coordinates=points, pair_distance=lambda i, j: 1.0, memory_budget=300 * 8 * 100)
+        assert isinstance(expensive, NeighborOracle)
+
+    def test_make_oracle_passes_oracles_through(self, points):
+        """Test that an existing oracle is returned unchanged."""
+        oracle = LRUOracle(points)
+
+        assert make_oracle(oracle) is oracle
+
+    def test_make_oracle_rejects_bad_arguments(self, points):
+        """Test errors for missing data and unknown backends."""
+        with pytest.raises(ValueError):
+            make_oracle()
+        with pytest.raises(ValueError):
+            make_oracle(pair_distance=lambda i, j: 0.0)
+        with pytest.raises(ValueError):
+            make_oracle(coordinates=points, backend="redis")
+
+    def test_local_search_reports_through_oracle(self, points):
+        """Test that solvers accept an oracle and its stats show their lookups."""
+        oracle = NeighborOracle(points, n_neighbors=10)
+        matrix = build_distance_matrix(points)
+
+        tour, delta = local_search(np.arange(300), oracle)
+
+        assert path_length(tour, matrix, closed=True) == pytest.approx(
+            path_length(np.arange(300), matrix, closed=True) + delta
+        )
+        assert oracle.stats().lookups > 0
+        assert oracle.stats().hit_rate > 0.5
@@ -0,0 +1,152 @@
+"""
+Unit tests for the dynamic tour module.
+"""
+
+import time
+
+import pytest
+import numpy as np
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.dynamic_tour import DynamicTour
+from data.cities import cities_locations
+
+
+def is_permutation(tour, n):
+    return sorted(int(city) for city in tour) == list(range(n))
+
+
+def exact_length(tour: DynamicTour) -> float:
+    order = tour.order()
+    points = np.array([tour.point(city) for city in order])
+    return float(np.hypot(*(points - np.roll(points, -1, axis=0)).T).sum())
+
+
+class TestDynamicTour:
+    """Test cases for the DynamicTour class."""
+
+    def test_initial_tour(self):
+        """Test that the initial tour and length match the given order."""
+        cities = cities_locations[15]
+        order = np.random.default_rng(0).permutation(15)
+
+        tour = DynamicTour(cities, tour=order)
+
+        assert tour.order(int(order[0])).tolist() == order.tolist()
+        assert tour.length == pytest.approx(path_length(order, build_distance_matrix(cities), closed=True))
+        assert len(tour) == 15 and 14 in tour and 15 not in tour
+
+    def test_default_tour_is_permutation(self):
+        """Test that the default greedy start visits every city once."""
+        tour = DynamicTour(cities_locations[15])
+
+        assert is_permutation(tour.order(), 15)
+        assert tour.length == pytest.approx(exact_length(tour))
+
+    def test_invalid_tour(self):
+        """Test that the initial tour must be a permutation."""
+        with pytest.raises(ValueError):
+            DynamicTour(cities_locations[5], tour=[0, 1, 2, 2, 4])
+
+    def test_cheapest_insertion(self):
+        """Test that a city goes into the edge whose length grows least."""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        tour = DynamicTour(square, tour=[0, 1, 2, 3], repair=False)
+
+        city = tour.insert((5, 1))
+
+        assert city == 4
+        assert tour.prev(city) == 0 and tour.next(city) == 1
+        assert tour.length == pytest.approx(30 + 2 * np.hypot(5, 1))
+
+    def test_insert_into_empty_tour(self):
+        """Test growing a tour from nothing."""
+        tour = DynamicTour()
+
+        for point in [(0, 0), (3, 4), (3, 0)]:
+            tour.insert(point)
+
+        assert is_permutation(tour.order(), 3)
+        assert tour.length == pytest.approx(12)
+
+    def test_remove(self):
+        """Test that removing a city joins its neighbors and keeps the rest of the order."""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        tour = DynamicTour(square, tour=[0, 1, 2, 3])
+
+        tour.remove(1)
+
+        assert tour.order().tolist() == [0, 2, 3]
+        assert tour.length == pytest.approx(20 + np.hypot(10, 10))
+        with pytest.raises(KeyError):
+            tour.remove(1)
+        with pytest.raises(KeyError):
+            tour.next(1)
+
+    def test_remove_every_city(self):
+        """Test that removing every city leaves an empty tour of length zero."""
+        tour = DynamicTour(cities_locations[5])
+
+        for city in range(5):
+            tour.remove(city)
+
+        assert len(tour) == 0 and tour.length == 0
+        assert tour.order().size == 0
+
+    def test_move_keeps_id(self):
+        """Test that a moved city keeps its id and is reinserted near its new position."""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10), (5, -1)]
+        tour = DynamicTour(square, tour=[0, 4, 1, 2, 3], repair=False)
+
+        tour.move(4, (5, 11))
+
+        assert tour.point(4) == (5, 11)
+        assert tour.prev(4) == 2 and tour.next(4) == 3
+        assert tour.length == pytest.approx(30 + 2 * np.hypot(5, 1))
+
+    def test_length_stays_exact_under_random_updates(self):
+        """Test the incremental length and the tour against a full recount after every update."""
+        rng = np.random.default_rng(3)
+        tour = DynamicTour(rng.random((60, 2)) * 100)
+        alive = set(range(60))
+
+        for _ in range(300):
+            operation = rng.integers(3)
+            if operation == 0 or len(alive) < 4:
+                alive.add(tour.insert(rng.random(2) * 100))
+            else:
+                city = int(rng.choice(sorted(alive)))
+                if operation == 1:
+                    tour.remove(city)
+                    alive.discard(city)
+                else:
+                    tour.move(city, rng.random(2) * 100)
+            assert sorted(tour.order().tolist()) == sorted(alive)
+            assert tour.length == pytest.approx(exact_length(tour), rel=1e-9)
+
+    def test_repair_improves_tour(self):
+        """Test that repairing after each insertion beats plain cheapest insertion."""
+        points = np.random.default_rng(4).random((300, 2)) * 100
+        plain = DynamicTour(repair=False)
+        repaired = DynamicTour()
+
+        for point in points:
+            plain.insert(point)
+            repaired.insert(point)
+
+        assert repaired.length < plain.length
+        assert repaired.recompute_length() == pytest.approx(repaired.length)
+
+    def test_updates_are_fast_on_large_tours(self):
+        """Test that updates on a 50k-city tour take milliseconds rather than a full pass."""
+        rng = np.random.default_rng(5)
+        tour = DynamicTour(rng.random((50_000, 2)) * 1000)
+
+        start = time.perf_counter()
+        for city in range(100):
+            tour.insert(rng.random(2) * 1000)
+            tour.move(city + 100, rng.random(2) * 1000)
+            tour.remove(city)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed / 300 < 0.02
+        assert len(tour) == 50_000
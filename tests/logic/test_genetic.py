@@ -0,0 +1,133 @@
+"""
+Unit tests for the genetic algorithm module.
+"""
+
+import pytest
+import numpy as np
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.genetic import (
+    SharedArray,
+    evolve_generation,
+    genetic_algorithm,
+    inversion_mutation,
+    order_crossover,
+    tournament_selection,
+)
+from logic.held_karp import held_karp
+from logic.population import score_population
+from data.cities import cities_locations
+
+
+class TestOperators:
+    """Test cases for the genetic operators."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_order_crossover_produces_permutation(self, seed):
+        """Test that OX children are valid tours."""
+        rng = np.random.default_rng(seed)
+        parent_a, parent_b = rng.permutation(12), rng.permutation(12)
+
+        child = order_crossover(parent_a, parent_b, rng)
+
+        assert sorted(child.tolist()) == list(range(12))
+
+    def test_order_crossover_identical_parents(self):
+        """Test that crossing a tour with itself returns the same tour."""
+        rng = np.random.default_rng(0)
+        parent = rng.permutation(10)
+
+        assert np.array_equal(order_crossover(parent, parent, rng), parent)
+
+    def test_inversion_mutation_keeps_permutation(self):
+        """Test that mutation only reorders cities."""
+        rng = np.random.default_rng(1)
+        tour = np.arange(20)
+
+        inversion_mutation(tour, rng)
+
+        assert sorted(tour.tolist()) == list(range(20))
+
+    def test_tournament_selection_prefers_short_tours(self):
+        """Test that a tournament over the whole population picks the best tour."""
+        rng = np.random.default_rng(2)
+        fitness = np.array([5.0, 1.0, 3.0])
+
+        winners = tournament_selection(fitness, 100, 20, rng)
+
+        assert np.all(winners == 1)
+
+
+class TestEvolveGeneration:
+    """Test cases for the evolve_generation function."""
+
+    def test_evolve_generation_keeps_elite_and_scores(self):
+        """Test that the best tour survives and fitness matches the new population."""
+        matrix = build_distance_matrix(cities_locations[10])
+        rng = np.random.default_rng(3)
+        population = np.argsort(rng.random((30, 10)), axis=1).astype(np.int32)
+        fitness = score_population(population, matrix)
+        best = fitness.min()
+
+        evolve_generation(population, fitness, matrix, rng)
+
+        assert fitness.min() <= best
+        assert np.allclose(fitness, score_population(population, matrix))
+
+
+class TestGeneticAlgorithm:
+    """Test cases for the genetic_algorithm function."""
+
+    def test_genetic_algorithm_small_instance(self):
+        """Test that the GA reaches the optimum of the 10-city instance."""
+        matrix = build_distance_matrix(cities_locations[10])
+
+        result = genetic_algorithm(matrix, population_size=60, generations=150, seed=0)
+
+        assert result.length == pytest.approx(held_karp(matrix)[1])
+        assert path_length(result.tour, matrix, closed=True) == pytest.approx(result.length)
+        assert len(result.history) == 150
+        assert all(a >= b for a, b in zip(result.history, result.history[1:]))
+
+    def test_genetic_algorithm_is_reproducible(self):
+        """Test that a fixed seed gives the same result."""
+        matrix = build_distance_matrix(cities_locations[12])
+
+        first = genetic_algorithm(matrix, population_size=20, generations=20, islands=2, seed=5)
+        second = genetic_algorithm(matrix, population_size=20, generations=20, islands=2, seed=5)
+
+        assert first.history == second.history
+
+    def test_genetic_algorithm_worker_pool_matches_in_process(self):
+        """Test that shared-memory workers give the same result as the in-process run."""
+        matrix = build_distance_matrix(cities_locations[12])
+        options = dict(population_size=20, generations=30, islands=2, migration_interval=10, seed=9)
+
+        local = genetic_algorithm(matrix, **options)
+        pooled = genetic_algorithm(matrix, workers=2, **options)
+
+        assert pooled.history == local.history
+        assert pooled.length == local.length
+
+    def test_genetic_algorithm_invalid_arguments(self):
+        """Test that degenerate population and island counts are rejected."""
+        matrix = build_distance_matrix(cities_locations[5])
+
+        with pytest.raises(ValueError):
+            genetic_algorithm(matrix, population_size=1)
+        with pytest.raises(ValueError):
+            genetic_algorithm(matrix, islands=0)
+
+
+class TestSharedArray:
+    """Test cases for the SharedArray helper."""
+
+    def test_shared_array_attach_sees_writes(self):
+        """Test that an attached view shares memory with its creator."""
+        owner = SharedArray.create((3, 4), np.int32)
+        try:
+            view = SharedArray.attach(owner.descriptor())
+            owner.array[:] = 7
+            assert np.all(view.array == 7)
+            view.close()
+        finally:
+            owner.close()
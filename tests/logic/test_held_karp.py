@@ -0,0 +1,97 @@
+"""
+Unit tests for the Held-Karp exact solver.
+"""
+
+import pytest
+import time
+import numpy as np
+from logic.cities import calculate_total_distance, routes_to_cities
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.held_karp import held_karp, held_karp_memory
+from data.cities import cities_locations
+
+
+def brute_force_length(cities: list[tuple[int, int]]) -> float:
+    """Return the optimal closed tour length by enumerating every permutation."""
+    first, rest = cities[0], cities[1:]
+    best = float("inf")
+    for ordering in routes_to_cities(rest)["permutation"]:
+        best = min(best, calculate_total_distance([first, *ordering, first]))
+    return best
+
+
+class TestHeldKarp:
+    """Test cases for the held_karp function."""
+
+    @pytest.mark.parametrize("n_cities", [3, 4, 5, 6, 7, 8])
+    def test_held_karp_matches_permutation_oracle(self, n_cities):
+        """Test that Held-Karp finds the brute-force optimum on small instances."""
+        cities = cities_locations[10][:n_cities]
+
+        tour, length = held_karp(build_distance_matrix(cities))
+
+        assert length == pytest.approx(brute_force_length(cities))
+        assert sorted(tour.tolist()) == list(range(n_cities))
+        assert tour[0] == 0
+
+    def test_held_karp_reconstructed_tour_has_reported_length(self):
+        """Test that the returned tour scores to the returned length."""
+        matrix = build_distance_matrix(cities_locations[12])
+
+        tour, length = held_karp(matrix)
+
+        assert path_length(tour, matrix, closed=True) == pytest.approx(length)
+
+    def test_held_karp_fifteen_cities_under_a_second(self):
+        """Test that the bundled 15-city instance solves quickly."""
+        matrix = build_distance_matrix(cities_locations[15])
+
+        start = time.perf_counter()
+        tour, length = held_karp(matrix)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert len(tour) == 15
+        assert path_length(tour, matrix, closed=True) == pytest.approx(length)
+
+    def test_held_karp_condensed_matrix(self):
+        """Test that condensed matrices give the same optimum."""
+        cities = cities_locations[10]
+
+        _, square = held_karp(build_distance_matrix(cities))
+        _, condensed = held_karp(build_distance_matrix(cities, condensed=True))
+
+        assert condensed == pytest.approx(square)
+
+    def test_held_karp_asymmetric_matrix(self):
+        """Test that direction-dependent costs are respected."""
+        matrix = np.array([
+            [0, 1, 10, 10],
+            [10, 0, 1, 10],
+            [10, 10, 0, 1],
+            [1, 10, 10, 0],
+        ], dtype=float)
+
+        tour, length = held_karp(matrix)
+
+        assert tour.tolist() == [0, 1, 2, 3]
+        assert length == 4.0
+
+    @pytest.mark.parametrize("cities,expected", [
+        ([], 0.0),
+        ([(1, 1)], 0.0),
+        ([(0, 0), (3, 4)], 10.0),
+    ])
+    def test_held_karp_trivial_instances(self, cities, expected):
+        """Test instances with fewer than three cities."""
+        tour, length = held_karp(build_distance_matrix(cities))
+
+        assert length == expected
+        assert len(tour) == len(cities)
+
+    def test_held_karp_memory_guard(self):
+        """Test that instances above the memory limit are refused."""
+        matrix = build_distance_matrix(cities_locations[15])
+
+        with pytest.raises(MemoryError):
+            held_karp(matrix, memory_limit=held_karp_memory(15) - 1)
@@ -0,0 +1,174 @@
+"""
+Unit tests for the instrumentation module.
+"""
+
+import json
+import threading
+
+import pytest
+import numpy as np
+from logic.construction import nearest_neighbor_tour
+from logic.distance_matrix import build_distance_matrix
+from logic.instrumentation import Instrumentation, active, phase, prometheus_text
+from logic.lin_kernighan import iter_lin_kernighan
+from logic.local_search import local_search
+from logic.progress import SolverStream, exhaust
+from data.cities import cities_locations
+
+
+@pytest.fixture
+def matrix():
+    return build_distance_matrix(np.random.default_rng(0).random((60, 2)) * 100)
+
+
+class TestInstrumentation:
+    """Test cases for the Instrumentation class."""
+
+    def test_inactive_by_default(self):
+        """Test that nothing is active outside a with block and phases are then no-ops."""
+        assert active() is None
+        with phase("ignored"):
+            pass
+
+    def test_activation_is_scoped(self):
+        """Test that the instrumentation is active inside its block only."""
+        stats = Instrumentation("test")
+
+        with stats:
+            assert active() is stats
+            assert stats.running
+        assert active() is None
+        assert stats.elapsed > 0 and not stats.running
+
+    def test_cannot_start_twice(self):
+        """Test that an active instrumentation cannot be started again."""
+        with Instrumentation() as stats:
+            with pytest.raises(RuntimeError):
+                stats.start()
+
+    def test_counters_and_counting(self):
+        """Test direct counts and counted function calls."""
+        stats = Instrumentation()
+        counted = stats.counting(lambda a, b: a + b, "calls")
+
+        stats.count("moves", 3)
+        stats.count("moves")
+        assert counted(1, 2) == 3 and counted(2, 2) == 4
+
+        assert stats.counters == {"calls": 2, "moves": 4}
+
+    def test_nested_phases(self):
+        """Test that nested phases are keyed by their path and count their calls."""
+        stats = Instrumentation()
+
+        with stats:
+            for _ in range(2):
+                with phase("outer"):
+                    with phase("inner"):
+                        pass
+
+        assert set(stats.phases) == {"outer", "outer/inner"}
+        assert stats.phases["outer"].calls == 2
+        assert stats.phases["outer"].seconds >= stats.phases["outer/inner"].seconds
+
+    def test_rates(self):
+        """Test that counter rates are measured between polls."""
+        stats = Instrumentation()
+
+        assert stats.rates() == {}
+        stats.count("evaluations", 100)
+        rates = stats.rates(window=0.0)
+
+        assert rates["evaluations"] > 0
+
+    def test_profile_and_memory(self):
+        """Test that profiling lists the solver and tracemalloc reports a peak."""
+        stats = Instrumentation("local_search", profile=True, trace_memory=True)
+        matrix = build_distance_matrix(cities_locations[15])
+
+        with stats:
+            local_search(nearest_neighbor_tour(matrix), matrix)
+        snapshot = stats.snapshot()
+
+        assert any("iter_local_search" in row["function"] for row in snapshot["profile"])
+        assert snapshot["memory"]["peak"] > 0
+
+
+class TestSolverHooks:
+    """Test cases for the counters recorded by the solvers."""
+
+    def test_uninstrumented_run_records_nothing(self, matrix):
+        """Test that a run outside an instrumentation leaves an unrelated one untouched."""
+        stats = Instrumentation()
+
+        local_search(nearest_neighbor_tour(matrix), matrix)
+
+        assert stats.counters == {} and stats.phases == {}
+
+    def test_local_search_counters(self, matrix):
+        """Test that local search counts distance evaluations, examined cities and applied moves."""
+        with Instrumentation("local_search") as stats:
+            local_search(nearest_neighbor_tour(matrix), matrix)
+
+        counters = stats.counters
+        assert counters["distance_evaluations"] > counters["cities_examined"] >= counters["moves_accepted"] > 0
+
+    def test_lin_kernighan_phases(self, matrix):
+        """Test that Lin-Kernighan times its descent and kicks."""
+        with Instrumentation("lin_kernighan") as stats:
+            exhaust(iter_lin_kernighan(nearest_neighbor_tour(matrix), matrix, kicks=20, seed=0))
+
+        assert stats.counters["kicks"] == 20
+        assert stats.phases["descent"].calls == 1
+        assert stats.phases["kicks"].calls == 20
+
+    def test_solver_stream_activates_in_worker_thread(self, matrix):
+        """Test that SolverStream records the solver running in its thread."""
+        stats = Instrumentation("lin_kernighan")
+        stream = SolverStream(iter_lin_kernighan, nearest_neighbor_tour(matrix), matrix, kicks=10, seed=0,
+                              instrumentation=stats)
+
+        with stream:
+            stream.result(timeout=30)
+
+        assert stats.counters["kicks"] == 10
+        assert threading.current_thread() is threading.main_thread() and active() is None
+
+    def test_solver_stream_rejects_process_backend(self, matrix):
+        """Test that instrumentation needs the thread backend."""
+        with pytest.raises(ValueError):
+            SolverStream(iter_lin_kernighan, [0, 1, 2], matrix, backend="process", instrumentation=Instrumentation())
+
+
+class TestExport:
+    """Test cases for the JSON and Prometheus exports."""
+
+    def test_json_round_trip(self):
+        """Test that a snapshot is valid JSON with labels, counters and phases."""
+        stats = Instrumentation("genetic", {"instance": "bundled:15"})
+        with stats:
+            stats.count("generations", 5)
+            with phase("evolve"):
+                pass
+
+        snapshot = json.loads(stats.to_json())
+
+        assert snapshot["labels"] == {"solver": "genetic", "instance": "bundled:15"}
+        assert snapshot["counters"] == {"generations": 5}
+        assert snapshot["phases"]["evolve"]["calls"] == 1
+
+    def test_prometheus_text(self):
+        """Test the Prometheus exposition format with escaped labels and one TYPE line per metric."""
+        first = Instrumentation("annealing", {"instance": 'a "b"'})
+        second = Instrumentation("annealing", {"instance": "c"})
+        for stats in (first, second):
+            stats.count("moves-tried", 7)
+            with stats.phase("solve"):
+                pass
+
+        text = prometheus_text([first.snapshot(), second.snapshot()])
+
+        assert text.count("# TYPE tsp_moves_tried_total counter") == 1
+        assert 'tsp_moves_tried_total{solver="annealing",instance="a \\"b\\""} 7' in text
+        assert 'tsp_phase_calls_total{solver="annealing",instance="c",phase="solve"} 1' in text
+        assert first.to_prometheus(prefix="x").startswith("# TYPE x_elapsed_seconds gauge")
@@ -0,0 +1,136 @@
+"""
+Unit tests for the chained Lin-Kernighan module.
+"""
+
+import pytest
+import numpy as np
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.held_karp import held_karp
+from logic.lin_kernighan import _double_bridge, _lk_move, lin_kernighan
+from logic.local_search import ArrayTour, distance_function, local_search, neighbor_lists
+from data.cities import cities_locations
+
+
+def is_permutation(tour, n_cities: int) -> bool:
+    """Return True if tour visits every city exactly once."""
+    return sorted(np.asarray(tour).tolist()) == list(range(n_cities))
+
+
+class TestArrayTour:
+    """Test cases for the ArrayTour representation."""
+
+    def test_next_prev_between(self):
+        """Test O(1) neighbor and betweenness queries, including wrap-around."""
+        tour = ArrayTour([3, 0, 4, 1, 2])
+
+        assert tour.next(2) == 3
+        assert tour.prev(3) == 2
+        assert tour.between(4, 2, 0)
+        assert tour.between(1, 1, 1)
+        assert not tour.between(0, 3, 1)
+
+    def test_reverse_keeps_positions_consistent(self):
+        """Test that reversing either side leaves order and position in sync."""
+        tour = ArrayTour(np.arange(10))
+
+        tour.reverse(2, 5)
+        tour.reverse(8, 1)
+
+        assert np.array_equal(tour.order[tour.position], np.arange(10))
+        assert is_permutation(tour.order, 10)
+
+
+class TestLinKernighanMove:
+    """Test cases for single Lin-Kernighan moves and kicks."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_lk_move_reports_exact_delta(self, seed):
+        """Test that an applied move changes the tour length by the reported delta."""
+        points = np.random.default_rng(seed).random((60, 2))
+        matrix = build_distance_matrix(points)
+        dist = distance_function(matrix)
+        neighbors = neighbor_lists(8, matrix).tolist()
+        tour = ArrayTour(np.random.default_rng(seed + 10).permutation(60))
+
+        for city in range(60):
+            before = path_length(tour.order, matrix, closed=True)
+            move = _lk_move(tour, dist, neighbors, city, max_depth=20)
+            after = path_length(tour.order, matrix, closed=True)
+            if move is None:
+                assert after == pytest.approx(before)
+            else:
+                assert after == pytest.approx(before + move[1])
+                assert move[1] < 0
+            assert is_permutation(tour.order, 60)
+
+    def test_double_bridge_reports_exact_delta(self):
+        """Test that a kick changes the tour length by the reported delta."""
+        points = np.random.default_rng(4).random((40, 2))
+        matrix = build_distance_matrix(points)
+        dist = distance_function(matrix)
+        neighbors = neighbor_lists(8, matrix).tolist()
+        tour = ArrayTour(np.arange(40))
+        rng = np.random.default_rng(0)
+
+        for _ in range(20):
+            before = path_length(tour.order, matrix, closed=True)
+            _, delta = _double_bridge(tour, dist, neighbors, rng)
+            assert path_length(tour.order, matrix, closed=True) == pytest.approx(before + delta)
+            assert np.array_equal(tour.order[tour.position], np.arange(40))
+
+
+class TestLinKernighan:
+    """Test cases for the lin_kernighan function."""
+
+    @pytest.mark.parametrize("n_cities", [5, 10, 12, 15])
+    def test_lin_kernighan_finds_bundled_optima(self, n_cities):
+        """Test that the bundled instances are solved to optimality."""
+        matrix = build_distance_matrix(cities_locations[n_cities])
+        optimum = held_karp(matrix)[1]
+
+        result = lin_kernighan(np.arange(n_cities), matrix, seed=0)
+
+        assert is_permutation(result.tour, n_cities)
+        assert result.length == pytest.approx(optimum)
+        assert result.length == pytest.approx(path_length(result.tour, matrix, closed=True))
+
+    def test_lin_kernighan_beats_two_opt(self):
+        """Test that chained LK improves on the 2-opt / Or-opt local optimum."""
+        points = np.random.default_rng(8).random((400, 2))
+        matrix = build_distance_matrix(points)
+        two_opt, _ = local_search(np.arange(400), matrix)
+
+        result = lin_kernighan(two_opt, matrix, kicks=200, seed=0)
+
+        assert result.length < path_length(two_opt, matrix, closed=True)
+        assert result.length == pytest.approx(path_length(result.tour, matrix, closed=True))
+
+    def test_lin_kernighan_coordinates_backend(self):
+        """Test that coordinates can replace the distance matrix."""
+        points = np.random.default_rng(9).random((300, 2))
+        matrix = build_distance_matrix(points)
+
+        result = lin_kernighan(np.arange(300), coordinates=points, kicks=50, seed=0)
+
+        assert is_permutation(result.tour, 300)
+        assert result.length == pytest.approx(path_length(result.tour, matrix, closed=True))
+
+    def test_lin_kernighan_stops_at_target(self):
+        """Test that a reachable target ends the run early and records its time."""
+        matrix = build_distance_matrix(cities_locations[15])
+        optimum = held_karp(matrix)[1]
+
+        result = lin_kernighan(np.arange(15), matrix, kicks=10_000, target_length=optimum * 1.02, seed=0)
+
+        assert result.length <= optimum * 1.02
+        assert result.time_to_target is not None
+        assert result.kicks < 10_000
+
+    def test_lin_kernighan_tiny_instance(self):
+        """Test that tours too small to improve are returned unchanged."""
+        matrix = build_distance_matrix([(0, 0), (1, 0), (1, 1)])
+
+        result = lin_kernighan([0, 1, 2], matrix)
+
+        assert result.tour.tolist() == [0, 1, 2]
+        assert result.kicks == 0
@@ -0,0 +1,135 @@
+"""
+Unit tests for the 2-opt / Or-opt local search module.
+"""
+
+import pytest
+import numpy as np
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.held_karp import held_karp
+from logic.local_search import distance_function, local_search, neighbor_lists
+from data.cities import cities_locations
+
+
+def is_permutation(tour, n_cities: int) -> bool:
+    """Return True if tour visits every city exactly once."""
+    return sorted(np.asarray(tour).tolist()) == list(range(n_cities))
+
+
+class TestLocalSearch:
+    """Test cases for the local_search function."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_local_search_reports_exact_improvement(self, seed):
+        """Test that the returned delta matches the change in tour length."""
+        matrix = build_distance_matrix(cities_locations[15])
+        start = np.random.default_rng(seed).permutation(15)
+
+        tour, delta = local_search(start, matrix)
+
+        assert is_permutation(tour, 15)
+        assert delta <= 0
+        assert path_length(tour, matrix, closed=True) == pytest.approx(
+            path_length(start, matrix, closed=True) + delta
+        )
+
+    def test_local_search_untangles_crossing(self):
+        """Test that a self-crossing square is fixed by 2-opt."""
+        cities = [(0, 0), (1, 1), (1, 0), (0, 1)]
+        matrix = build_distance_matrix(cities)
+
+        tour, _ = local_search([0, 1, 2, 3], matrix)
+
+        assert path_length(tour, matrix, closed=True) == pytest.approx(4.0)
+
+    def test_local_search_close_to_optimal(self):
+        """Test that the result on the 15-city instance is within 10% of optimal."""
+        matrix = build_distance_matrix(cities_locations[15])
+        optimum = held_karp(matrix)[1]
+
+        tour, _ = local_search(np.arange(15), matrix)
+
+        assert path_length(tour, matrix, closed=True) <= 1.1 * optimum
+
+    def test_local_search_coordinates_match_matrix(self):
+        """Test that the coordinate backend follows the same moves as the matrix."""
+        cities = np.random.default_rng(5).random((200, 2))
+        matrix = build_distance_matrix(cities)
+        start = np.arange(200)
+
+        by_matrix, _ = local_search(start, matrix)
+        by_coordinates, _ = local_search(start, coordinates=cities)
+
+        assert path_length(by_matrix, matrix, closed=True) == pytest.approx(
+            path_length(by_coordinates, matrix, closed=True)
+        )
+
+    def test_local_search_two_opt_only(self):
+        """Test that Or-opt can be disabled."""
+        matrix = build_distance_matrix(cities_locations[12])
+
+        tour, delta = local_search(np.arange(12), matrix, use_or_opt=False)
+
+        assert is_permutation(tour, 12)
+        assert delta <= 0
+
+    def test_local_search_large_instance(self):
+        """Test that a few thousand cities converge from a random start."""
+        cities = np.random.default_rng(6).random((3000, 2))
+        start = np.random.default_rng(7).permutation(3000)
+
+        tour, delta = local_search(start, coordinates=cities)
+
+        assert is_permutation(tour, 3000)
+        assert delta < 0
+
+    def test_local_search_tiny_tours(self, sample_coordinates):
+        """Test that tours of fewer than four cities are returned unchanged."""
+        matrix = build_distance_matrix(sample_coordinates[:3])
+
+        tour, delta = local_search([2, 0, 1], matrix)
+
+        assert tour.tolist() == [2, 0, 1]
+        assert delta == 0.0
+
+    def test_local_search_start_cities(self):
+        """Test that start_cities limits the search to a region of an otherwise optimal tour."""
+        matrix = build_distance_matrix(cities_locations[15])
+        optimal, _ = held_karp(matrix)
+        broken = optimal.copy()
+        broken[[3, 4]] = broken[[4, 3]]
+
+        tour, delta = local_search(broken, matrix, start_cities=[int(broken[3])])
+        untouched, none = local_search(broken, matrix, start_cities=[])
+
+        assert path_length(tour, matrix, closed=True) == pytest.approx(held_karp(matrix)[1])
+        assert delta < 0
+        assert none == 0.0 and np.array_equal(untouched, broken)
+
+
+class TestNeighborLists:
+    """Test cases for the neighbor_lists function."""
+
+    def test_neighbor_lists_matrix_and_coordinates_agree(self):
+        """Test that both backends return the nearest cities in order."""
+        cities = np.random.default_rng(8).random((50, 2))
+        matrix = build_distance_matrix(cities)
+
+        by_matrix = neighbor_lists(5, matrix)
+        by_coordinates = neighbor_lists(5, coordinates=cities)
+
+        assert by_matrix.shape == (50, 5)
+        assert np.array_equal(by_matrix, by_coordinates)
+        assert not np.any(by_matrix == np.arange(50)[:, None])
+
+    def test_neighbor_lists_clipped_to_instance(self, sample_coordinates):
+        """Test that k is clipped to n - 1."""
+        assert neighbor_lists(10, coordinates=sample_coordinates).shape == (4, 3)
+
+
+class TestDistanceFunction:
+    """Test cases for the distance_function helper."""
+
+    def test_distance_function_requires_data(self):
+        """Test that a matrix or coordinates is required."""
+        with pytest.raises(ValueError):
+            distance_function()
@@ -0,0 +1,166 @@
+"""
+Unit tests for the lower bound module.
+"""
+
+import pytest
+import numpy as np
+from scipy.sparse.csgraph import minimum_spanning_tree
+from logic.construction import greedy_edge_tour
+from logic.distance_matrix import build_distance_matrix, path_length
+from logic.held_karp import held_karp
+from logic.lin_kernighan import lin_kernighan
+from logic.local_search import neighbor_lists
+from logic.lower_bound import alpha_neighbor_lists, held_karp_bound, minimum_one_tree, tour_gap
+from data.cities import cities_locations
+
+
+def brute_force_one_tree(matrix, penalties, special=0):
+    """Minimum 1-tree bound from scipy's spanning tree over the complete penalized graph."""
+    weights = matrix + penalties[:, None] + penalties[None, :]
+    others = np.delete(np.arange(len(matrix)), special)
+    inner = weights[np.ix_(others, others)]
+    tree = minimum_spanning_tree(inner - inner.min() + 1).toarray()
+    tree_cost = inner[tree > 0].sum()
+    special_row = np.sort(np.delete(weights[special], special))
+    return tree_cost + special_row[:2].sum() - 2 * penalties.sum()
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).random((80, 2)) * 100
+
+
+class TestMinimumOneTree:
+    """Test cases for the minimum_one_tree function."""
+
+    def test_matches_brute_force(self):
+        """Test the Prim 1-tree against scipy's spanning tree, with and without penalties."""
+        matrix = build_distance_matrix(np.random.default_rng(1).random((30, 2)))
+        penalties = np.random.default_rng(2).normal(scale=0.05, size=30)
+
+        for weights in (np.zeros(30), penalties):
+            tree = minimum_one_tree(matrix, penalties=weights, special=4)
+
+            assert tree.bound == pytest.approx(brute_force_one_tree(matrix, weights, special=4))
+            assert tree.edges.shape == (28, 2) and 4 not in tree.edges
+            assert tree.degrees.sum() == 60
+
+    def test_coordinates_match_matrix(self, points):
+        """Test that rows computed from coordinates give the same tree as the matrix."""
+        from_points = minimum_one_tree(coordinates=points)
+        from_matrix = minimum_one_tree(build_distance_matrix(points))
+
+        assert from_points.bound == pytest.approx(from_matrix.bound)
+
+    def test_too_small(self):
+        """Test that a 1-tree needs three cities."""
+        with pytest.raises(ValueError):
+            minimum_one_tree(coordinates=[(0, 0), (1, 1)])
+
+
+class TestHeldKarpBound:
+    """Test cases for the held_karp_bound function."""
+
+    def test_bound_certifies_small_optimum(self):
+        """Test that the bound reaches the Held-Karp optimum of a small instance."""
+        matrix = build_distance_matrix(cities_locations[10])
+        _, optimum = held_karp(matrix)
+
+        result = held_karp_bound(matrix)
+
+        assert result.bound == pytest.approx(optimum)
+        assert result.optimal and result.tree.is_tour
+
+    def test_bound_is_below_tour_and_tight(self, points):
+        """Test that the bound never exceeds a good tour and is within a few percent of it."""
+        tour = lin_kernighan(greedy_edge_tour(points), coordinates=points, seed=0).length
+
+        result = held_karp_bound(coordinates=points, upper_bound=tour)
+
+        assert result.bound <= tour + 1e-9
+        assert result.gap < 0.03
+        assert result.bound > minimum_one_tree(coordinates=points).bound
+
+    def test_candidate_graph_bound_is_proven(self, points):
+        """Test that a bound tightened on candidate edges is re-evaluated on the complete graph."""
+        result = held_karp_bound(coordinates=points, candidates=neighbor_lists(5, coordinates=points))
+
+        exact = minimum_one_tree(coordinates=points, penalties=result.penalties)
+        assert result.bound == pytest.approx(exact.bound)
+        assert result.bound <= result.upper_bound
+
+    def test_integral_matrix_rounds_up(self):
+        """Test that a bound on whole-number distances is rounded up."""
+        matrix = np.round(build_distance_matrix(np.random.default_rng(3).random((20, 2)) * 1000))
+
+        result = held_karp_bound(matrix, iterations=5)
+
+        assert result.bound == int(result.bound)
+        assert result.bound <= path_length(greedy_edge_tour(np.random.default_rng(3).random((20, 2)) * 1000),
+                                           matrix, closed=True)
+
+    def test_rejects_asymmetric(self):
+        """Test that an asymmetric matrix has no 1-tree bound."""
+        matrix = np.array([[0, 1, 2], [3, 0, 1], [1, 2, 0]], dtype=float)
+
+        with pytest.raises(ValueError):
+            held_karp_bound(matrix)
+
+    def test_tour_gap(self):
+        """Test the proven gap of a tour above a bound."""
+        assert tour_gap(110, 100) == pytest.approx(0.1)
+        assert tour_gap(100, 100) == 0.0
+        assert tour_gap(0, 0) == 0.0
+
+
+class TestAlphaNeighborLists:
+    """Test cases for the alpha_neighbor_lists function."""
+
+    def test_matches_forced_edge_trees(self):
+        """Test the chosen candidates against alpha computed by forcing every edge into the tree."""
+        matrix = build_distance_matrix(np.random.default_rng(4).random((14, 2)))
+        bound = held_karp_bound(matrix, iterations=3)
+        weights = matrix + bound.penalties[:, None] + bound.penalties[None, :]
+        base = brute_force_one_tree(matrix, bound.penalties)
+
+        lists = alpha_neighbor_lists(3, matrix, bound=bound, pool_size=13)
+
+        for city in range(1, 14):
+            alpha = {}
+            for other in range(1, 14):
+                if other != city:
+                    forced = matrix.copy()
+                    forced[city, other] = forced[other, city] = -10.0
+                    alpha[other] = (brute_force_one_tree(forced, bound.penalties)
+                                    - base + weights[city, other] - (-10.0 + bound.penalties[city]
+                                                                     + bound.penalties[other]))
+            chosen = lists[city][lists[city] != 0]
+            threshold = sorted(alpha.values())[len(chosen) - 1]
+            assert all(alpha[int(other)] <= threshold + 1e-9 for other in chosen)
+
+    def test_lists_are_sorted_by_distance(self, points):
+        """Test the list shape and that each list is closest first."""
+        lists = alpha_neighbor_lists(5, coordinates=points)
+        distances = np.hypot(*(points[lists] - points[:, None, :]).transpose(2, 0, 1))
+
+        assert lists.shape == (80, 5)
+        assert np.all(np.diff(distances, axis=1) >= 0)
+        assert not np.any(lists == np.arange(80)[:, None])
+
+    def test_covers_good_tour_edges(self, points):
+        """Test that five alpha candidates hold nearly every edge of a good tour."""
+        tour = lin_kernighan(greedy_edge_tour(points), coordinates=points, seed=0).tour
+        lists = alpha_neighbor_lists(5, coordinates=points)
+        following = np.roll(tour, -1)
+
+        covered = [b in lists[a] or a in lists[b] for a, b in zip(tour, following)]
+
+        assert np.mean(covered) >= 0.95
+
+    def test_usable_by_lin_kernighan(self, points):
+        """Test that Lin-Kernighan accepts alpha lists as its candidates."""
+        lists = alpha_neighbor_lists(5, coordinates=points)
+
+        result = lin_kernighan(greedy_edge_tour(points), coordinates=points, neighbors=lists, kicks=20, seed=0)
+
+        assert sorted(result.tour.tolist()) == list(range(80))
@@ -0,0 +1,154 @@
+"""
+Unit tests for the metrics module.
+"""
+
+import pytest
+import numpy as np
+from scipy.spatial.distance import cdist
+from data.tsplib import tsplib_distance_matrix
+from logic.distance_matrix import path_length
+from logic.distance_oracle import make_oracle
+from logic.held_karp import held_karp
+from logic.lin_kernighan import lin_kernighan
+from logic.local_search import local_search
+from logic.metrics import (
+    cost_matrix,
+    is_symmetric,
+    metric_distance_matrix,
+    metric_neighbor_lists,
+    pair_distance,
+    tour_length,
+)
+
+PARIS = (48.8566, 2.3522)
+LONDON = (51.5074, -0.1278)
+
+
+def is_permutation(tour, n):
+    return sorted(int(city) for city in tour) == list(range(n))
+
+
+@pytest.fixture
+def geo_points():
+    rng = np.random.default_rng(0)
+    return np.column_stack((rng.uniform(-60, 60, 200), rng.uniform(-180, 180, 200)))
+
+
+@pytest.fixture
+def asymmetric_matrix():
+    rng = np.random.default_rng(3)
+    points = rng.random((11, 2)) * 100
+    # Euclidean distances plus a one-way penalty, as for uphill roads or one-way streets.
+    matrix = cdist(points, points) + rng.random((11, 11)) * 40
+    return cost_matrix(matrix)
+
+
+class TestMetricMatrices:
+    """Test cases for metric distance matrices and tour lengths."""
+
+    def test_haversine_paris_london(self):
+        """Test that haversine matches the known Paris-London great-circle distance."""
+        matrix = metric_distance_matrix([PARIS, LONDON], "haversine")
+
+        assert matrix[0, 1] == pytest.approx(343.5, abs=1.0)
+        assert matrix[1, 0] == matrix[0, 1]
+        assert pair_distance([PARIS, LONDON], "haversine")(0, 1) == pytest.approx(matrix[0, 1])
+
+    def test_manhattan_matches_cdist(self):
+        """Test that the Manhattan matrix equals SciPy's cityblock distances."""
+        points = np.random.default_rng(1).random((50, 2)) * 100
+
+        matrix = metric_distance_matrix(points, "manhattan", block_rows=7)
+
+        assert np.allclose(matrix, cdist(points, points, "cityblock"))
+
+    @pytest.mark.parametrize("metric", ["euclidean", "manhattan", "haversine"])
+    def test_tour_length_matches_matrix(self, geo_points, metric):
+        """Test that the vectorized tour length equals the length read from the matrix."""
+        tour = np.random.default_rng(2).permutation(len(geo_points))
+        matrix = metric_distance_matrix(geo_points, metric)
+
+        assert tour_length(tour, geo_points, metric) == pytest.approx(path_length(tour, matrix, closed=True))
+        assert tour_length(tour, geo_points, metric, closed=False) == pytest.approx(path_length(tour, matrix))
+
+    @pytest.mark.parametrize("edge_weight_type", ["EUC_2D", "CEIL_2D", "ATT", "MAN_2D", "MAX_2D", "GEO"])
+    def test_tsplib_metrics_match_tsplib_matrix(self, geo_points, edge_weight_type):
+        """Test that the registered TSPLIB metrics apply the same rounding as data.tsplib."""
+        points = geo_points if edge_weight_type == "GEO" else geo_points * 37.5
+        expected = tsplib_distance_matrix(points, edge_weight_type)
+        distance = pair_distance(points, edge_weight_type)
+
+        assert np.array_equal(metric_distance_matrix(points, edge_weight_type, block_rows=13), expected)
+        assert distance(3, 17) == expected[3, 17]
+        assert tour_length(np.arange(len(points)), points, edge_weight_type) == path_length(
+            np.arange(len(points)), expected, closed=True)
+
+    def test_unknown_metric_raises(self):
+        """Test that an unregistered metric name raises a ValueError."""
+        with pytest.raises(ValueError):
+            metric_distance_matrix([(0, 0), (1, 1)], "chebyshev")
+
+
+class TestMetricNeighbors:
+    """Test cases for metric_neighbor_lists."""
+
+    @pytest.mark.parametrize("metric", ["manhattan", "haversine", "EUC_2D", "GEO"])
+    def test_neighbors_match_brute_force(self, geo_points, metric):
+        """Test that KD-tree neighbors match a sort of the metric matrix."""
+        matrix = metric_distance_matrix(geo_points, metric)
+        np.fill_diagonal(matrix, np.inf)
+
+        neighbors = metric_neighbor_lists(geo_points, 6, metric)
+
+        assert neighbors.shape == (len(geo_points), 6)
+        assert np.allclose(np.take_along_axis(matrix, neighbors, axis=1),
+                           np.sort(matrix, axis=1)[:, :6])
+
+    def test_haversine_oracle_neighbors(self, geo_points):
+        """Test that an on-the-fly haversine oracle agrees with the dense matrix."""
+        oracle = make_oracle(coordinates=geo_points, backend="neighbors", metric="haversine")
+        matrix = metric_distance_matrix(geo_points, "haversine")
+
+        assert oracle(3, 17) == pytest.approx(matrix[3, 17])
+        assert oracle(oracle.neighbor_lists(4)[5][0], 5) == pytest.approx(np.sort(matrix[5])[1])
+
+
+class TestAsymmetric:
+    """Test cases for asymmetric cost matrices."""
+
+    def test_cost_matrix_validation(self):
+        """Test that non-square, negative or infinite cost matrices are rejected."""
+        with pytest.raises(ValueError):
+            cost_matrix(np.zeros((2, 3)))
+        with pytest.raises(ValueError):
+            cost_matrix([[0, -1], [1, 0]])
+        with pytest.raises(ValueError):
+            cost_matrix([[0, np.inf], [1, 0]])
+        assert np.array_equal(cost_matrix([[5, 1], [2, 5]]), [[0, 1], [2, 0]])
+
+    def test_symmetry_detection(self, asymmetric_matrix):
+        """Test that oracles flag asymmetric matrices."""
+        assert not is_symmetric(asymmetric_matrix)
+        assert not make_oracle(asymmetric_matrix).symmetric
+        assert make_oracle(coordinates=[(0, 0), (3, 4), (1, 1)]).symmetric
+
+    def test_local_search_keeps_exact_length(self, asymmetric_matrix):
+        """Test that local search on an ATSP matrix reports the true directed length change."""
+        tour = np.arange(11)
+        before = path_length(tour, asymmetric_matrix, closed=True)
+
+        improved, delta = local_search(tour, asymmetric_matrix)
+
+        assert is_permutation(improved, 11)
+        assert delta < 0
+        assert path_length(improved, asymmetric_matrix, closed=True) == pytest.approx(before + delta)
+
+    def test_lin_kernighan_near_optimum(self, asymmetric_matrix):
+        """Test that Lin-Kernighan on an ATSP matrix stays exact and close to Held-Karp."""
+        optimum = held_karp(asymmetric_matrix)[1]
+
+        result = lin_kernighan(np.arange(11), asymmetric_matrix, kicks=200, seed=0)
+
+        assert is_permutation(result.tour, 11)
+        assert path_length(result.tour, asymmetric_matrix, closed=True) == pytest.approx(result.length)
+        assert result.length <= optimum * 1.05
@@ -0,0 +1,118 @@
+"""
+Unit tests for the CitySet / Tour data model.
+"""
+
+import pytest
+import numpy as np
+from logic.cities import calculate_distance, calculate_total_distance, routes_to_cities
+from logic.distance_matrix import build_distance_matrix
+from logic.model import CitySet, Tour
+from data.cities import cities_locations
+
+
+class TestCitySet:
+    """Test cases for the CitySet class."""
+
+    def test_city_set_from_tuples(self):
+        """Test that a list of tuples becomes one read-only (n, 2) float64 array."""
+        cities = CitySet(cities_locations[5])
+
+        assert len(cities) == 5
+        assert cities.coordinates.shape == (5, 2)
+        assert cities.coordinates.dtype == np.float64
+        assert not cities.coordinates.flags.writeable
+        assert cities[0] == (533.0, 251.0)
+        assert list(cities) == [tuple(map(float, city)) for city in cities_locations[5]]
+
+    def test_city_set_does_not_freeze_caller_array(self):
+        """Test that a writable input array is copied, not made read-only."""
+        points = np.random.default_rng(0).random((4, 2))
+
+        cities = CitySet(points)
+
+        assert points.flags.writeable
+        assert not np.shares_memory(points, cities.coordinates)
+
+    def test_city_set_shares_read_only_arrays(self):
+        """Test that read-only inputs, like memory-mapped instances, are not copied."""
+        points = np.random.default_rng(1).random((4, 2))
+        points.flags.writeable = False
+
+        assert CitySet(points).coordinates is points
+
+    def test_city_set_uses_less_memory_than_tuples(self):
+        """Test the per-city footprint of the array storage."""
+        assert CitySet(np.zeros((1000, 2))).coordinates.nbytes == 16 * 1000
+
+    @pytest.mark.parametrize("bad", [[(0, 0, 0)], [(0, float("nan"))], [1, 2, 3]])
+    def test_city_set_validation(self, bad):
+        """Test that malformed or non-finite coordinates are rejected."""
+        with pytest.raises(ValueError):
+            CitySet(bad)
+
+    def test_city_set_distance_matrix(self):
+        """Test that the distance matrix matches build_distance_matrix."""
+        cities = CitySet(cities_locations[10])
+
+        assert np.array_equal(cities.distance_matrix(), build_distance_matrix(cities_locations[10]))
+
+
+class TestTour:
+    """Test cases for the Tour class."""
+
+    def test_tour_stores_int32_permutation(self):
+        """Test the order dtype and the gathered points."""
+        cities = CitySet([(0, 0), (3, 0), (3, 4)])
+
+        tour = Tour(cities, [2, 0, 1])
+
+        assert tour.order.dtype == np.int32
+        assert tour.points().tolist() == [[3, 4], [0, 0], [3, 0]]
+        assert tour.to_path() == [(3.0, 4.0), (0.0, 0.0), (3.0, 0.0)]
+        assert list(tour) == [2, 0, 1]
+
+    @pytest.mark.parametrize("order", [[0, 1], [0, 1, 1], [0, 1, 3], [0.0, 1.0, 2.0], [[0, 1, 2]]])
+    def test_tour_validation(self, order):
+        """Test that orders that are not permutations of the cities are rejected."""
+        with pytest.raises(ValueError):
+            Tour([(0, 0), (1, 0), (1, 1)], order)
+
+    def test_tour_length_matches_calculate_total_distance(self):
+        """Test closed and open lengths against the tuple-based functions."""
+        path = list(cities_locations[12])
+        tour = Tour.identity(path)
+
+        assert tour.length(closed=False) == pytest.approx(calculate_total_distance(path))
+        assert tour.length() == pytest.approx(calculate_total_distance(path + path[:1]))
+        assert tour.length(build_distance_matrix(path)) == pytest.approx(tour.length())
+
+    def test_from_path_round_trip(self):
+        """Test that a closed path of tuples maps back to the same tour."""
+        cities = CitySet(cities_locations[5])
+        order = [3, 1, 4, 0, 2]
+        path = [cities_locations[5][city] for city in order + order[:1]]
+
+        assert Tour.from_path(cities, path).order.tolist() == order
+        with pytest.raises(ValueError):
+            Tour.from_path(cities, [(1, 1)])
+
+
+class TestAdapters:
+    """Test cases for the existing functions accepting the new model."""
+
+    def test_calculate_total_distance_accepts_model(self):
+        """Test that CitySet and Tour are scored like the equivalent list of tuples."""
+        path = list(cities_locations[15])
+        cities = CitySet(path)
+
+        assert calculate_total_distance(cities) == pytest.approx(calculate_total_distance(path))
+        assert calculate_total_distance(Tour.identity(cities)) == pytest.approx(calculate_total_distance(path))
+
+    def test_calculate_distance_and_routes_accept_city_set(self):
+        """Test that indexing and iteration keep the tuple-based functions working."""
+        cities = CitySet(cities_locations[5])
+
+        assert calculate_distance(cities[0], cities[1]) == pytest.approx(
+            calculate_distance(cities_locations[5][0], cities_locations[5][1])
+        )
+        assert len(list(routes_to_cities(cities)["combination"])) == 10
@@ -0,0 +1,94 @@
+"""
+Unit tests for the population scoring module.
+"""
+
+import pytest
+import numpy as np
+from logic.cities import calculate_total_distance
+from logic.distance_matrix import build_distance_matrix
+from logic.population import chunk_size_for_budget, score_population
+from data.cities import cities_locations
+
+
+@pytest.fixture
+def population_15():
+    """Provide the 15-city instance and a random population of its tours."""
+    cities = cities_locations[15]
+    rng = np.random.default_rng(7)
+    tours = np.argsort(rng.random((50, len(cities))), axis=1)
+    return cities, tours
+
+
+class TestScorePopulation:
+    """Test cases for the score_population function."""
+
+    def test_score_population_matches_calculate_total_distance(self, population_15):
+        """Test that batched lengths equal closed tuple-path lengths."""
+        cities, tours = population_15
+        matrix = build_distance_matrix(cities)
+
+        result = score_population(tours, matrix)
+
+        for tour, length in zip(tours, result):
+            path = [cities[i] for i in tour] + [cities[tour[0]]]
+            assert abs(length - calculate_total_distance(path)) < 1e-9
+
+    def test_score_population_open_paths(self, population_15):
+        """Test that closed=False skips the return edge."""
+        cities, tours = population_15
+        matrix = build_distance_matrix(cities)
+
+        result = score_population(tours, matrix, closed=False)
+
+        expected = [calculate_total_distance(tour, matrix) for tour in tours]
+        assert np.allclose(result, expected)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 50, 1000])
+    def test_score_population_chunking_is_transparent(self, population_15, chunk_size):
+        """Test that chunk size does not change the results."""
+        cities, tours = population_15
+        matrix = build_distance_matrix(cities)
+
+        result = score_population(tours, matrix, chunk_size=chunk_size)
+
+        assert np.allclose(result, score_population(tours, matrix))
+
+    def test_score_population_condensed_and_float32(self, population_15):
+        """Test scoring against condensed and single precision matrices."""
+        cities, tours = population_15
+        expected = score_population(tours, build_distance_matrix(cities))
+
+        condensed = score_population(tours, build_distance_matrix(cities, condensed=True))
+        single = score_population(tours, build_distance_matrix(cities, dtype="float32"))
+
+        assert np.allclose(condensed, expected)
+        assert np.allclose(single, expected, rtol=1e-5)
+        assert single.dtype == np.float64
+
+    def test_score_population_empty(self, sample_coordinates):
+        """Test that an empty population returns an empty array."""
+        matrix = build_distance_matrix(sample_coordinates)
+
+        result = score_population(np.empty((0, 4), dtype=int), matrix)
+
+        assert result.shape == (0,)
+
+    def test_score_population_rejects_bad_input(self, sample_coordinates):
+        """Test that non-2D or non-integer tours are rejected."""
+        matrix = build_distance_matrix(sample_coordinates)
+
+        with pytest.raises(ValueError):
+            score_population(np.arange(4), matrix)
+        with pytest.raises(ValueError):
+            score_population(np.zeros((2, 4)), matrix)
+        with pytest.raises(ValueError):
+            score_population(np.zeros((2, 4), dtype=int), matrix, chunk_size=0)
+
+
+class TestChunkSizeForBudget:
+    """Test cases for the chunk_size_for_budget function."""
+
+    def test_chunk_size_for_budget_fits_budget(self):
+        """Test that the derived chunk respects the budget and is at least one."""
+        assert chunk_size_for_budget(1000, 24_000 * 10) == 10
+        assert chunk_size_for_budget(10**9, 1) == 1
@@ -0,0 +1,175 @@
+"""
+Unit tests for solver progress streaming.
+"""
+
+import asyncio
+import pytest
+import time
+import numpy as np
+from logic.branch_and_bound import iter_branch_and_bound
+from logic.distance_matrix import build_distance_matrix
+from logic.genetic import GeneticResult, iter_genetic_algorithm
+from logic.held_karp import held_karp, iter_held_karp
+from logic.local_search import iter_local_search
+from logic.progress import Progress, SolverStream, exhaust
+from data.cities import cities_locations
+
+
+@pytest.fixture
+def matrix_12():
+    """Provide the distance matrix of the 12-city instance."""
+    return build_distance_matrix(cities_locations[12])
+
+
+def slow_solver(steps: int, delay: float):
+    """Yield one snapshot per step with a pause, then return the step count."""
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        time.sleep(delay)
+        yield Progress(step, np.arange(3), float(steps - step), time.perf_counter() - start)
+    return steps
+
+
+def failing_solver():
+    """Yield once and then raise."""
+    yield Progress(1, np.arange(3), 1.0, 0.0)
+    raise ValueError("solver failed")
+
+
+class TestSolverGenerators:
+    """Test cases for the incremental solver generators."""
+
+    @pytest.mark.parametrize("solver,kwargs", [
+        (iter_held_karp, {}),
+        (iter_branch_and_bound, {"report_interval": 10}),
+        (iter_genetic_algorithm, {"generations": 40, "population_size": 20, "migration_interval": 10, "seed": 0}),
+    ])
+    def test_snapshots_are_monotone_and_end_at_result(self, matrix_12, solver, kwargs):
+        """Test that snapshots never get worse and the last one matches the result."""
+        generator = solver(matrix_12, **kwargs)
+        snapshots = []
+        while True:
+            try:
+                snapshots.append(next(generator))
+            except StopIteration as stop:
+                result = stop.value
+                break
+
+        lengths = [snapshot.length for snapshot in snapshots]
+        assert all(a >= b - 1e-9 for a, b in zip(lengths, lengths[1:]))
+        assert all(a.elapsed <= b.elapsed for a, b in zip(snapshots, snapshots[1:]))
+        final_length = result[1] if isinstance(result, tuple) else result.length
+        assert snapshots[-1].length == pytest.approx(final_length)
+
+    def test_held_karp_final_snapshot_is_optimal(self, matrix_12):
+        """Test that the Held-Karp stream ends at the optimum."""
+        snapshots = list(iter_held_karp(matrix_12))
+
+        assert snapshots[-1].length == pytest.approx(held_karp(matrix_12)[1])
+        assert snapshots[-1].generation == 12
+
+    def test_local_search_reports_moves(self):
+        """Test that local search snapshots count applied moves."""
+        matrix = build_distance_matrix(np.random.default_rng(0).random((300, 2)))
+
+        snapshots = list(iter_local_search(np.arange(300), matrix, report_interval=5))
+
+        assert len(snapshots) > 2
+        assert snapshots[0].generation == 5
+
+    def test_exhaust_returns_generator_value(self):
+        """Test that exhaust returns the generator's return value."""
+        assert exhaust(slow_solver(3, 0.0)) == 3
+
+
+class TestSolverStream:
+    """Test cases for the SolverStream class."""
+
+    def test_thread_stream_iterates_and_returns_result(self, matrix_12):
+        """Test that a threaded stream yields snapshots and the final result."""
+        stream = SolverStream(iter_genetic_algorithm, matrix_12, generations=30, population_size=20,
+                              migration_interval=5, seed=1)
+
+        with stream:
+            snapshots = list(stream)
+            result = stream.result()
+
+        assert isinstance(result, GeneticResult)
+        assert snapshots[-1].length == pytest.approx(result.length)
+        assert stream.done
+
+    def test_latest_never_blocks(self):
+        """Test that latest() returns immediately while the solver runs."""
+        stream = SolverStream(slow_solver, 5, 0.05).start()
+
+        before = time.perf_counter()
+        first = stream.latest()
+        assert time.perf_counter() - before < 0.01
+        assert first is None or first.generation <= 5
+
+        assert stream.result(timeout=5) == 5
+        assert stream.latest().generation == 5
+
+    def test_slow_consumer_skips_snapshots(self):
+        """Test that a consumer slower than the solver only sees the newest snapshots."""
+        stream = SolverStream(slow_solver, 20, 0.005).start()
+
+        seen = []
+        for snapshot in stream:
+            seen.append(snapshot.generation)
+            time.sleep(0.03)
+
+        assert seen[-1] == 20
+        assert len(seen) < 20
+        assert seen == sorted(seen)
+
+    def test_min_interval_throttles_but_keeps_last(self):
+        """Test that throttling keeps the final snapshot."""
+        stream = SolverStream(slow_solver, 10, 0.001, min_interval=10.0).start()
+
+        assert stream.result(timeout=5) == 10
+        assert stream.latest().generation == 10
+
+    def test_stop_interrupts_solver(self):
+        """Test that stop() ends a long run early."""
+        stream = SolverStream(slow_solver, 1000, 0.01).start()
+        time.sleep(0.05)
+
+        stream.stop()
+
+        assert stream.done
+        assert stream.latest().generation < 1000
+
+    def test_errors_are_reraised(self):
+        """Test that solver exceptions reach the consumer."""
+        stream = SolverStream(failing_solver).start()
+
+        with pytest.raises(ValueError):
+            list(stream)
+        with pytest.raises(ValueError):
+            stream.result()
+
+    def test_process_backend(self, matrix_12):
+        """Test that the process backend relays snapshots and the result."""
+        stream = SolverStream(iter_held_karp, matrix_12, backend="process")
+
+        with stream:
+            snapshots = list(stream)
+            _, length = stream.result(timeout=30)
+
+        assert snapshots[-1].length == pytest.approx(length)
+
+    def test_async_iteration(self):
+        """Test that snapshots can be consumed with async for."""
+        async def consume():
+            stream = SolverStream(slow_solver, 5, 0.01).start()
+            return [snapshot.generation async for snapshot in stream]
+
+        generations = asyncio.run(consume())
+
+        assert generations[-1] == 5
+
+    def test_invalid_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            SolverStream(slow_solver, 1, 0.0, backend="gpu")
@@ -0,0 +1,124 @@
+"""
+Unit tests for the spatial index module.
+"""
+
+import pytest
+import numpy as np
+from logic.distance_matrix import build_distance_matrix
+from logic.spatial_index import SpatialIndex
+from data.cities import cities_locations
+
+
+class TestSpatialIndex:
+    """Test cases for the SpatialIndex class."""
+
+    def test_nearest_matches_brute_force(self):
+        """Test k-NN queries against a full distance matrix row."""
+        cities = cities_locations[15]
+        index = SpatialIndex(cities)
+        row = build_distance_matrix(cities)[3]
+
+        distances, indices = index.nearest(cities[3], k=4)
+
+        assert indices.tolist() == np.argsort(row, kind="stable")[:4].tolist()
+        assert np.allclose(distances, np.sort(row)[:4])
+
+    def test_remove_skips_deleted_points(self):
+        """Test that deleted points are never returned."""
+        cities = [(0, 0), (1, 0), (2, 0), (3, 0), (10, 0)]
+        index = SpatialIndex(cities)
+
+        index.remove(0)
+        index.remove(1)
+
+        _, indices = index.nearest((0, 0), k=2)
+        assert indices.tolist() == [2, 3]
+        assert len(index) == 3
+        assert 0 not in index and 2 in index
+
+    def test_remove_triggers_rebuild_and_stays_correct(self):
+        """Test that queries stay exact across many deletions and rebuilds."""
+        points = np.random.default_rng(0).random((300, 2))
+        index = SpatialIndex(points, rebuild_fraction=0.2)
+        alive = np.ones(300, dtype=bool)
+
+        for city in np.random.default_rng(1).permutation(300)[:250]:
+            index.remove(int(city))
+            alive[city] = False
+            _, nearest = index.nearest((0.5, 0.5))
+            distances = np.where(alive, np.hypot(*(points - 0.5).T), np.inf)
+            assert nearest[0] == np.argmin(distances)
+
+    def test_remove_twice_raises(self):
+        """Test that a point cannot be deleted twice."""
+        index = SpatialIndex(cities_locations[5])
+        index.remove(2)
+
+        with pytest.raises(KeyError):
+            index.remove(2)
+
+    def test_nearest_when_exhausted(self):
+        """Test that an empty index returns no results."""
+        index = SpatialIndex([(1, 1)])
+        index.remove(0)
+
+        distances, indices = index.nearest((0, 0), k=3)
+
+        assert distances.size == 0 and indices.size == 0
+        assert index.within((0, 0), 10).size == 0
+
+    def test_within_radius(self):
+        """Test radius queries with and without deletions."""
+        cities = [(0, 0), (1, 0), (0, 2), (5, 5)]
+        index = SpatialIndex(cities)
+
+        assert index.within((0, 0), 2.0).tolist() == [0, 1, 2]
+        index.remove(1)
+        assert index.within((0, 0), 2.0).tolist() == [0, 2]
+
+    def test_k_nearest_lists(self, sample_coordinates):
+        """Test neighbor lists exclude the point itself and deleted points."""
+        index = SpatialIndex(sample_coordinates)
+        index.remove(3)
+
+        lists = index.k_nearest_lists(2)
+
+        assert sorted(lists[0].tolist()) == [1, 2]
+        assert lists[3].tolist() == [-1, -1]
+        assert 3 not in lists
+
+    def test_add_matches_brute_force(self):
+        """Test that queries stay exact while points are added, deleted and folded into the tree."""
+        rng = np.random.default_rng(2)
+        points = list(rng.random((50, 2)))
+        index = SpatialIndex(points)
+        alive = [True] * 50
+
+        for step in range(200):
+            point = rng.random(2)
+            assert index.add(point) == len(points)
+            points.append(point)
+            alive.append(True)
+            if step % 3 == 0:
+                index.remove(step)
+                alive[step] = False
+            distances = np.where(alive, np.hypot(*(np.array(points) - 0.5).T), np.inf)
+            _, nearest = index.nearest((0.5, 0.5), k=3)
+            assert nearest.tolist() == np.argsort(distances, kind="stable")[:3].tolist()
+        assert len(index) == sum(alive)
+        assert index.within((0.5, 0.5), 0.2).tolist() == np.flatnonzero(distances <= 0.2).tolist()
+
+    def test_add_to_empty_index(self):
+        """Test adding points to an index built without any."""
+        index = SpatialIndex([])
+
+        index.add((3, 4))
+        index.add((0, 1))
+
+        assert index.nearest((0, 0), k=5)[1].tolist() == [1, 0]
+        assert index.k_nearest_lists(1).tolist() == [[1], [0]]
+
+    def test_invalid_rebuild_fraction(self, sample_coordinates):
+        """Test that the rebuild fraction must be in (0, 1]."""
+        with pytest.raises(ValueError):
+            SpatialIndex(sample_coordinates, rebuild_fraction=0)
@@ -2,8 +2,13 @@
 Tests for the main module functionality.
 """
 
+import json
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
-from main import main
+from main import main, run_batch, solve_instance
 
 
 def test_main_function_output(capsys, expected_welcome_message):
@@ -37,4 +42,86 @@ class TestMainModule:
     def test_main_function_returns_none(self):
         """Test that the main function returns None (as expected for a main function)."""
         result = main()
-        assert result is None 
\ No newline at end of file
+        assert result is None 
+
+class TestCommandLine:
+    """Test cases for the headless batch solver."""
+
+    def test_solves_instances_as_json_lines(self, capsys):
+        """Test that every instance and seed gets one JSON record on standard output."""
+        main(["bundled:5", "bundled:10", "--solver", "held_karp", "--seed", "1", "2", "--workers", "1", "--tour"])
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert len(records) == 4
+        assert {(record["instance"], record["seed"]) for record in records} == {
+            ("bundled-5", 1), ("bundled-5", 2), ("bundled-10", 1), ("bundled-10", 2)}
+        for record in records:
+            assert sorted(record["tour"]) == list(range(record["n"]))
+            assert record["length"] > 0
+
+    def test_process_pool_matches_in_process(self):
+        """Test that solving across a process pool gives the same records as solving in-process."""
+        specs = ["bundled:10", "bundled:12"]
+
+        pooled = sorted(run_batch(specs, "held_karp", workers=2), key=lambda record: record["spec"])
+        local = sorted(run_batch(specs, "held_karp", workers=1), key=lambda record: record["spec"])
+
+        assert [record["length"] for record in pooled] == pytest.approx([record["length"] for record in local])
+
+    def test_time_limit_stops_solver(self):
+        """Test that a solver is stopped at the first snapshot past the time limit."""
+        record = solve_instance(("bundled:15", "genetic", 0.0, 0, False, None, None, False))
+
+        assert record["stopped"]
+        assert record["length"] > 0
+
+    def test_bad_instance_is_reported(self, capsys):
+        """Test that a missing file yields an error record and a failing exit status."""
+        with pytest.raises(SystemExit) as exit_info:
+            main(["missing.tsp", "--workers", "1"])
+
+        record = json.loads(capsys.readouterr().out)
+        assert exit_info.value.code == 1
+        assert record["error"].startswith("FileNotFoundError")
+
+    def test_cache_returns_repeated_requests(self, tmp_path):
+        """Test that a repeated request is answered from the solution cache with the same tour."""
+        options = dict(solver="local_search", seeds=[0], workers=1, include_tour=True, cache_dir=tmp_path)
+
+        first, = run_batch(["bundled:15"], **options)
+        second, = run_batch(["bundled:15"], **options)
+
+        assert not first["cached"] and second["cached"]
+        assert second["tour"] == first["tour"]
+        assert second["length"] == pytest.approx(first["length"])
+
+    def test_stats_and_metrics(self, tmp_path, capsys):
+        """Test that --metrics adds solver counters to each record and writes them as Prometheus text."""
+        metrics = tmp_path / "metrics.prom"
+
+        main(["bundled:15", "--solver", "lin_kernighan", "--seed", "0", "--workers", "1", "--metrics", str(metrics)])
+
+        record = json.loads(capsys.readouterr().out)
+        assert record["stats"]["counters"]["distance_evaluations"] > 0
+        assert "descent" in record["stats"]["phases"]
+        text = metrics.read_text()
+        assert "# TYPE tsp_distance_evaluations_total counter" in text
+        assert 'solver="lin_kernighan"' in text and 'instance="bundled:15"' in text
+
+    def test_bound_adds_proven_gap(self):
+        """Test that --bound adds a lower bound at or below the tour length."""
+        record, = run_batch(["bundled:10"], "lin_kernighan", seeds=[0], workers=1, bound=True)
+
+        assert record["lower_bound"] <= record["length"] + 1e-9
+        assert record["gap"] == pytest.approx(0.0, abs=1e-9)
+
+    def test_startup_skips_display_libraries(self):
+        """Test that a batch run never imports pygame or Matplotlib."""
+        script = ("import sys, main; main.main(['bundled:5', '--workers', '1']); "
+                  "assert 'pygame' not in sys.modules and 'matplotlib' not in sys.modules")
+        source = Path(__file__).resolve().parents[1] / "src"
+
+        result = subprocess.run([sys.executable, "-c", script], cwd=source, capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["n"] == 5